@@ -143,6 +143,9 @@ class AIArchitect:
             # Phase 6: Notification
             self._notify_complete(synthesis)
 
+            # Synthesis is stored in the background; make sure it landed
+            self.synthesizer.flush()
+
             # Phase 7: Email Report (if enabled)
             self._send_email_report()
 
@@ -255,6 +258,11 @@ class AIArchitect:
         log.info("analyzing_items", count=len(items))
         results = self.analyzer.analyze_batch(items)
 
+        # Stored items are no longer novel on later runs. Fallback analyses
+        # are never stored, so those items stay novel and get retried
+        stored = self.analyzer.take_stored_ids()
+        self.novelty_detector.remember([item for item, _ in results if item.id in stored])
+
         self.metrics.items_analyzed = sum(1 for _, r in results if r is not None)
         self.metrics.analysis_errors = sum(1 for _, r in results if r is None)
 
@@ -5,7 +5,9 @@ Generates and sends HTML email reports from ChromaDB data.
 Content is translated to Spanish before sending.
 """
 
+import asyncio
 import os
+import re
 import smtplib
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -14,6 +16,7 @@ from email.mime.text import MIMEText
 from pathlib import Path
 from typing import Any
 
+import aiosmtplib
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from ..processors.claude_client import ClaudeClient, ClaudeModel
@@ -23,6 +26,77 @@ from ..utils.logger import get_logger
 
 log = get_logger("notifications.email_reporter")
 
+_DEFAULT_TEMPLATE_DIR = Path(__file__).parent / "templates"
+_AUTOESCAPE = select_autoescape(["html", "xml"])
+
+# Shared Jinja environment for the bundled templates (built on first use)
+_ENV: Environment | None = None
+
+# Max translation requests in flight at once (keeps us under API rate limits)
+DEFAULT_TRANSLATION_CONCURRENCY = 5
+
+# Static translation instructions, sent as the system prompt so only the
+# text to translate varies between requests. Not marked for prompt caching:
+# at ~60 tokens it is far below the minimum cacheable prefix (1024 tokens)
+SPANISH_TRANSLATION_SYSTEM = """Traduce el siguiente texto al español. Mantén el tono técnico y profesional.
+El mensaje del usuario indica el contexto del texto y el texto a traducir.
+
+Responde SOLO con la traducción en español, sin explicaciones adicionales."""
+
+# Common Spanish function words. Ambiguous ones that also show up in English
+# text ("a", "no", "me") are left out to avoid false positives.
+_ES_STOPWORDS = frozenset({
+    "el", "la", "los", "las", "un", "una", "unos", "unas", "de", "del", "al",
+    "que", "y", "en", "para", "con", "por", "es", "son", "se", "su", "sus",
+    "lo", "como", "más", "pero", "este", "esta", "estos", "estas", "ese",
+    "esa", "entre", "sobre", "también", "sin", "muy", "ya", "hay", "está",
+    "están", "puede", "pueden", "cuando", "donde", "porque", "desde", "hasta",
+})
+_ES_STOPWORD_RATIO = 0.15
+_WORD_RE = re.compile(r"\w+")
+
+
+def _looks_spanish(text: str) -> bool:
+    """
+    Cheap check for text that is already Spanish.
+
+    Counts Spanish stopwords; ordinary Spanish prose is well above the
+    threshold while English technical text stays near zero.
+    """
+    tokens = _WORD_RE.findall(text.lower())
+    if not tokens:
+        return False
+
+    hits = sum(1 for token in tokens if token in _ES_STOPWORDS)
+    return hits / len(tokens) > _ES_STOPWORD_RATIO
+
+
+def _build_env(template_dir: Path) -> Environment:
+    """Build a Jinja environment for a template directory."""
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=_AUTOESCAPE,
+        # Templates ship with the code; skip per-render mtime checks
+        auto_reload=False,
+    )
+
+
+def _get_template_env(template_dir: Path) -> Environment:
+    """
+    Get the Jinja environment for a template directory.
+
+    The bundled templates share one module-level environment (and its
+    compiled-template cache). A custom `template_dir` gets its own
+    environment on every call; that path is only used by tests/tools.
+    """
+    global _ENV
+    if template_dir != _DEFAULT_TEMPLATE_DIR:
+        return _build_env(template_dir)
+
+    if _ENV is None:
+        _ENV = _build_env(_DEFAULT_TEMPLATE_DIR)
+    return _ENV
+
 
 @dataclass
 class AnalyzedItem:
@@ -77,13 +151,10 @@ class EmailReporter:
 
         # Template setup
         if template_dir is None:
-            template_dir = Path(__file__).parent / "templates"
+            template_dir = _DEFAULT_TEMPLATE_DIR
         self.template_dir = Path(template_dir)
 
-        self.env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
+        self.env = _get_template_env(self.template_dir)
 
         # Vector store for data fetching
         self.vector_store = VectorStore(persist_directory=persist_directory)
@@ -182,6 +253,15 @@ class EmailReporter:
             log.error("fetch_content_failed", error=str(e)[:200])
             return None
 
+    async def fetch_content_async(self, days: int = 1) -> EmailContent | None:
+        """
+        Async variant of `fetch_content`.
+
+        ChromaDB has no async API, so the lookup runs in a worker thread
+        to keep the event loop free.
+        """
+        return await asyncio.to_thread(self.fetch_content, days)
+
     def _parse_analysis_item(self, doc: str, meta: dict[str, Any]) -> AnalyzedItem:
         """Parse analysis document into AnalyzedItem."""
         return AnalyzedItem(
@@ -239,22 +319,100 @@ class EmailReporter:
             items=translated_items,
         )
 
+    async def translate_to_spanish_async(
+        self,
+        content: EmailContent,
+        concurrency: int = DEFAULT_TRANSLATION_CONCURRENCY,
+    ) -> EmailContent:
+        """
+        Translate email content to Spanish with concurrent API requests.
+
+        Same output as `translate_to_spanish`, but every text is sent at
+        once (bounded by `concurrency`) instead of one after another.
+
+        Args:
+            content: Original content in English
+            concurrency: Maximum translation requests in flight
+
+        Returns:
+            New EmailContent with translated fields
+        """
+        log.info("translating_to_spanish_async", concurrency=concurrency)
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def translate(text: str, context: str) -> str:
+            async with semaphore:
+                return await self._translate_text_async(text, context)
+
+        jobs: list[tuple[str, str]] = [(content.summary, "resumen ejecutivo")]
+        jobs.extend((h, "punto destacado") for h in content.highlights)
+        jobs.extend((p, "patrón detectado") for p in content.patterns)
+        for item in content.items:
+            jobs.append((item.summary, "resumen de item"))
+            jobs.extend((insight, "insight clave") for insight in item.key_insights)
+
+        results = iter(await asyncio.gather(*[translate(t, c) for t, c in jobs]))
+
+        # Results come back in job order; consume them in the same order
+        translated_summary = next(results)
+        translated_highlights = [next(results) for _ in content.highlights]
+        translated_patterns = [next(results) for _ in content.patterns]
+
+        translated_items = []
+        for item in content.items:
+            item_summary = next(results)
+            item_insights = [next(results) for _ in item.key_insights]
+            translated_items.append(
+                self._with_translation(item, item_summary, item_insights)
+            )
+
+        return EmailContent(
+            date=content.date,
+            relevance_score=content.relevance_score,
+            summary=translated_summary,
+            highlights=translated_highlights,
+            patterns=translated_patterns,
+            items=translated_items,
+        )
+
+    @staticmethod
+    def _translation_prompt(text: str, context: str) -> str:
+        """Build the per-text user turn (instructions live in the system prompt)."""
+        return f"Contexto: {context}\n\nTexto:\n{text}"
+
     def _translate_text(self, text: str, context: str = "") -> str:
         """Translate a single text to Spanish."""
-        if not text:
+        if not text or _looks_spanish(text):
             return text
 
-        prompt = f"""Traduce el siguiente texto al español. Mantén el tono técnico y profesional.
-Contexto: {context}
+        prompt = self._translation_prompt(text, context)
+
+        try:
+            translated = self.claude.complete_text(
+                prompt,
+                system=SPANISH_TRANSLATION_SYSTEM,
+                max_tokens=1000,
+            )
+            return translated.strip()
+        except Exception as e:
+            log.warning("translation_failed", context=context, error=str(e)[:100])
+            return text  # Return original on failure
 
-Texto a traducir:
-{text}
+    async def _translate_text_async(self, text: str, context: str = "") -> str:
+        """Translate a single text to Spanish on the async client."""
+        if not text or _looks_spanish(text):
+            return text
 
-Responde SOLO con la traducción en español, sin explicaciones adicionales."""
+        prompt = self._translation_prompt(text, context)
 
         try:
-            response = self.claude.complete(prompt, max_tokens=1000)
-            return response.content.strip()
+            translated = await self.claude.complete_text_async(
+                prompt,
+                system=SPANISH_TRANSLATION_SYSTEM,
+                max_tokens=1000,
+            )
+            return translated.strip()
         except Exception as e:
             log.warning("translation_failed", context=context, error=str(e)[:100])
             return text  # Return original on failure
@@ -269,12 +427,21 @@ Responde SOLO con la traducción en español, sin explicaciones adicionales."""
                 self._translate_text(insight, "insight clave")
             )
 
+        return self._with_translation(item, translated_summary, translated_insights)
+
+    @staticmethod
+    def _with_translation(
+        item: AnalyzedItem,
+        summary: str,
+        key_insights: list[str],
+    ) -> AnalyzedItem:
+        """Copy an AnalyzedItem with translated summary and insights."""
         return AnalyzedItem(
             title=item.title,  # Keep original title
             source=item.source,
             signal_score=item.signal_score,
-            summary=translated_summary,
-            key_insights=translated_insights,
+            summary=summary,
+            key_insights=key_insights,
             technical_details=item.technical_details,
             relevance_to_claude=item.relevance_to_claude,
             actionability=item.actionability,
@@ -323,9 +490,113 @@ Responde SOLO con la traducción en español, sin explicaciones adicionales."""
         Returns:
             True if sent successfully
         """
+        prepared = self._prepare_message(html_content, recipients, subject)
+        if prepared is None:
+            return False
+
+        msg, from_addr, to_addresses, (smtp_user, smtp_password) = prepared
+
+        # Send
+        try:
+            with smtplib.SMTP(
+                self.email_config.smtp_host,
+                self.email_config.smtp_port,
+            ) as server:
+                if self.email_config.use_tls:
+                    server.starttls()
+
+                server.login(smtp_user, smtp_password)
+                # send_message serializes the MIME tree itself (no
+                # intermediate str copy of the whole report)
+                server.send_message(msg, from_addr=from_addr, to_addrs=to_addresses)
+
+            log.info(
+                "email_sent",
+                recipients=to_addresses,
+                subject=msg["Subject"],
+            )
+            return True
+
+        except smtplib.SMTPException as e:
+            log.error("smtp_error", error=str(e)[:200])
+            return False
+        except Exception as e:
+            log.error("email_send_failed", error=str(e)[:200])
+            return False
+
+    async def send_email_async(
+        self,
+        html_content: str,
+        recipients: list[str] | None = None,
+        subject: str | None = None,
+    ) -> bool:
+        """
+        Send HTML email via SMTP without blocking the event loop.
+
+        Args:
+            html_content: HTML content to send
+            recipients: Override recipients (optional)
+            subject: Override subject line (optional)
+
+        Returns:
+            True if sent successfully
+        """
+        prepared = self._prepare_message(html_content, recipients, subject)
+        if prepared is None:
+            return False
+
+        msg, from_addr, to_addresses, (smtp_user, smtp_password) = prepared
+
+        # STARTTLS is issued explicitly below, mirroring the sync path
+        smtp = aiosmtplib.SMTP(
+            hostname=self.email_config.smtp_host,
+            port=self.email_config.smtp_port,
+            use_tls=False,
+            start_tls=False,
+        )
+
+        try:
+            await smtp.connect()
+            try:
+                if self.email_config.use_tls:
+                    await smtp.starttls()
+
+                await smtp.login(smtp_user, smtp_password)
+                await smtp.send_message(msg, sender=from_addr, recipients=to_addresses)
+            finally:
+                if smtp.is_connected:
+                    await smtp.quit()
+
+            log.info(
+                "email_sent",
+                recipients=to_addresses,
+                subject=msg["Subject"],
+            )
+            return True
+
+        except aiosmtplib.SMTPException as e:
+            log.error("smtp_error", error=str(e)[:200])
+            return False
+        except Exception as e:
+            log.error("email_send_failed", error=str(e)[:200])
+            return False
+
+    def _prepare_message(
+        self,
+        html_content: str,
+        recipients: list[str] | None,
+        subject: str | None,
+    ) -> tuple[MIMEMultipart, str, list[str], tuple[str, str]] | None:
+        """
+        Resolve credentials and recipients and build the MIME message.
+
+        Returns:
+            (message, from_addr, to_addresses, (smtp_user, smtp_password)),
+            or None if email is disabled or misconfigured
+        """
         if not self.email_config.enabled:
             log.info("email_disabled")
-            return False
+            return None
 
         # Get credentials
         smtp_user = self.settings.smtp_user or os.environ.get("SMTP_USER", "")
@@ -333,13 +604,13 @@ Responde SOLO con la traducción en español, sin explicaciones adicionales."""
 
         if not smtp_user or not smtp_password:
             log.error("smtp_credentials_missing")
-            return False
+            return None
 
         # Get recipients
         to_addresses = recipients or self.email_config.recipients
         if not to_addresses:
             log.error("no_recipients_configured")
-            return False
+            return None
 
         # Build message
         from_addr = self.email_config.from_address or smtp_user
@@ -354,31 +625,7 @@ Responde SOLO con la traducción en español, sin explicaciones adicionales."""
         html_part = MIMEText(html_content, "html", "utf-8")
         msg.attach(html_part)
 
-        # Send
-        try:
-            with smtplib.SMTP(
-                self.email_config.smtp_host,
-                self.email_config.smtp_port,
-            ) as server:
-                if self.email_config.use_tls:
-                    server.starttls()
-
-                server.login(smtp_user, smtp_password)
-                server.sendmail(from_addr, to_addresses, msg.as_string())
-
-            log.info(
-                "email_sent",
-                recipients=to_addresses,
-                subject=msg["Subject"],
-            )
-            return True
-
-        except smtplib.SMTPException as e:
-            log.error("smtp_error", error=str(e)[:200])
-            return False
-        except Exception as e:
-            log.error("email_send_failed", error=str(e)[:200])
-            return False
+        return msg, from_addr, to_addresses, (smtp_user, smtp_password)
 
     def preview(self, content: EmailContent, output_dir: Path | str = "output/email_preview") -> Path:
         """
@@ -398,7 +645,8 @@ Responde SOLO con la traducción en español, sin explicaciones adicionales."""
         filename = f"preview_{content.date.replace('-', '')}.html"
         file_path = output_path / filename
 
-        file_path.write_text(html, encoding="utf-8")
+        with file_path.open("wb") as f:
+            f.write(html.encode("utf-8"))
 
         log.info("preview_generated", path=str(file_path))
         return file_path
@@ -459,6 +707,9 @@ Responde SOLO con la traducción en español, sin explicaciones adicionales."""
         """
         Full workflow: fetch, translate, render, and send daily report.
 
+        Synchronous entry point; runs `send_daily_report_async` on a
+        fresh event loop.
+
         Args:
             days: Days to look back
             recipients: Override recipients
@@ -467,22 +718,53 @@ Responde SOLO con la traducción en español, sin explicaciones adicionales."""
         Returns:
             True if successful
         """
-        # Fetch
-        content = self.fetch_content(days=days)
-        if not content:
-            log.warning("no_content_to_send")
-            return False
+        return asyncio.run(
+            self.send_daily_report_async(
+                days=days,
+                recipients=recipients,
+                preview_only=preview_only,
+            )
+        )
 
-        # Translate
-        translated = self.translate_to_spanish(content)
+    async def send_daily_report_async(
+        self,
+        days: int = 1,
+        recipients: list[str] | None = None,
+        preview_only: bool = False,
+    ) -> bool:
+        """
+        Async workflow: fetch, translate, render, and send daily report.
 
-        # Render
-        html = self.render_html(translated)
+        Translations run concurrently and SMTP is non-blocking.
 
-        # Preview or send
-        if preview_only:
-            path = self.preview(translated)
-            print(f"Preview saved to: {path}")
-            return True
+        Args:
+            days: Days to look back
+            recipients: Override recipients
+            preview_only: If True, only generate preview
 
-        return self.send_email(html, recipients=recipients)
+        Returns:
+            True if successful
+        """
+        try:
+            # Fetch
+            content = await self.fetch_content_async(days=days)
+            if not content:
+                log.warning("no_content_to_send")
+                return False
+
+            # Translate
+            translated = await self.translate_to_spanish_async(content)
+
+            # Preview or send
+            if preview_only:
+                path = self.preview(translated)
+                print(f"Preview saved to: {path}")
+                return True
+
+            # Render
+            html = self.render_html(translated)
+
+            return await self.send_email_async(html, recipients=recipients)
+        finally:
+            # The async client is tied to this event loop
+            await self.claude.aclose()
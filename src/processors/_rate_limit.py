@@ -0,0 +1,104 @@
+"""
+AI Architect v2 - Rate Limiting
+
+Token-bucket rate limiter shared by every caller of the same provider
+and model, so concurrent workers pace themselves against one budget.
+"""
+
+import threading
+import time
+
+from ..utils.logger import get_logger
+
+log = get_logger("processor.rate_limit")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate_per_sec` up to `capacity`. Callers
+    reserve tokens under a lock and then sleep outside it, so waiting
+    callers are served in arrival order and never hold the lock while
+    sleeping.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float = 1.0):
+        if rate_per_sec <= 0:
+            raise ValueError("rate_per_sec must be positive")
+        self.rate_per_sec = rate_per_sec
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, cost: float) -> float:
+        """Take `cost` tokens (possibly going into debt); return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_sec)
+            self._updated = now
+            self._tokens -= cost
+            return max(0.0, -self._tokens / self.rate_per_sec)
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Block until `cost` tokens are available.
+
+        Args:
+            cost: Tokens to take (1 per request)
+
+        Returns:
+            Seconds spent waiting
+        """
+        delay = self._reserve(cost)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+_buckets: dict[tuple[str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(
+    provider: str,
+    model: str,
+    requests_per_minute: float,
+    burst: float = 1.0,
+) -> TokenBucket:
+    """
+    Get the shared bucket for a provider and model.
+
+    The first call for a (provider, model) pair fixes its rate and burst;
+    later calls get the same bucket.
+
+    Args:
+        provider: Provider identifier (e.g. API base URL)
+        model: Model name
+        requests_per_minute: Sustained request rate
+        burst: Requests allowed back to back when the bucket is full
+
+    Returns:
+        Shared TokenBucket
+    """
+    key = (provider, model)
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(requests_per_minute / 60.0, burst)
+            _buckets[key] = bucket
+            log.debug(
+                "rate_limit_bucket_created",
+                provider=provider,
+                model=model,
+                requests_per_minute=requests_per_minute,
+                burst=burst,
+            )
+        return bucket
+
+
+def reset_buckets() -> None:
+    """Drop shared buckets (e.g. after config changes)."""
+    with _buckets_lock:
+        _buckets.clear()
@@ -4,9 +4,18 @@ AI Architect v2 - Item Analyzer
 Performs deep analysis of individual items using Claude Sonnet.
 """
 
+import asyncio
+import hashlib
+import json
+import sqlite3
+import string
+import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any
 
 from .client_factory import get_analysis_client
@@ -20,8 +29,29 @@ log = get_logger("processor.analyzer")
 # Default delay between API calls to avoid rate limits (seconds)
 DEFAULT_REQUEST_DELAY = 5.0
 
+# Content budget per item in the prompt, in (approximate) tokens
+MAX_CONTENT_TOKENS = 1000
 
-@dataclass
+# Rough characters-per-token ratio for English prose
+_CHARS_PER_TOKEN = 4
+
+# Buffered vector store writes are flushed once this many are pending
+STORE_FLUSH_SIZE = 64
+
+# Persistent cache of analyses keyed by model + prompt version + content hash
+ANALYSIS_CACHE_PATH = Path("data/analysis_cache.db")
+
+# Cached analyses expire after this many seconds
+ANALYSIS_CACHE_TTL = 7 * 86400
+
+# Most recent analyses also kept in memory, in front of SQLite
+ANALYSIS_MEMORY_CACHE_SIZE = 1024
+
+# Bump when ANALYSIS_PROMPT or result parsing change so stale analyses are not reused
+ANALYSIS_PROMPT_VERSION = "v1"
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of item analysis."""
     item_id: str
@@ -67,6 +97,226 @@ Focus on:
 Respond with JSON only, no markdown.
 """
 
+# ANALYSIS_PROMPT pre-split into (literal, field_name) pairs so rendering
+# doesn't re-scan the template's brace syntax for every item
+_ANALYSIS_SEGMENTS = [
+    (literal, field_name)
+    for literal, field_name, _, _ in string.Formatter().parse(ANALYSIS_PROMPT)
+]
+
+
+def _render_prompt(**fields: Any) -> str:
+    """Render ANALYSIS_PROMPT from its pre-split segments."""
+    return "".join(
+        literal + (str(fields[name]) if name else "")
+        for literal, name in _ANALYSIS_SEGMENTS
+    )
+
+# Batch analysis prompt: several items per request, answered as a JSON array
+BATCH_ANALYSIS_PROMPT = """Analyze these {count} items from the AI/Claude ecosystem and provide a structured analysis of each.
+
+**Items (JSON):**
+{items}
+
+Return a JSON array with exactly one object per item, in any order, each with this structure:
+{{
+  "id": "the item's id, copied exactly",
+  "summary": "One paragraph summary (2-3 sentences)",
+  "key_insights": [
+    "Insight 1",
+    "Insight 2",
+    "Insight 3"
+  ],
+  "technical_details": "Any technical specifics worth noting (or null if none)",
+  "relevance_to_claude": "How this relates to Claude/Anthropic specifically",
+  "actionability": "high|medium|low - how actionable is this information",
+  "related_topics": ["topic1", "topic2"],
+  "confidence": 0.0-1.0
+}}
+
+Focus on:
+1. What's actually new or changed
+2. Practical implications for developers using Claude
+3. Connection to broader AI ecosystem trends
+
+Respond with the JSON array only, no markdown.
+"""
+
+
+def _clip01(x: float) -> float:
+    """Clamp a value to [0, 1]."""
+    return 0.0 if x < 0.0 else (1.0 if x > 1.0 else x)
+
+
+def _copy_result(result: AnalysisResult) -> AnalysisResult:
+    """Copy a result, including its lists, so cached entries aren't shared."""
+    return replace(
+        result,
+        key_insights=list(result.key_insights),
+        related_topics=list(result.related_topics),
+    )
+
+
+def _truncate_for_prompt(content: str, max_tokens: int = MAX_CONTENT_TOKENS) -> str:
+    """
+    Trim item content to roughly `max_tokens` tokens.
+
+    Short content is returned as-is (no copy). Long content is cut at the
+    last space before the limit so no word is split mid-token.
+    """
+    limit = max_tokens * _CHARS_PER_TOKEN
+    if len(content) <= limit:
+        return content
+
+    cut = content.rfind(" ", max(0, limit - 100), limit)
+    return content[:cut if cut > 0 else limit]
+
+
+class _AnalysisCache:
+    """
+    Exact-match cache of analysis results, persisted in SQLite.
+
+    Keys hash the model name, the prompt version and the (truncated)
+    content that goes into the prompt, so re-runs and duplicate items skip
+    the API call. Entries expire after `ttl` seconds. The most recent
+    `memory_size` entries are also held in an in-memory LRU. Callers get
+    copies, never the cached objects. Safe to use from worker threads.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        ttl: float = ANALYSIS_CACHE_TTL,
+        memory_size: int = ANALYSIS_MEMORY_CACHE_SIZE,
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.memory_size = memory_size
+        # key -> (created_at, result), least recently used first
+        self._memory: OrderedDict[str, tuple[float, AnalysisResult]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @staticmethod
+    def key(model: str, content: str) -> str:
+        """Build the cache key for a model and prompt content."""
+        payload = f"{ANALYSIS_PROMPT_VERSION}|{model}|{content}"
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Lazy open the database (caller holds the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(analysis_cache)")}
+            if columns and "created_at" not in columns:
+                # Pre-TTL schema; its unversioned keys can never hit again
+                self._conn.execute("DROP TABLE analysis_cache")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS analysis_cache "
+                "(key TEXT PRIMARY KEY, json TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> AnalysisResult | None:
+        """Return the cached result for a key, if present and fresh."""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                if cached[0] > cutoff:
+                    self._memory.move_to_end(key)
+                    return _copy_result(cached[1])
+                del self._memory[key]
+
+            try:
+                conn = self._connection()
+                row = conn.execute(
+                    "SELECT json, created_at FROM analysis_cache WHERE key = ? AND created_at > ?",
+                    (key, cutoff),
+                ).fetchone()
+            except sqlite3.Error as e:
+                log.warning("analysis_cache_read_failed", error=str(e)[:200])
+                return None
+
+            if row is None:
+                return None
+
+            try:
+                result = AnalysisResult(**json.loads(row[0]))
+            except (TypeError, ValueError) as e:
+                # Corrupt row, or written before an AnalysisResult field changed
+                log.warning("analysis_cache_read_failed", error=str(e)[:200])
+                try:
+                    conn.execute("DELETE FROM analysis_cache WHERE key = ?", (key,))
+                    conn.commit()
+                except sqlite3.Error:
+                    pass
+                return None
+
+            self._remember(key, row[1], result)
+            return _copy_result(result)
+
+    def put(self, key: str, result: AnalysisResult) -> None:
+        """Store a copy of a result under a key."""
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, created_at, _copy_result(result))
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO analysis_cache (key, json, created_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(asdict(result), ensure_ascii=False), created_at),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                log.warning("analysis_cache_write_failed", error=str(e)[:200])
+
+    def _remember(self, key: str, created_at: float, result: AnalysisResult) -> None:
+        """Add an entry to the in-memory LRU (caller holds the lock)."""
+        self._memory[key] = (created_at, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+
+class _RequestPacer:
+    """
+    Spaces out request starts by a minimum interval.
+
+    Replaces sleeping between sequential calls: requests still start at
+    most once per `interval`, but their latencies overlap. Slots are
+    reserved under a thread lock, so one pacer works for both threads
+    (`wait_sync`) and coroutines (`wait`).
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def _reserve(self) -> float:
+        """Reserve the next start slot; return seconds to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+            return start - now
+
+    async def wait(self) -> None:
+        """Wait for the next free start slot."""
+        if self.interval > 0:
+            delay = self._reserve()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+    def wait_sync(self) -> None:
+        """Blocking variant of `wait` for worker threads."""
+        if self.interval > 0:
+            delay = self._reserve()
+            if delay > 0:
+                time.sleep(delay)
+
 
 class Analyzer:
     """
@@ -80,6 +330,8 @@ class Analyzer:
         client: None = None,
         store_results: bool = True,
         request_delay: float | None = None,
+        concurrency: int | None = None,
+        cache_path: Path | str | None = ANALYSIS_CACHE_PATH,
     ):
         """
         Initialize analyzer.
@@ -87,14 +339,105 @@ class Analyzer:
         Args:
             client: Claude client (uses default analysis client if None)
             store_results: Whether to store analysis in vector store
-            request_delay: Delay between API calls in seconds (to avoid rate limits).
-                          Defaults to config.thresholds.request_delay
+            request_delay: Minimum delay between API request starts in seconds
+                          (to avoid rate limits). Defaults to config.thresholds.request_delay
+            concurrency: Maximum requests in flight during batch analysis.
+                        Defaults to config.thresholds.analysis_concurrency
+            cache_path: SQLite file for the analysis cache (None disables caching)
         """
         self.client = client or get_analysis_client()
         self.store_results = store_results
         config = get_config()
         self.request_delay = request_delay if request_delay is not None else config.thresholds.request_delay
+        self.concurrency = concurrency if concurrency is not None else config.thresholds.analysis_concurrency
         self._vector_store = None
+        self._cache = _AnalysisCache(cache_path) if cache_path is not None else None
+
+        # Write buffer: collection -> {id: (document, metadata)}. Only used
+        # while buffering (inside batch methods or a `with analyzer:` block)
+        self._pending: dict[str, dict[str, tuple[str, dict[str, Any]]]] = {}
+        self._pending_count = 0
+        self._pending_lock = threading.Lock()
+        self._buffering = 0
+        # Ids of items whose analysis reached the vector store; see take_stored_ids
+        self._stored_ids: set[str] = set()
+
+    def __enter__(self) -> "Analyzer":
+        """Buffer vector store writes until the block exits."""
+        self._buffering += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._buffering -= 1
+        if not self._buffering:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered items and analyses to the vector store."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            self._pending_count = 0
+
+        for collection, entries in pending.items():
+            if not entries:
+                continue
+            try:
+                self.vector_store.add(
+                    collection=collection,
+                    documents=[doc for doc, _ in entries.values()],
+                    ids=list(entries),
+                    metadatas=[meta for _, meta in entries.values()],
+                )
+                self._mark_stored(collection, [meta for _, meta in entries.values()])
+                log.debug("storage_flushed", collection=collection, count=len(entries))
+            except Exception as e:
+                log.warning("storage_flush_failed", collection=collection, count=len(entries), error=str(e)[:200])
+
+    def _add_document(
+        self,
+        collection: str,
+        document: str,
+        doc_id: str,
+        metadata: dict[str, Any],
+    ) -> None:
+        """Add one document, via the write buffer when buffering."""
+        if not self._buffering:
+            self.vector_store.add(
+                collection=collection,
+                documents=[document],
+                ids=[doc_id],
+                metadatas=[metadata],
+            )
+            self._mark_stored(collection, [metadata])
+            return
+
+        with self._pending_lock:
+            entries = self._pending.setdefault(collection, {})
+            if doc_id not in entries:
+                self._pending_count += 1
+            entries[doc_id] = (document, metadata)
+            full = self._pending_count >= STORE_FLUSH_SIZE
+
+        if full:
+            self.flush()
+
+    def _mark_stored(self, collection: str, metadatas: list[dict[str, Any]]) -> None:
+        """Record items whose analysis documents were written."""
+        if collection != "analysis":
+            return
+        with self._pending_lock:
+            self._stored_ids.update(meta["item_id"] for meta in metadatas)
+
+    def take_stored_ids(self) -> set[str]:
+        """
+        Return ids of items whose analysis was stored since the last call.
+
+        Fallback analyses (API errors, missing JSON) are never stored, so
+        they are not included. Flush buffered writes first.
+        """
+        with self._pending_lock:
+            stored, self._stored_ids = self._stored_ids, set()
+        return stored
 
     @property
     def vector_store(self):
@@ -108,12 +451,43 @@ class Analyzer:
         """Return True if this item already has an analysis stored in ChromaDB."""
         return self.vector_store.exists("analysis", f"analysis_{item_id}")
 
-    def analyze(self, item: CollectedItem) -> AnalysisResult | None:
+    def _cache_key(self, item: CollectedItem) -> str:
+        """Cache key for an item's analysis."""
+        model = getattr(self.client, "model", "")
+        return _AnalysisCache.key(getattr(model, "value", str(model)), _truncate_for_prompt(item.content))
+
+    def _from_cache(self, item: CollectedItem) -> AnalysisResult | None:
+        """
+        Return a cached analysis for identical content, if any.
+
+        The cached result is re-keyed to this item and stored like a fresh
+        analysis so downstream consumers see it.
+        """
+        if self._cache is None:
+            return None
+
+        cached = self._cache.get(self._cache_key(item))
+        if cached is None:
+            return None
+
+        result = replace(cached, item_id=item.id)
+        if self.store_results:
+            self._store_analysis(item, result)
+
+        log.info("analysis_cache_hit", item_id=item.id)
+        return result
+
+    def analyze(
+        self,
+        item: CollectedItem,
+        pacer: _RequestPacer | None = None,
+    ) -> AnalysisResult | None:
         """
         Analyze a single item.
 
         Args:
             item: Item to analyze
+            pacer: Optional pacer that spaces out API request starts
 
         Returns:
             AnalysisResult or None if analysis fails or item already analyzed
@@ -122,14 +496,16 @@ class Analyzer:
             log.info("item_already_analyzed_skipping", item_id=item.id, title=item.title[:60])
             return None
 
-        prompt = ANALYSIS_PROMPT.format(
-            title=item.title,
-            source_type=item.source_type.value,
-            source_url=item.source_url,
-            content=item.content[:4000],  # Limit content length
-        )
+        cached = self._from_cache(item)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_prompt(item)
 
         try:
+            if pacer is not None:
+                pacer.wait_sync()
+
             log.debug("analyzing_item", item_id=item.id, title=item.title[:50])
 
             response = self.client.complete(
@@ -138,37 +514,233 @@ class Analyzer:
                 expect_json=True,
             )
 
-            if not response.json_data:
-                log.warning("analysis_no_json", item_id=item.id)
-                return self._fallback_analysis(item)
+            return self._handle_response(item, response.json_data)
 
-            result = self._parse_result(item.id, response.json_data)
+        except ClaudeClientError as e:
+            log.error("analysis_error", item_id=item.id, error=str(e)[:200])
+            return self._fallback_analysis(item)
 
-            # Store in vector store if enabled
-            if self.store_results:
-                self._store_analysis(item, result)
+        except Exception as e:
+            # Catch-all for any unexpected errors (timeouts, network issues, etc.)
+            # Always return fallback instead of crashing the batch
+            log.error("analysis_unexpected_error", item_id=item.id, error=str(e)[:200], error_type=type(e).__name__)
+            return self._fallback_analysis(item)
 
-            log.info(
-                "analysis_complete",
-                item_id=item.id,
-                actionability=result.actionability,
-                confidence=result.confidence,
+    async def analyze_async(
+        self,
+        item: CollectedItem,
+        pacer: _RequestPacer | None = None,
+    ) -> AnalysisResult | None:
+        """
+        Analyze a single item on the async client.
+
+        Same behaviour as `analyze`; ChromaDB calls run in a worker thread.
+
+        Args:
+            item: Item to analyze
+            pacer: Optional pacer that spaces out API request starts
+
+        Returns:
+            AnalysisResult or None if analysis fails or item already analyzed
+        """
+        if await asyncio.to_thread(self._already_analyzed, item.id):
+            log.info("item_already_analyzed_skipping", item_id=item.id, title=item.title[:60])
+            return None
+
+        cached = await asyncio.to_thread(self._from_cache, item)
+        if cached is not None:
+            return cached
+
+        prompt = self._build_prompt(item)
+
+        try:
+            if pacer is not None:
+                await pacer.wait()
+
+            log.debug("analyzing_item", item_id=item.id, title=item.title[:50])
+
+            response = await self.client.complete_async(
+                prompt=prompt,
+                max_tokens=1024,
+                expect_json=True,
             )
 
-            return result
+            return await asyncio.to_thread(self._handle_response, item, response.json_data)
 
         except ClaudeClientError as e:
             log.error("analysis_error", item_id=item.id, error=str(e)[:200])
             return self._fallback_analysis(item)
 
         except Exception as e:
-            # Catch-all for any unexpected errors (timeouts, network issues, etc.)
-            # Always return fallback instead of crashing the batch
             log.error("analysis_unexpected_error", item_id=item.id, error=str(e)[:200], error_type=type(e).__name__)
             return self._fallback_analysis(item)
 
+    def analyze_group(
+        self,
+        items: list[CollectedItem],
+        group_size: int = 8,
+    ) -> list[tuple[CollectedItem, AnalysisResult | None]]:
+        """
+        Analyze items several at a time, one API request per group.
+
+        Items missing from a group's response, or whose entry is malformed
+        (or the whole group, if the response can't be parsed) fall back to
+        per-item `analyze`.
+
+        Args:
+            items: Items to analyze
+            group_size: Items per request
+
+        Returns:
+            List of (item, result) tuples, in input order
+        """
+        group_size = max(1, group_size)
+        results = []
+
+        log.info("analyzing_groups", total_items=len(items), group_size=group_size)
+
+        with self:
+            for start in range(0, len(items), group_size):
+                if start > 0 and self.request_delay > 0:
+                    time.sleep(self.request_delay)
+                results.extend(self._analyze_group_chunk(items[start:start + group_size]))
+
+        successful = sum(1 for _, r in results if r is not None)
+        log.info(
+            "group_analysis_complete",
+            total=len(items),
+            successful=successful,
+        )
+
+        return results
+
+    def _analyze_group_chunk(
+        self,
+        group: list[CollectedItem],
+    ) -> list[tuple[CollectedItem, AnalysisResult | None]]:
+        """Analyze one group of items with a single request."""
+        analyses: dict[str, AnalysisResult | None] = {}
+        pending = []
+        for item in group:
+            if self._already_analyzed(item.id):
+                log.info("item_already_analyzed_skipping", item_id=item.id, title=item.title[:60])
+                continue
+
+            cached = self._from_cache(item)
+            if cached is not None:
+                analyses[item.id] = cached
+            else:
+                pending.append(item)
+
+        if pending:
+            entries = self._request_group(pending)
+            for item in pending:
+                entry = entries.get(item.id)
+                if entry is None:
+                    log.warning("group_analysis_missing_item", item_id=item.id)
+                    analyses[item.id] = self.analyze(item)
+                    continue
+
+                try:
+                    analyses[item.id] = self._handle_response(item, entry)
+                except (TypeError, ValueError) as e:
+                    # Malformed entry (e.g. non-numeric confidence); don't lose the group
+                    log.warning("group_analysis_bad_entry", item_id=item.id, error=str(e)[:200])
+                    analyses[item.id] = self.analyze(item)
+
+        return [(item, analyses.get(item.id)) for item in group]
+
+    def _request_group(self, items: list[CollectedItem]) -> dict[str, dict[str, Any]]:
+        """
+        Request analyses for a group of items.
+
+        Returns:
+            Analysis JSON objects keyed by item id (empty on failure)
+        """
+        payload = [
+            {
+                "id": item.id,
+                "title": item.title,
+                "source_type": item.source_type.value,
+                "url": item.source_url,
+                "content": _truncate_for_prompt(item.content),
+            }
+            for item in items
+        ]
+        prompt = BATCH_ANALYSIS_PROMPT.format(
+            count=len(items),
+            items=json.dumps(payload, ensure_ascii=False, indent=2),
+        )
+
+        try:
+            log.debug("analyzing_group", count=len(items))
+
+            response = self.client.complete(
+                prompt=prompt,
+                max_tokens=1024 * len(items),
+                expect_json=True,
+            )
+        except Exception as e:
+            log.error("group_analysis_error", count=len(items), error=str(e)[:200])
+            return {}
+
+        data = response.json_data
+        if isinstance(data, dict):
+            # Tolerate a wrapping object like {"analyses": [...]}
+            data = next((v for v in data.values() if isinstance(v, list)), None)
+        if not isinstance(data, list):
+            log.warning("group_analysis_no_json", count=len(items))
+            return {}
+
+        return {
+            str(entry["id"]): entry
+            for entry in data
+            if isinstance(entry, dict) and "id" in entry
+        }
+
+    def _build_prompt(self, item: CollectedItem) -> str:
+        """Render the analysis prompt for an item."""
+        return _render_prompt(
+            title=item.title,
+            source_type=item.source_type.value,
+            source_url=item.source_url,
+            content=_truncate_for_prompt(item.content),  # Limit content length
+        )
+
+    def _handle_response(
+        self,
+        item: CollectedItem,
+        json_data: dict[str, Any] | None,
+    ) -> AnalysisResult:
+        """Turn parsed response JSON into a result and store it."""
+        if not json_data:
+            log.warning("analysis_no_json", item_id=item.id)
+            return self._fallback_analysis(item)
+
+        result = self._parse_result(item.id, json_data)
+
+        if self._cache is not None:
+            self._cache.put(self._cache_key(item), result)
+
+        # Store in vector store if enabled
+        if self.store_results:
+            self._store_analysis(item, result)
+
+        log.info(
+            "analysis_complete",
+            item_id=item.id,
+            actionability=result.actionability,
+            confidence=result.confidence,
+        )
+
+        return result
+
     def _parse_result(self, item_id: str, data: dict[str, Any]) -> AnalysisResult:
         """Parse analysis result from JSON."""
+        raw_confidence = data.get("confidence", 0.7)
+        if not isinstance(raw_confidence, float):
+            raw_confidence = float(raw_confidence)
+
         return AnalysisResult(
             item_id=item_id,
             summary=data.get("summary", "Unable to generate summary."),
@@ -177,7 +749,7 @@ class Analyzer:
             relevance_to_claude=data.get("relevance_to_claude", ""),
             actionability=data.get("actionability", "medium"),
             related_topics=data.get("related_topics", []),
-            confidence=min(1.0, max(0.0, float(data.get("confidence", 0.7)))),
+            confidence=_clip01(raw_confidence),
         )
 
     def _fallback_analysis(self, item: CollectedItem) -> AnalysisResult:
@@ -229,12 +801,7 @@ class Analyzer:
                     "quality": "low",
                 }
 
-            self.vector_store.add(
-                collection="items",
-                documents=[item_content],
-                ids=[item.id],
-                metadatas=[item_metadata],
-            )
+            self._add_document("items", item_content, item.id, item_metadata)
 
             # 2. Store ANALYSIS
             analysis_text = f"{result.summary}\n" + "\n".join(result.key_insights)
@@ -253,12 +820,7 @@ class Analyzer:
             if item.signal_score is not None:
                 analysis_metadata["signal_score"] = str(item.signal_score)
 
-            self.vector_store.add(
-                collection="analysis",
-                documents=[analysis_text],
-                ids=[f"analysis_{item.id}"],
-                metadatas=[analysis_metadata],
-            )
+            self._add_document("analysis", analysis_text, f"analysis_{item.id}", analysis_metadata)
 
             log.debug(
                 "storage_complete",
@@ -276,25 +838,152 @@ class Analyzer:
         """
         Analyze multiple items.
 
+        Synchronous entry point; runs `analyze_batch_async` on the client's
+        long-lived event loop (`ClaudeClient.run`), so the async connection
+        pool is reused across batches. Falls back to `analyze_batch_threaded`
+        when called from inside a running event loop or with a client
+        lacking async support.
+
         Args:
             items: Items to analyze
 
         Returns:
-            List of (item, result) tuples
+            List of (item, result) tuples, in input order
         """
-        results = []
+        try:
+            asyncio.get_running_loop()
+            in_event_loop = True
+        except RuntimeError:
+            in_event_loop = False
+
+        if in_event_loop or not hasattr(self.client, "complete_async"):
+            return self.analyze_batch_threaded(items)
+
+        return self.client.run(self.analyze_batch_async(items))
+
+    def analyze_batch_threaded(
+        self,
+        items: list[CollectedItem],
+        concurrency: int | None = None,
+    ) -> list[tuple[CollectedItem, AnalysisResult | None]]:
+        """
+        Analyze multiple items concurrently on a thread pool.
+
+        Same limits as `analyze_batch_async` (max in-flight requests and
+        paced request starts), using the sync client. The SDK releases
+        the GIL while waiting on the network, so threads overlap requests.
+
+        Args:
+            items: Items to analyze
+            concurrency: Override for max worker threads
+
+        Returns:
+            List of (item, result) tuples, in input order
+        """
+        limit = max(1, concurrency if concurrency is not None else self.concurrency)
+        pacer = _RequestPacer(self.request_delay)
 
-        log.info("analyzing_batch", total_items=len(items))
+        unique, owner = self._unique_by_content(items)
 
-        for i, item in enumerate(items):
-            log.debug("batch_progress", current=i + 1, total=len(items))
-            result = self.analyze(item)
+        log.info("analyzing_batch_threaded", total_items=len(items), unique_items=len(unique), concurrency=limit)
+
+        with self:
+            with ThreadPoolExecutor(max_workers=limit) as executor:
+                analyses = list(executor.map(lambda item: self.analyze(item, pacer), unique))
+            results = self._fan_out(items, unique, owner, analyses)
+
+        successful = sum(1 for _, r in results if r is not None)
+        log.info(
+            "batch_analysis_complete",
+            total=len(items),
+            successful=successful,
+        )
+
+        return results
+
+    @staticmethod
+    def _unique_by_content(
+        items: list[CollectedItem],
+    ) -> tuple[list[CollectedItem], list[int]]:
+        """
+        Collapse items with identical prompt content.
+
+        Returns:
+            (unique items, index into unique items for each input item)
+        """
+        first_index: dict[bytes, int] = {}
+        unique: list[CollectedItem] = []
+        owner: list[int] = []
+
+        for item in items:
+            key = hashlib.blake2b(
+                _truncate_for_prompt(item.content).encode("utf-8"), digest_size=16
+            ).digest()
+            index = first_index.get(key)
+            if index is None:
+                index = first_index[key] = len(unique)
+                unique.append(item)
+            owner.append(index)
+
+        return unique, owner
+
+    def _fan_out(
+        self,
+        items: list[CollectedItem],
+        unique: list[CollectedItem],
+        owner: list[int],
+        analyses: list[AnalysisResult | None],
+    ) -> list[tuple[CollectedItem, AnalysisResult | None]]:
+        """Copy each unique item's result to its duplicates (and store them)."""
+        results = []
+        for item, index in zip(items, owner):
+            result = analyses[index]
+            if result is not None and unique[index] is not item:
+                result = replace(result, item_id=item.id)
+                if self.store_results:
+                    self._store_analysis(item, result)
             results.append((item, result))
 
-            # Add delay between requests to avoid rate limiting
-            # Skip delay after last item
-            if self.request_delay > 0 and i < len(items) - 1:
-                time.sleep(self.request_delay)
+        return results
+
+    async def analyze_batch_async(
+        self,
+        items: list[CollectedItem],
+        concurrency: int | None = None,
+    ) -> list[tuple[CollectedItem, AnalysisResult | None]]:
+        """
+        Analyze multiple items concurrently.
+
+        At most `concurrency` requests are in flight, and request starts
+        are spaced `request_delay` seconds apart to respect rate limits.
+
+        Args:
+            items: Items to analyze
+            concurrency: Override for max in-flight requests
+
+        Returns:
+            List of (item, result) tuples, in input order
+        """
+        limit = max(1, concurrency if concurrency is not None else self.concurrency)
+        semaphore = asyncio.Semaphore(limit)
+        pacer = _RequestPacer(self.request_delay)
+
+        unique, owner = self._unique_by_content(items)
+
+        log.info("analyzing_batch", total_items=len(items), unique_items=len(unique), concurrency=limit)
+
+        async def one(item: CollectedItem) -> AnalysisResult | None:
+            async with semaphore:
+                return await self.analyze_async(item, pacer)
+
+        self._buffering += 1
+        try:
+            analyses = await asyncio.gather(*[one(item) for item in unique])
+            results = await asyncio.to_thread(self._fan_out, items, unique, owner, analyses)
+        finally:
+            self._buffering -= 1
+            if not self._buffering:
+                await asyncio.to_thread(self.flush)
 
         successful = sum(1 for _, r in results if r is not None)
         log.info(
@@ -306,6 +995,18 @@ class Analyzer:
         return results
 
 
+# Shared analyzer for the convenience functions (reuses its client)
+_default_analyzer: Analyzer | None = None
+
+
+def _get_default_analyzer() -> Analyzer:
+    """Get or create the shared Analyzer instance."""
+    global _default_analyzer
+    if _default_analyzer is None:
+        _default_analyzer = Analyzer()
+    return _default_analyzer
+
+
 def analyze_item(item: CollectedItem) -> AnalysisResult | None:
     """
     Convenience function to analyze a single item.
@@ -316,8 +1017,7 @@ def analyze_item(item: CollectedItem) -> AnalysisResult | None:
     Returns:
         AnalysisResult or None
     """
-    analyzer = Analyzer()
-    return analyzer.analyze(item)
+    return _get_default_analyzer().analyze(item)
 
 
 def analyze_items(
@@ -332,5 +1032,4 @@ def analyze_items(
     Returns:
         List of (item, result) tuples
     """
-    analyzer = Analyzer()
-    return analyzer.analyze_batch(items)
+    return _get_default_analyzer().analyze_batch(items)
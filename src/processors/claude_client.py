@@ -5,25 +5,42 @@ Wraps the Anthropic SDK with retry logic, timeout handling, and JSON parsing.
 Configurable base_url for GLM proxy support.
 """
 
+import asyncio
+import functools
+import inspect
 import json
 import os
+import random
+import re
+import threading
+import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
-
-from anthropic import Anthropic, APIError, APITimeoutError
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, TypeVar
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
+# The anthropic SDK (httpx, pydantic, ...) is imported on first use so
+# that importing this module, e.g. for ClaudeResponse or the error types,
+# stays cheap
+if TYPE_CHECKING:
+    from anthropic import APIError, AsyncAnthropic
+
 log = get_logger("processor.claude_client")
 
+T = TypeVar("T")
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+# Fenced markdown code block (optional language tag); group 1 is the body
+_FENCE_RE = re.compile(r"```(?:json|[a-zA-Z]*)?\s*\n?(.*?)```", re.DOTALL)
+
 
 class ClaudeModel(str, Enum):
     """Available Claude models (or GLM equivalents)."""
@@ -33,7 +50,7 @@ class ClaudeModel(str, Enum):
     GLM_4_FLASH = "glm-4-flash"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeResponse:
     """Response from Claude API."""
     content: str
@@ -63,6 +80,105 @@ class ClaudeParseError(ClaudeClientError):
     pass
 
 
+# Retry policy for retryable API errors (rate limits, overload, ...)
+RETRY_ATTEMPTS = 5
+RETRY_MIN_DELAY = 4.0
+RETRY_MAX_DELAY = 120.0
+
+
+def _backoff_delay(retry_number: int) -> float:
+    """Seconds to wait before retry `retry_number` (1-based), with jitter."""
+    delay = min(RETRY_MAX_DELAY, max(RETRY_MIN_DELAY, 2.0 * 2 ** (retry_number - 1)))
+    return delay + random.uniform(0, 1)
+
+
+def _with_retry(func: Callable) -> Callable:
+    """
+    Retry ClaudeAPIError with exponential backoff.
+
+    Works for both sync and async methods; the async variant awaits the
+    backoff instead of sleeping the thread. The last error is re-raised
+    once attempts run out.
+    """
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(1, RETRY_ATTEMPTS + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except ClaudeAPIError:
+                    if attempt == RETRY_ATTEMPTS:
+                        raise
+                    delay = _backoff_delay(attempt)
+                    log.warning("claude_retrying", attempt=attempt, delay=round(delay, 1))
+                    await asyncio.sleep(delay)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        for attempt in range(1, RETRY_ATTEMPTS + 1):
+            try:
+                return func(*args, **kwargs)
+            except ClaudeAPIError:
+                if attempt == RETRY_ATTEMPTS:
+                    raise
+                delay = _backoff_delay(attempt)
+                log.warning("claude_retrying", attempt=attempt, delay=round(delay, 1))
+                time.sleep(delay)
+
+    return wrapper
+
+
+class _JSONEndDetector:
+    """
+    Tracks where the first top-level JSON object/array in a text stream ends.
+
+    Feed it chunks as they arrive; `feed` returns True once the value's
+    closing bracket is seen. Brackets inside JSON strings are ignored.
+    """
+
+    def __init__(self):
+        self.start: int | None = None
+        self.end: int | None = None
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> bool:
+        """Consume a chunk; return True when the JSON value is complete."""
+        for ch in chunk:
+            pos = self._pos
+            self._pos += 1
+
+            if self.start is None:
+                if ch in "{[":
+                    self.start = pos
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = pos + 1
+                    return True
+
+        return False
+
+
 class ClaudeClient:
     """
     Wrapper for Anthropic SDK with retry logic and JSON parsing.
@@ -77,6 +193,7 @@ class ClaudeClient:
         max_retries: int = 3,
         api_key: str | None = None,
         base_url: str | None = None,
+        stream_json: bool = False,
     ):
         """
         Initialize Claude client.
@@ -87,11 +204,14 @@ class ClaudeClient:
             max_retries: Maximum retry attempts
             api_key: API key (defaults to ANTHROPIC_API_KEY env var)
             base_url: API base URL (defaults to ANTHROPIC_BASE_URL env var)
+            stream_json: Stream JSON requests (expect_json=True) and stop
+                reading as soon as the JSON value is complete
         """
         config = get_config()
         self.model = model or ClaudeModel.SONNET
         self.timeout = timeout
         self.max_retries = max_retries
+        self.stream_json = stream_json
 
         # Get API credentials
         self._api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
@@ -105,20 +225,161 @@ class ClaudeClient:
         if self._base_url:
             client_kwargs["base_url"] = self._base_url
 
+        from anthropic import Anthropic
+
+        self._client_kwargs = client_kwargs
         self._client = Anthropic(**client_kwargs)
+        self._async_client: "AsyncAnthropic | None" = None
+        # Event loop that owns the async client; see `run`
+        self._runner: asyncio.Runner | None = None
+        self._runner_lock = threading.Lock()
         log.debug("claude_client_initialized", model=self.model.value, base_url=self._base_url)
 
-    @retry(
-        retry=retry_if_exception_type(ClaudeAPIError),
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=2, min=4, max=120),
-        reraise=True,
-    )
+    def warm_up(self) -> threading.Thread:
+        """
+        Open a connection to the API in the background.
+
+        Sends one cheap request (model list) through the async client on
+        the event loop used by `run`, from a daemon thread, so the DNS
+        lookup and TLS handshake overlap with other startup work and
+        batch analysis finds a warm connection in the pool it actually
+        uses. Any response, including errors, is enough; failures are
+        ignored.
+
+        Returns:
+            The started thread
+        """
+        async def _ping() -> None:
+            try:
+                await self.async_client.with_options(timeout=5, max_retries=0).models.list()
+            except Exception as e:
+                log.debug("claude_warm_up_failed", error=str(e)[:200])
+
+        thread = threading.Thread(target=self.run, args=(_ping(),), name="claude-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    @property
+    def async_client(self) -> "AsyncAnthropic":
+        """Lazy load async Anthropic client (same credentials as the sync one)."""
+        if self._async_client is None:
+            from anthropic import AsyncAnthropic
+
+            self._async_client = AsyncAnthropic(**self._client_kwargs)
+        return self._async_client
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine to completion on this client's event loop.
+
+        The loop lives as long as the client, so the async client and its
+        connection pool are reused across calls instead of being rebuilt
+        for every `asyncio.run`. Calls from several threads are serialized.
+        Must not be called from inside a running event loop.
+        """
+        with self._runner_lock:
+            if self._runner is None:
+                self._runner = asyncio.Runner()
+            return self._runner.run(coro)
+
+    async def aclose(self) -> None:
+        """
+        Close the async client's connection pool.
+
+        The async client is bound to the event loop it was first used on,
+        so call this before that loop shuts down (e.g. at the end of an
+        `asyncio.run` workflow). A new client is created on next use.
+        Coroutines run through `run` don't need this; `close` handles it.
+        """
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def close(self) -> None:
+        """
+        Close the connection pools and the event loop used by `run`.
+
+        Clients are normally long-lived and shared (see client_factory);
+        close them only when they will not be used again.
+        """
+        with self._runner_lock:
+            if self._runner is not None:
+                self._runner.run(self.aclose())
+                self._runner.close()
+                self._runner = None
+        self._client.close()
+
+    def __enter__(self) -> "ClaudeClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request_kwargs(
+        self,
+        prompt: str,
+        system: str | None,
+        max_tokens: int,
+        cache_system: bool = False,
+    ) -> dict[str, Any]:
+        """Build keyword arguments for messages.create."""
+        kwargs = {
+            "model": self.model.value,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+        if system and cache_system:
+            # Mark the system prompt as a prompt-cache breakpoint
+            kwargs["system"] = [
+                {
+                    "type": "text",
+                    "text": system,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        elif system:
+            kwargs["system"] = system
+
+        return kwargs
+
+    @staticmethod
+    def _extract_text(response: Any) -> str:
+        """Extract text from response content blocks."""
+        parts = []
+        append = parts.append
+        for block in response.content:
+            text = getattr(block, "text", None)
+            if text is not None:
+                append(text)
+
+        return "".join(parts)
+
+    def _map_error(self, error: "APIError") -> ClaudeClientError:
+        """Convert an Anthropic SDK error into a ClaudeClientError."""
+        from anthropic import APITimeoutError
+
+        if isinstance(error, APITimeoutError):
+            log.error("anthropic_timeout", timeout=self.timeout)
+            return ClaudeTimeoutError(f"Request timed out after {self.timeout}s")
+
+        error_msg = str(error)[:500]
+        log.error("anthropic_api_error", error=error_msg)
+
+        # Check for rate limit or temporary errors (retryable)
+        if "rate" in error_msg.lower() or "overload" in error_msg.lower():
+            return ClaudeAPIError(f"Rate limited: {error_msg}")
+
+        return ClaudeAPIError(f"API error: {error_msg}")
+
+    @_with_retry
     def _execute(
         self,
         prompt: str,
         system: str | None = None,
         max_tokens: int = 4096,
+        cache_system: bool = False,
+        stop_at_json_end: bool = False,
     ) -> str:
         """
         Execute API request with retry logic.
@@ -127,6 +388,9 @@ class ClaudeClient:
             prompt: User prompt
             system: System prompt
             max_tokens: Maximum tokens in response
+            cache_system: Mark the system prompt for prompt caching
+            stop_at_json_end: Stream the response and stop once the first
+                JSON value is complete (returns just that value)
 
         Returns:
             Raw text response
@@ -135,69 +399,95 @@ class ClaudeClient:
             ClaudeTimeoutError: Request timed out
             ClaudeAPIError: API error (retryable)
         """
+        from anthropic import APIError
+
         log.debug("executing_anthropic", model=self.model.value)
 
-        try:
-            kwargs = {
-                "model": self.model.value,
-                "max_tokens": max_tokens,
-                "messages": [{"role": "user", "content": prompt}],
-            }
+        kwargs = self._request_kwargs(prompt, system, max_tokens, cache_system)
 
-            if system:
-                kwargs["system"] = system
+        try:
+            if stop_at_json_end:
+                detector = _JSONEndDetector()
+                parts = []
+                with self._client.messages.stream(**kwargs) as stream:
+                    for text in stream.text_stream:
+                        parts.append(text)
+                        if detector.feed(text):
+                            break
+                return self._json_slice("".join(parts), detector)
 
             response = self._client.messages.create(**kwargs)
+        except APIError as e:
+            raise self._map_error(e) from e
 
-            # Extract text from content blocks
-            content = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    content += block.text
+        return self._extract_text(response)
 
-            return content
+    @_with_retry
+    async def _execute_async(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        cache_system: bool = False,
+        stop_at_json_end: bool = False,
+    ) -> str:
+        """
+        Execute API request on the async client with retry logic.
 
-        except APITimeoutError as e:
-            log.error("anthropic_timeout", timeout=self.timeout)
-            raise ClaudeTimeoutError(f"Request timed out after {self.timeout}s") from e
+        Same contract as `_execute`; the retry backoff is awaited
+        instead of sleeping the thread.
+        """
+        from anthropic import APIError
+
+        log.debug("executing_anthropic_async", model=self.model.value)
 
+        kwargs = self._request_kwargs(prompt, system, max_tokens, cache_system)
+
+        try:
+            if stop_at_json_end:
+                detector = _JSONEndDetector()
+                parts = []
+                async with self.async_client.messages.stream(**kwargs) as stream:
+                    async for text in stream.text_stream:
+                        parts.append(text)
+                        if detector.feed(text):
+                            break
+                return self._json_slice("".join(parts), detector)
+
+            response = await self.async_client.messages.create(**kwargs)
         except APIError as e:
-            error_msg = str(e)[:500]
-            log.error("anthropic_api_error", error=error_msg)
+            raise self._map_error(e) from e
 
-            # Check for rate limit or temporary errors (retryable)
-            if "rate" in error_msg.lower() or "overload" in error_msg.lower():
-                raise ClaudeAPIError(f"Rate limited: {error_msg}")
+        return self._extract_text(response)
 
-            raise ClaudeAPIError(f"API error: {error_msg}") from e
+    @staticmethod
+    def _json_slice(content: str, detector: _JSONEndDetector) -> str:
+        """Return the complete JSON value from streamed content, if found."""
+        if detector.end is None:
+            return content
+
+        log.debug("stream_stopped_at_json_end", streamed=len(content), json_length=detector.end - detector.start)
+        return content[detector.start:detector.end]
 
     def _parse_json_from_content(self, content: str) -> dict[str, Any] | None:
-        """Extract and parse JSON from content."""
+        """
+        Extract and parse JSON from content.
+
+        Uses orjson when installed; both parsers raise ValueError
+        subclasses on invalid input.
+        """
         try:
             # Try direct parse
-            return json.loads(content.strip())
-        except json.JSONDecodeError:
+            return _json_loads(content.strip())
+        except ValueError:
             pass
 
-        # Try extracting from markdown code blocks
-        if "```json" in content:
-            start = content.find("```json") + 7
-            end = content.find("```", start)
-            try:
-                return json.loads(content[start:end].strip())
-            except json.JSONDecodeError:
-                pass
-
-        if "```" in content:
-            start = content.find("```") + 3
-            # Skip language identifier if present
-            newline_pos = content.find("\n", start)
-            if newline_pos > start:
-                start = newline_pos + 1
-            end = content.find("```", start)
+        # Try extracting from a markdown code block
+        match = _FENCE_RE.search(content)
+        if match:
             try:
-                return json.loads(content[start:end].strip())
-            except json.JSONDecodeError:
+                return _json_loads(match.group(1).strip())
+            except ValueError:
                 pass
 
         return None
@@ -208,6 +498,7 @@ class ClaudeClient:
         system: str | None = None,
         max_tokens: int = 4096,
         expect_json: bool = False,
+        cache_system: bool = False,
     ) -> ClaudeResponse:
         """
         Send a completion request to Claude.
@@ -217,6 +508,8 @@ class ClaudeClient:
             system: System prompt (optional)
             max_tokens: Maximum tokens in response
             expect_json: Whether to parse response as JSON
+            cache_system: Cache the system prompt across calls (use for
+                static instructions shared by many requests)
 
         Returns:
             ClaudeResponse with content and metadata
@@ -226,8 +519,67 @@ class ClaudeClient:
             ClaudeAPIError: API error
             ClaudeParseError: Failed to parse response as JSON (when expect_json=True)
         """
-        content = self._execute(prompt, system, max_tokens)
+        content = self._execute(
+            prompt, system, max_tokens, cache_system,
+            stop_at_json_end=expect_json and self.stream_json,
+        )
+        return self._build_response(content, expect_json)
+
+    def complete_text(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        cache_system: bool = False,
+    ) -> str:
+        """
+        Send a completion request and return the raw text.
+
+        For plain-text callers: skips ClaudeResponse construction and all
+        JSON handling.
+
+        Raises:
+            ClaudeTimeoutError: Request timed out
+            ClaudeAPIError: API error
+        """
+        return self._execute(prompt, system, max_tokens, cache_system)
+
+    async def complete_text_async(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        cache_system: bool = False,
+    ) -> str:
+        """Async variant of `complete_text`."""
+        return await self._execute_async(prompt, system, max_tokens, cache_system)
+
+    async def complete_async(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        expect_json: bool = False,
+        cache_system: bool = False,
+    ) -> ClaudeResponse:
+        """
+        Async variant of `complete`.
+
+        Lets callers run many requests concurrently under one event loop
+        (e.g. with `asyncio.gather`).
+
+        Raises:
+            ClaudeTimeoutError: Request timed out
+            ClaudeAPIError: API error
+        """
+        content = await self._execute_async(
+            prompt, system, max_tokens, cache_system,
+            stop_at_json_end=expect_json and self.stream_json,
+        )
+        return self._build_response(content, expect_json)
 
+    def _build_response(self, content: str, expect_json: bool) -> ClaudeResponse:
+        """Wrap raw content in a ClaudeResponse, parsing JSON if expected."""
         response = ClaudeResponse(
             content=content,
             model=self.model.value,
@@ -3,14 +3,42 @@ AI Architect v2 - Client Factory
 
 Factory that creates LLM clients.
 Currently uses ClaudeClient with Anthropic SDK (supports GLM proxy via ANTHROPIC_BASE_URL).
+
+Clients are memoized per (model, timeout) so callers share one SDK client
+and its HTTP connection pool.
 """
 
+import atexit
+import functools
+
 from .claude_client import ClaudeClient, ClaudeModel
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 log = get_logger("processor.client_factory")
 
+# Prebuilt lookup so resolving a configured model name is a dict hit
+_MODEL_BY_NAME = {m.value: m for m in ClaudeModel}
+_GLM_FALLBACK = ClaudeModel.GLM_5
+_SONNET_FALLBACK = ClaudeModel.SONNET
+
+# Open an API connection in the background when a client is created
+# (tests turn this off so they never touch the network)
+WARM_UP_CLIENTS = True
+
+
+def _resolve_model(model_str: str) -> ClaudeModel:
+    """
+    Map a configured model name to a ClaudeModel.
+
+    Unknown names fall back to GLM-5 for GLM (proxy) setups and to
+    Sonnet otherwise.
+    """
+    model = _MODEL_BY_NAME.get(model_str)
+    if model is not None:
+        return model
+    return _GLM_FALLBACK if "glm" in model_str.lower() else _SONNET_FALLBACK
+
 
 def get_analysis_client() -> ClaudeClient:
     """
@@ -19,16 +47,8 @@ def get_analysis_client() -> ClaudeClient:
     Returns ClaudeClient configured with analysis model.
     """
     config = get_config()
-    model_str = config.models.analysis or "glm-5"
-
-    try:
-        model = ClaudeModel(model_str)
-    except ValueError:
-        # Default to GLM-5 for proxy setups
-        model = ClaudeModel.GLM_5
-
-    log.debug("creating_analysis_client", model=model.value)
-    return ClaudeClient(model=model)
+    model = _resolve_model(config.models.analysis or "glm-5")
+    return _get_client(model, timeout=120)
 
 
 def get_synthesis_client() -> ClaudeClient:
@@ -38,12 +58,23 @@ def get_synthesis_client() -> ClaudeClient:
     Returns ClaudeClient with longer timeout for synthesis operations.
     """
     config = get_config()
-    model_str = config.models.synthesis or "glm-5"
+    model = _resolve_model(config.models.synthesis or "glm-5")
+    return _get_client(model, timeout=300)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(model: ClaudeModel, timeout: int) -> ClaudeClient:
+    """Create (once) the client for a model and timeout."""
+    log.debug("creating_client", model=model.value, timeout=timeout)
+    client = ClaudeClient(model=model, timeout=timeout)
+    # Shared for the process lifetime; release its pools and event loop at exit
+    atexit.register(client.close)
+    if WARM_UP_CLIENTS:
+        # Establish the connection while the caller finishes setting up
+        client.warm_up()
+    return client
 
-    try:
-        model = ClaudeModel(model_str)
-    except ValueError:
-        model = ClaudeModel.GLM_5
 
-    log.debug("creating_synthesis_client", model=model.value)
-    return ClaudeClient(model=model, timeout=300)
+def reset_clients() -> None:
+    """Drop memoized clients (e.g. after config or environment changes)."""
+    _get_client.cache_clear()
@@ -4,14 +4,95 @@ AI Architect v2 - Novelty Detector
 Detects novelty of items by comparing with historical content in ChromaDB.
 """
 
+import hashlib
+import math
+import re
+import struct
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from ..collectors.base import CollectedItem
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
 log = get_logger("processor.novelty_detector")
 
+# Persistent Bloom filter of already-stored item content
+NOVELTY_BLOOM_PATH = Path("data/novelty_bloom.bin")
+NOVELTY_BLOOM_CAPACITY = 200_000
+NOVELTY_BLOOM_ERROR_RATE = 0.001
+
+# Rows per tile when scoring duplicate pairs (caps memory at TILE x N floats)
+DUPLICATE_TILE_ROWS = 512
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _content_key(text: str) -> bytes:
+    """Hash of case- and whitespace-normalized text."""
+    normalized = _WHITESPACE_RE.sub(" ", text).strip().lower()
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+
+class _BloomFilter:
+    """
+    Fixed-size Bloom filter over content keys, persisted to a file.
+
+    Membership may give false positives (at about `error_rate` when
+    filled to `capacity`) but never false negatives. Positions come from
+    double hashing the two halves of the 128-bit content key.
+    """
+
+    _HEADER = struct.Struct("<QI")
+
+    def __init__(self, capacity: int, error_rate: float, path: Path | str | None = None):
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.path = Path(path) if path is not None else None
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._load()
+
+    def _positions(self, key: bytes) -> list[int]:
+        h1 = int.from_bytes(key[:8], "little")
+        h2 = int.from_bytes(key[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: bytes) -> None:
+        for p in self._positions(key):
+            self._bits[p >> 3] |= 1 << (p & 7)
+
+    def _load(self) -> None:
+        """Load bits from disk if the file matches this filter's shape."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = self.path.read_bytes()
+            num_bits, num_hashes = self._HEADER.unpack_from(data)
+            body = data[self._HEADER.size:]
+            if (num_bits, num_hashes) == (self.num_bits, self.num_hashes) and len(body) == len(self._bits):
+                self._bits[:] = body
+            else:
+                log.info("novelty_bloom_reset", reason="shape_changed")
+        except (OSError, struct.error) as e:
+            log.warning("novelty_bloom_load_failed", error=str(e)[:200])
+
+    def save(self) -> None:
+        """Write bits to disk."""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_bytes(self._HEADER.pack(self.num_bits, self.num_hashes) + bytes(self._bits))
+            tmp.replace(self.path)
+        except OSError as e:
+            log.warning("novelty_bloom_save_failed", error=str(e)[:200])
+
 
 class NoveltyDetector:
     """
@@ -26,6 +107,7 @@ class NoveltyDetector:
         novelty_threshold: float = 0.3,
         similarity_threshold: float = 0.8,
         vector_store: Any | None = None,
+        bloom_path: Path | str | None = NOVELTY_BLOOM_PATH,
     ):
         """
         Initialize novelty detector.
@@ -34,11 +116,14 @@ class NoveltyDetector:
             novelty_threshold: Minimum novelty to consider item novel
             similarity_threshold: Above this similarity, item is not novel
             vector_store: VectorStore instance (lazy loaded if None)
+            bloom_path: File backing the seen-content Bloom filter
+                        (None keeps it in memory only)
         """
         config = get_config()
         self.novelty_threshold = novelty_threshold or config.thresholds.novelty_score_min
         self.similarity_threshold = similarity_threshold
         self._vector_store = vector_store
+        self._bloom = _BloomFilter(NOVELTY_BLOOM_CAPACITY, NOVELTY_BLOOM_ERROR_RATE, bloom_path)
 
     @property
     def vector_store(self):
@@ -58,57 +143,112 @@ class NoveltyDetector:
         Returns:
             Novelty score (0-1, where 1 is completely novel)
         """
-        # Build search text from title and content
-        search_text = f"{item.title}\n{item.content[:1000]}"
+        return self.compute_novelty_batch([item])[0]
+
+    def compute_novelty_batch(self, items: list[CollectedItem]) -> list[float]:
+        """
+        Compute novelty scores for several items with one vector search.
+
+        Args:
+            items: Items to check
+
+        Returns:
+            Novelty scores (0-1, where 1 is completely novel), in item order
+        """
+        if not items:
+            return []
+
+        scores = [0.0] * len(items)
+
+        # Content already stored is not novel; only search the rest
+        pending = [i for i, item in enumerate(items) if _content_key(self._search_text(item)) not in self._bloom]
+        if len(pending) < len(items):
+            log.debug("novelty_bloom_hits", hits=len(items) - len(pending))
+        if not pending:
+            return scores
+
+        # Build search texts from title and content
+        search_texts = [self._search_text(items[i]) for i in pending]
 
         try:
-            # Search for similar items
+            # Search for similar items, one result row per query
             results = self.vector_store.search(
-                query=search_text,
+                query=search_texts,
                 collection="items",
                 n_results=5,
             )
 
             if not results or not results.get("distances"):
                 # No similar items found = completely novel
-                return 1.0
+                for i in pending:
+                    scores[i] = 1.0
+                return scores
 
-            # Get the best (lowest) distance
-            # ChromaDB uses L2 distance by default
-            distances = results["distances"][0]  # First query's results
+            distance_rows = results["distances"]
 
-            if not distances:
-                return 1.0
+            for row, i in enumerate(pending):
+                item = items[i]
+                distances = distance_rows[row] if row < len(distance_rows) else None
 
-            min_distance = min(distances)
+                if not distances:
+                    scores[i] = 1.0
+                    continue
 
-            # Convert distance to similarity (0-1)
-            # For L2 distance, smaller = more similar
-            # Normalize to 0-1 range (assuming typical L2 distances 0-2)
-            max_distance = 2.0
-            similarity = 1.0 - min(min_distance / max_distance, 1.0)
+                # Get the best (lowest) distance
+                # ChromaDB uses L2 distance by default
+                min_distance = min(distances)
 
-            # Novelty is inverse of similarity
-            novelty = 1.0 - similarity
+                # Convert distance to similarity (0-1)
+                # For L2 distance, smaller = more similar
+                # Normalize to 0-1 range (assuming typical L2 distances 0-2)
+                max_distance = 2.0
+                similarity = 1.0 - min(min_distance / max_distance, 1.0)
 
-            log.debug(
-                "novelty_computed",
-                item_id=item.id,
-                min_distance=min_distance,
-                similarity=similarity,
-                novelty=novelty,
-            )
+                # Novelty is inverse of similarity
+                novelty = 1.0 - similarity
 
-            return novelty
+                log.debug(
+                    "novelty_computed",
+                    item_id=item.id,
+                    min_distance=min_distance,
+                    similarity=similarity,
+                    novelty=novelty,
+                )
+
+                scores[i] = novelty
+
+            return scores
 
         except Exception as e:
             log.warning(
                 "novelty_check_failed",
-                item_id=item.id,
+                items=len(pending),
                 error=str(e)[:200],
             )
             # Default to moderate novelty if check fails
-            return 0.5
+            for i in pending:
+                scores[i] = 0.5
+            return scores
+
+    @staticmethod
+    def _search_text(item: CollectedItem) -> str:
+        """Text used to compare an item against history."""
+        return f"{item.title}\n{item.content[:1000]}"
+
+    def remember(self, items: list[CollectedItem]) -> None:
+        """
+        Record items as seen so identical content is not novel next time.
+
+        Call after the items have been stored in the vector store.
+
+        Args:
+            items: Stored items
+        """
+        if not items:
+            return
+        for item in items:
+            self._bloom.add(_content_key(self._search_text(item)))
+        self._bloom.save()
 
     def check_novelty(self, item: CollectedItem) -> tuple[bool, float]:
         """
@@ -149,10 +289,10 @@ class NoveltyDetector:
             threshold=threshold,
         )
 
-        for item in items:
-            is_novel, score = self.check_novelty(item)
+        scores = self.compute_novelty_batch(items)
 
-            if is_novel:
+        for item, score in zip(items, scores):
+            if score >= threshold:
                 item.novelty_score = score
                 novel_items.append(item)
             else:
@@ -188,23 +328,38 @@ class NoveltyDetector:
         threshold = similarity_threshold or self.similarity_threshold
         duplicates = []
 
+        if len(items) < 2:
+            return duplicates
+
         # Batch all items for vectorization
         texts = [f"{item.title}\n{item.content[:500]}" for item in items]
 
+        # Embed each distinct text once (cross-posts often share content)
+        row_by_text: dict[str, int] = {}
+        rows_for_items = [row_by_text.setdefault(text, len(row_by_text)) for text in texts]
+
         try:
-            # Get embeddings for all items
-            embeddings = self.vector_store.get_embeddings(texts)
-
-            # Compare each pair
-            for i in range(len(items)):
-                for j in range(i + 1, len(items)):
-                    similarity = self._cosine_similarity(
-                        embeddings[i],
-                        embeddings[j],
+            # Get embeddings for the distinct texts, then expand to one row per item
+            unique_embeddings = self.vector_store.get_embeddings(list(row_by_text))
+            unique_matrix = _normalize_rows(np.asarray(unique_embeddings, dtype=np.float32))
+            matrix = unique_matrix[rows_for_items]
+
+            # Score pairs one tile of rows at a time (upper triangle only), so
+            # the working set is TILE x N instead of N x N
+            tile = max(64, min(DUPLICATE_TILE_ROWS, len(items)))
+
+            for start in range(0, len(items), tile):
+                block = matrix[start:start + tile] @ matrix[start:].T
+                rows, cols = np.nonzero(np.triu(block >= threshold, k=1))
+
+                duplicates.extend(
+                    (items[start + i], items[start + j], float(similarity))
+                    for i, j, similarity in zip(
+                        rows.tolist(),
+                        cols.tolist(),
+                        block[rows, cols].tolist(),
                     )
-
-                    if similarity >= threshold:
-                        duplicates.append((items[i], items[j], similarity))
+                )
 
         except Exception as e:
             log.warning("duplicate_detection_failed", error=str(e)[:200])
@@ -213,27 +368,43 @@ class NoveltyDetector:
 
     def _cosine_similarity(self, a: list[float], b: list[float]) -> float:
         """Compute cosine similarity between two vectors."""
-        import math
+        vectors = _normalize_rows(np.asarray([a, b], dtype=np.float32))
+        return float(vectors[0] @ vectors[1])
+
+
+def _normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """L2-normalize each row in place; zero vectors stay zero."""
+    if matrix.size == 0:
+        return matrix
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.clip(norms, 1e-12, None)
+    return matrix
+
 
-        dot_product = sum(x * y for x, y in zip(a, b))
-        norm_a = math.sqrt(sum(x * x for x in a))
-        norm_b = math.sqrt(sum(x * x for x in b))
+_default_detector: NoveltyDetector | None = None
 
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
 
-        return dot_product / (norm_a * norm_b)
+def _get_default_detector() -> NoveltyDetector:
+    """Get or create the shared NoveltyDetector instance."""
+    global _default_detector
+    if _default_detector is None:
+        _default_detector = NoveltyDetector()
+    return _default_detector
 
 
-def detect_novelty(items: list[CollectedItem]) -> list[CollectedItem]:
+def detect_novelty(
+    items: list[CollectedItem],
+    detector: NoveltyDetector | None = None,
+) -> list[CollectedItem]:
     """
     Convenience function to filter items by novelty.
 
     Args:
         items: Items to filter
+        detector: Detector to use (shared default instance if None)
 
     Returns:
         Novel items with scores applied
     """
-    detector = NoveltyDetector()
+    detector = detector or _get_default_detector()
     return detector.filter_novel(items)
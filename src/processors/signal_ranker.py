@@ -3,23 +3,60 @@ AI Architect v2 - Signal Ranker
 
 Ranks collected items by signal strength using Claude.
 Processes items in batches with unified Impact + Maturity classification.
+
+Batches run on a thread pool: every batch is submitted before any result
+is collected, and each future's result() is read exactly once (calling it
+again re-raises a stored exception, and collecting inside the submit loop
+silently serializes the batches).
 """
 
+import hashlib
 import json
+import sqlite3
+import string
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from ._rate_limit import TokenBucket, get_bucket
 from .client_factory import get_analysis_client
 from .claude_client import ClaudeClientError
 from ..collectors.base import CollectedItem
 from ..utils.config import get_config
 from ..utils.logger import get_logger
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 log = get_logger("processor.signal_ranker")
 
-# Default delay between batch API calls to avoid rate limits (seconds)
-DEFAULT_BATCH_DELAY = 3.0
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(data: Any) -> str:
+        return orjson.dumps(data).decode("utf-8")
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, ensure_ascii=False)
+
+# Content characters per item included in the ranking prompt
+RANK_CONTENT_CHARS = 1000
+
+# Persistent cache of batch rankings keyed by model + prompt version + items
+RANK_CACHE_PATH = Path("data/rank_cache.db")
+
+# Cached rankings expire after this many seconds
+RANK_CACHE_TTL = 86400
+
+# Bump when RANKING_SYSTEM or BATCH_RANKING_PROMPT change so stale rankings are not reused
+RANKING_PROMPT_VERSION = "v2"
 
 
 # Impact dimensions from the plan
@@ -40,8 +77,12 @@ MATURITY_LEVELS = [
     "legacy",            # Declining, being replaced
 ]
 
+# Hashed lookups for validating Claude's answers
+_IMPACT_SET = frozenset(IMPACT_DIMENSIONS)
+_MATURITY_SET = frozenset(MATURITY_LEVELS)
+
 
-@dataclass
+@dataclass(slots=True)
 class RankedItem:
     """Item with ranking scores."""
     item: CollectedItem
@@ -51,8 +92,10 @@ class RankedItem:
     reasoning: str | None = None
 
 
-# Prompt template for batch ranking
-BATCH_RANKING_PROMPT = """Analyze these {count} items and rank them by signal strength.
+# Invariant ranking instructions, sent as the system prompt. Not marked for
+# prompt caching: at a few hundred tokens it is below the minimum cacheable prefix
+# (1024 tokens), so a cache_control block would be ignored
+RANKING_SYSTEM = """You rank collected items by signal strength.
 
 For each item, provide:
 1. **signal_score** (1-10): How important is this for someone building with Claude/AI?
@@ -77,16 +120,96 @@ For each item, provide:
 
 4. **reasoning**: One sentence explaining the score
 
-Items to analyze:
-{items}
-
 Respond with a JSON array (no markdown):
 [
-  {{"index": 0, "signal_score": N, "impact": "...", "maturity": "...", "reasoning": "..."}},
+  {"index": 0, "signal_score": N, "impact": "...", "maturity": "...", "reasoning": "..."},
   ...
 ]
 """
 
+# Per-batch user prompt
+BATCH_RANKING_PROMPT = """Analyze these {count} items and rank them by signal strength.
+
+Items to analyze:
+{items}
+"""
+
+# BATCH_RANKING_PROMPT pre-split into (literal, field_name) pairs so rendering
+# doesn't re-scan the template's brace syntax for every batch
+_RANKING_SEGMENTS = [
+    (literal, field_name)
+    for literal, field_name, _, _ in string.Formatter().parse(BATCH_RANKING_PROMPT)
+]
+
+
+def _render_ranking_prompt(**fields: Any) -> str:
+    """Render BATCH_RANKING_PROMPT from its pre-split segments."""
+    return "".join(
+        literal + (str(fields[name]) if name else "")
+        for literal, name in _RANKING_SEGMENTS
+    )
+
+
+class _RankCache:
+    """
+    Exact-match cache of raw batch rankings, persisted in SQLite.
+
+    Keys hash the model, the prompt version and the formatted items of a
+    batch, so re-ranking the same batch skips the API call. Entries
+    expire after `ttl` seconds.
+    """
+
+    def __init__(self, path: Path | str, ttl: float = RANK_CACHE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @staticmethod
+    def key(model: str, items_text: str) -> str:
+        """Build the cache key for a batch's formatted items text."""
+        # The text carries each item's batch index, so order is part of the key
+        payload = f"{RANKING_PROMPT_VERSION}|{model}|{items_text}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Lazy open the database (caller holds the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS rank_cache "
+                "(key TEXT PRIMARY KEY, json TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> list[dict[str, Any]] | dict[str, Any] | None:
+        """Return the cached rankings for a key, if present and fresh."""
+        with self._lock:
+            try:
+                row = self._connection().execute(
+                    "SELECT json FROM rank_cache WHERE key = ? AND expires_at > ?",
+                    (key, time.time()),
+                ).fetchone()
+            except sqlite3.Error as e:
+                log.warning("rank_cache_read_failed", error=str(e)[:200])
+                return None
+
+        return _json_loads(row[0]) if row is not None else None
+
+    def set(self, key: str, rankings: list[dict[str, Any]] | dict[str, Any]) -> None:
+        """Store rankings under a key."""
+        with self._lock:
+            try:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO rank_cache (key, json, expires_at) VALUES (?, ?, ?)",
+                    (key, _json_dumps(rankings), time.time() + self.ttl),
+                )
+                conn.commit()
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                log.warning("rank_cache_write_failed", error=str(e)[:200])
+
 
 class SignalRanker:
     """
@@ -101,7 +224,9 @@ class SignalRanker:
         batch_size: int = 10,
         signal_threshold: int = 4,
         client: None = None,
-        batch_delay: float | None = None,
+        requests_per_minute: float | None = None,
+        cache_path: Path | str | None = RANK_CACHE_PATH,
+        parallelism: int | None = None,
     ):
         """
         Initialize signal ranker.
@@ -110,14 +235,41 @@ class SignalRanker:
             batch_size: Items per Claude call
             signal_threshold: Minimum score to keep (1-10)
             client: Claude client (uses default if None)
-            batch_delay: Delay between batch API calls in seconds (to avoid rate limits).
-                        Defaults to config.thresholds.batch_delay
+            requests_per_minute: Ranking call rate limit. None shares the
+                        provider/model bucket at config.thresholds.claude_rpm;
+                        0 disables rate limiting
+            cache_path: SQLite file for the ranking cache (None disables caching)
+            parallelism: Batches in flight at once.
+                         Defaults to config.thresholds.rank_parallelism
         """
         config = get_config()
         self.batch_size = batch_size or config.thresholds.batch_size
         self.signal_threshold = signal_threshold or config.thresholds.signal_score_min
         self.client = client or get_analysis_client()
-        self.batch_delay = batch_delay if batch_delay is not None else config.thresholds.batch_delay
+        self.parallelism = parallelism or config.thresholds.rank_parallelism
+        self._bucket = self._build_bucket(requests_per_minute, config.thresholds.claude_rpm)
+        self._cache = _RankCache(cache_path) if cache_path is not None else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _model_name(self) -> str:
+        """Name of the client's model (for cache keys and rate limits)."""
+        model = getattr(self.client, "model", "")
+        return getattr(model, "value", str(model))
+
+    def _build_bucket(
+        self,
+        requests_per_minute: float | None,
+        default_rpm: float,
+    ) -> TokenBucket | None:
+        """Pick the rate limiter for ranking calls."""
+        if requests_per_minute is None:
+            # Shared with every ranker talking to the same provider and model
+            provider = getattr(self.client, "_base_url", None) or "anthropic"
+            return get_bucket(provider, self._model_name(), default_rpm, burst=self.parallelism)
+        if requests_per_minute <= 0:
+            return None
+        return TokenBucket(requests_per_minute / 60.0, self.parallelism)
 
     def rank_batch(self, items: list[CollectedItem]) -> list[RankedItem]:
         """
@@ -132,25 +284,46 @@ class SignalRanker:
         if not items:
             return []
 
-        # Format items for prompt
+        # Format items once; the same text feeds the cache key and the prompt
         items_text = "\n\n".join([
-            f"[{i}] **{item.title}**\nSource: {item.source_type.value}\n{item.content[:1000]}"
+            f"[{i}] **{item.title}**\nSource: {item.source_type.value}\n{item.content[:RANK_CONTENT_CHARS]}"
             for i, item in enumerate(items)
         ])
 
-        prompt = BATCH_RANKING_PROMPT.format(
+        cache_key = None
+        if self._cache is not None:
+            cache_key = _RankCache.key(self._model_name(), items_text)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self.cache_hits += 1
+                log.info("rank_cache_hit", items=len(items))
+                return self._parse_rankings(items, cached)
+            self.cache_misses += 1
+
+        prompt = _render_ranking_prompt(
             count=len(items),
             items=items_text,
         )
 
+        if self._bucket is not None:
+            self._bucket.acquire()
+
         try:
-            response = self.client.complete(prompt, max_tokens=4096, expect_json=True)
+            response = self.client.complete(
+                prompt,
+                system=RANKING_SYSTEM,
+                max_tokens=4096,
+                expect_json=True,
+            )
 
             if not response.json_data:
                 log.warning("batch_ranking_no_json", items=len(items))
                 return self._fallback_rank(items)
 
-            return self._parse_rankings(items, response.json_data)
+            ranked = self._parse_rankings(items, response.json_data)
+            if cache_key is not None:
+                self._cache.set(cache_key, response.json_data)
+            return ranked
 
         except ClaudeClientError as e:
             log.error("batch_ranking_error", error=str(e)[:200])
@@ -186,9 +359,9 @@ class SignalRanker:
 
             # Validate values
             signal_score = max(1, min(10, int(signal_score)))
-            if impact not in IMPACT_DIMENSIONS:
+            if impact not in _IMPACT_SET:
                 impact = "ecosystem"
-            if maturity not in MATURITY_LEVELS:
+            if maturity not in _MATURITY_SET:
                 maturity = "growing"
 
             ranked.append(RankedItem(
@@ -224,39 +397,58 @@ class SignalRanker:
 
         return ranked
 
-    def rank_all(self, items: list[CollectedItem]) -> list[RankedItem]:
+    def rank_all(
+        self,
+        items: list[CollectedItem],
+        return_arrow: bool = False,
+    ) -> "list[RankedItem] | pa.Table":
         """
         Rank all items, processing in batches.
 
         Args:
             items: All items to rank
+            return_arrow: Return a pyarrow Table (see `to_table`) instead of
+                          RankedItem objects. Requires the optional pyarrow package
 
         Returns:
-            List of RankedItem objects (filtered by threshold)
+            List of RankedItem objects, or a Table (filtered by threshold)
         """
-        all_ranked = []
-        total_batches = (len(items) + self.batch_size - 1) // self.batch_size
+        batches = [items[i:i + self.batch_size] for i in range(0, len(items), self.batch_size)]
 
         log.info(
             "ranking_items",
             total_items=len(items),
             batch_size=self.batch_size,
-            total_batches=total_batches,
+            total_batches=len(batches),
+            parallelism=self.parallelism,
         )
 
-        for i in range(0, len(items), self.batch_size):
-            batch = items[i:i + self.batch_size]
-            batch_num = i // self.batch_size + 1
-
-            log.info("ranking_batch", batch=batch_num, items=len(batch))
-
-            ranked = self.rank_batch(batch)
-            all_ranked.extend(ranked)
-
-            # Add delay between batch requests to avoid rate limiting
-            # Skip delay after last batch
-            if self.batch_delay > 0 and i + self.batch_size < len(items):
-                time.sleep(self.batch_delay)
+        # Batches run concurrently; the token bucket paces the API calls
+        results: list[list[RankedItem]] = [[] for _ in batches]
+
+        with ThreadPoolExecutor(max_workers=min(self.parallelism, len(batches) or 1)) as executor:
+            futures = {
+                executor.submit(self._rank_batch_logged, batch, batch_num): batch_num
+                for batch_num, batch in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+
+        # Keep input order regardless of completion order
+        all_ranked = [ranked for batch_result in results for ranked in batch_result]
+
+        if return_arrow:
+            import pyarrow.compute as pc
+
+            table = self.to_table(all_ranked)
+            filtered_table = table.filter(pc.field("signal_score") >= self.signal_threshold)
+            log.info(
+                "ranking_complete",
+                total_ranked=table.num_rows,
+                passed_threshold=filtered_table.num_rows,
+                threshold=self.signal_threshold,
+            )
+            return filtered_table
 
         # Filter by threshold
         filtered = [r for r in all_ranked if r.signal_score >= self.signal_threshold]
@@ -270,6 +462,36 @@ class SignalRanker:
 
         return filtered
 
+    @staticmethod
+    def to_table(ranked_items: list[RankedItem]) -> "pa.Table":
+        """
+        Convert ranked items to a columnar pyarrow Table.
+
+        Columns: id, signal_score (int8), impact and maturity
+        (dictionary-encoded), reasoning. Requires the optional pyarrow
+        package.
+
+        Args:
+            ranked_items: Ranked items
+
+        Returns:
+            Table with one row per ranked item
+        """
+        import pyarrow as pa
+
+        return pa.table({
+            "id": pa.array([r.item.id for r in ranked_items], type=pa.string()),
+            "signal_score": pa.array([r.signal_score for r in ranked_items], type=pa.int8()),
+            "impact": pa.array([r.impact for r in ranked_items], type=pa.string()).dictionary_encode(),
+            "maturity": pa.array([r.maturity for r in ranked_items], type=pa.string()).dictionary_encode(),
+            "reasoning": pa.array([r.reasoning for r in ranked_items], type=pa.string()),
+        })
+
+    def _rank_batch_logged(self, batch: list[CollectedItem], batch_num: int) -> list[RankedItem]:
+        """Rank one batch from a worker thread."""
+        log.info("ranking_batch", batch=batch_num + 1, items=len(batch))
+        return self.rank_batch(batch)
+
     def apply_scores(self, ranked_items: list[RankedItem]) -> list[CollectedItem]:
         """
         Apply ranking scores back to CollectedItems.
@@ -288,16 +510,31 @@ class SignalRanker:
         return [r.item for r in ranked_items]
 
 
-def rank_items(items: list[CollectedItem]) -> list[CollectedItem]:
+_default_ranker: SignalRanker | None = None
+
+
+def _get_default_ranker() -> SignalRanker:
+    """Get or create the shared SignalRanker instance."""
+    global _default_ranker
+    if _default_ranker is None:
+        _default_ranker = SignalRanker()
+    return _default_ranker
+
+
+def rank_items(
+    items: list[CollectedItem],
+    ranker: SignalRanker | None = None,
+) -> list[CollectedItem]:
     """
     Convenience function to rank and filter items.
 
     Args:
         items: Items to rank
+        ranker: Ranker to use (shared default instance if None)
 
     Returns:
         Filtered items with scores applied
     """
-    ranker = SignalRanker()
+    ranker = ranker or _get_default_ranker()
     ranked = ranker.rank_all(items)
     return ranker.apply_scores(ranked)
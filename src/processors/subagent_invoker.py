@@ -8,7 +8,7 @@ In production, this would invoke Claude CLI with --agent flag.
 For testing, provides mock responses.
 """
 
-import copy
+import functools
 import json
 import logging
 import re
@@ -22,6 +22,41 @@ try:
 except ImportError:
     log = logging.getLogger("processor.subagent_invoker")
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _json_dumps(data: Any, pretty: bool = False) -> str:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if pretty else _ORJSON_OPTIONS
+        return orjson.dumps(data, option=option).decode("utf-8")
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
+
+    def _json_dumps(data: Any, pretty: bool = False) -> str:
+        if pretty:
+            return json.dumps(data, ensure_ascii=False, indent=2)
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+# Default agent definitions directory: .claude/agents under the project root
+_DEFAULT_AGENTS_DIR = Path(__file__).resolve().parent.parent.parent / ".claude" / "agents"
+
+# Markdown code block (optional json tag); group 1 is the body
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+
+# Start of a candidate JSON value embedded in prose
+_JSON_START_RE = re.compile(r"[\[{]")
+
+# Stdlib decoder for raw_decode (parses a value prefix and reports where it ends)
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _input_field(data: Any, key: str, default: Any) -> Any:
+    """Read `key` from dict input, falling back to `default` for any other shape."""
+    return data.get(key, default) if isinstance(data, dict) else default
+
 
 class SubagentError(Exception):
     """Exception raised when subagent invocation fails."""
@@ -31,6 +66,54 @@ class SubagentError(Exception):
         self.agent_name = agent_name
 
 
+@functools.lru_cache(maxsize=256)
+def _extract_json_text(output: str) -> str:
+    """
+    Find the JSON value in agent output that is not plain JSON.
+
+    Returns the value's source text rather than the parsed object, so
+    cached results are immutable and callers always get fresh data.
+
+    Args:
+        output: Stripped agent output
+
+    Returns:
+        Text of the first complete JSON value found
+
+    Raises:
+        SubagentError: If no JSON value can be found
+    """
+    # Output that starts like JSON usually just has trailing text:
+    # decode the leading value before scanning for code blocks
+    if output[:1] in ("{", "["):
+        try:
+            _, end = _JSON_DECODER.raw_decode(output)
+            return output[:end]
+        except json.JSONDecodeError:
+            pass
+
+    # Try to extract from markdown code block
+    match = _CODE_BLOCK_RE.search(output)
+    if match:
+        text = match.group(1).strip()
+        try:
+            _json_loads(text)
+            return text
+        except json.JSONDecodeError:
+            pass
+
+    # Try JSON embedded in text: decode from each '[' or '{' in turn
+    # until one yields a complete value
+    for match in _JSON_START_RE.finditer(output):
+        try:
+            _, end = _JSON_DECODER.raw_decode(output, match.start())
+            return output[match.start():end]
+        except json.JSONDecodeError:
+            continue
+
+    raise SubagentError("Could not parse JSON from agent output")
+
+
 class SubagentInvoker:
     """
     Invokes Claude Code subagents for specialized processing tasks.
@@ -51,11 +134,7 @@ class SubagentInvoker:
             agents_dir: Directory containing agent definitions (default: .claude/agents)
         """
         self.agent_name = agent_name
-        if agents_dir is None:
-            # Default to .claude/agents relative to project root
-            project_root = Path(__file__).parent.parent.parent
-            agents_dir = project_root / ".claude" / "agents"
-        self.agents_dir = agents_dir
+        self.agents_dir = agents_dir if agents_dir is not None else _DEFAULT_AGENTS_DIR
 
     def invoke(self, input_data: Any, timeout: int = 120) -> Any:  # noqa: ARG002 - timeout for future production use
         """
@@ -84,14 +163,16 @@ class SubagentInvoker:
         # return self._parse_output(result.stdout)
         return self._mock_invoke(input_data)
 
-    def _prepare_input(self, data: Any) -> str:
+    def _prepare_input(self, data: Any, pretty: bool = False) -> str:
         """
         Prepare input data for the agent.
 
-        Serializes to JSON, adding index field for lists when using ranker.
+        Serializes to compact JSON, adding index field for lists when using
+        ranker.
 
         Args:
             data: Input data (list or dict)
+            pretty: Indent the JSON (for debugging; agents don't need it)
 
         Returns:
             JSON string ready for agent input
@@ -99,23 +180,18 @@ class SubagentInvoker:
         if isinstance(data, list):
             # Only add index for ranker agent
             if self.agent_name == "agent-ranker":
-                # Create a copy to avoid modifying original
-                data_copy = []
-                for i, item in enumerate(data):
-                    if isinstance(item, dict):
-                        item_copy = copy.deepcopy(item)
-                        # Add index for ranker to track items
-                        if "index" not in item_copy:
-                            item_copy["index"] = i
-                        data_copy.append(item_copy)
-                    else:
-                        data_copy.append(item)
-                return json.dumps(data_copy, ensure_ascii=False, indent=2)
+                # Shallow copies: only the top-level "index" key is added, so
+                # the caller's dicts (and nested values) are left untouched
+                data_copy = [
+                    {**item, "index": item.get("index", i)} if isinstance(item, dict) else item
+                    for i, item in enumerate(data)
+                ]
+                return _json_dumps(data_copy, pretty)
 
             # For non-ranker agents, serialize as-is
-            return json.dumps(data, ensure_ascii=False, indent=2)
+            return _json_dumps(data, pretty)
 
-        return json.dumps(data, ensure_ascii=False, indent=2)
+        return _json_dumps(data, pretty)
 
     def _parse_output(self, output: str) -> Any:
         """
@@ -139,77 +215,16 @@ class SubagentInvoker:
 
         # Try direct JSON parse first
         try:
-            return json.loads(output)
+            return _json_loads(output)
         except json.JSONDecodeError:
             pass
 
-        # Try to extract from markdown code block
-        code_block_pattern = r"```(?:json)?\s*\n?(.*?)\n?```"
-        match = re.search(code_block_pattern, output, re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group(1).strip())
-            except json.JSONDecodeError:
-                pass
-
-        # Try to find JSON embedded in text using a more robust approach
-        # First try to find arrays (they start with '[' and end with ']')
-        # Use a simple bracket-matching approach
+        # Retries often repeat the same output; the scan for the embedded
+        # value is memoized, and only the final decode runs every time
         try:
-            # Find potential JSON array start
-            start_idx = output.find('[')
-            if start_idx != -1:
-                bracket_count = 0
-                end_idx = start_idx
-                for i, char in enumerate(output[start_idx:], start_idx):
-                    if char == '[':
-                        bracket_count += 1
-                    elif char == ']':
-                        bracket_count -= 1
-                        if bracket_count == 0:
-                            end_idx = i
-                            break
-                if end_idx > start_idx:
-                    json_str = output[start_idx:end_idx + 1]
-                    return json.loads(json_str)
-        except json.JSONDecodeError:
-            pass
-
-        try:
-            # Find potential JSON object start
-            start_idx = output.find('{')
-            if start_idx != -1:
-                brace_count = 0
-                end_idx = start_idx
-                in_string = False
-                escape_next = False
-                for i, char in enumerate(output[start_idx:], start_idx):
-                    if escape_next:
-                        escape_next = False
-                        continue
-                    if char == '\\' and in_string:
-                        escape_next = True
-                        continue
-                    if char == '"' and not escape_next:
-                        in_string = not in_string
-                    elif not in_string:
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                end_idx = i
-                                break
-                if end_idx > start_idx:
-                    json_str = output[start_idx:end_idx + 1]
-                    return json.loads(json_str)
-        except json.JSONDecodeError:
-            pass
-
-        raise SubagentError(
-            f"Could not parse JSON from agent output",
-            agent_name=self.agent_name
-        )
+            return _json_loads(_extract_json_text(output))
+        except SubagentError as e:
+            raise SubagentError(str(e), agent_name=self.agent_name) from None
 
     def _mock_invoke(self, input_data: Any) -> Any:
         """
@@ -223,37 +238,31 @@ class SubagentInvoker:
         Returns:
             Mock response appropriate for the agent type
         """
-        if self.agent_name == "agent-ranker":
-            return self._mock_ranker_response(input_data)
-        elif self.agent_name == "agent-analyzer":
-            return self._mock_analyzer_response(input_data)
-        elif self.agent_name == "agent-synthesizer":
-            return self._mock_synthesizer_response(input_data)
-        elif self.agent_name == "agent-competitive":
-            return self._mock_competitive_response(input_data)
-        else:
+        mock = self._MOCKS.get(self.agent_name)
+        if mock is None:
             # Generic mock response
             return {"status": "mocked", "agent": self.agent_name}
+        return mock(self, input_data)
 
     def _mock_ranker_response(self, items: list[dict]) -> list[dict]:
         """Generate mock ranking response."""
         if not isinstance(items, list):
             items = [items]
 
-        result = []
-        for i, _ in enumerate(items):
-            result.append({
+        return [
+            {
                 "index": i,
                 "signal_score": 5,
                 "impact": "ecosystem",
                 "maturity": "growing",
                 "reasoning": f"Mock ranking for item {i}"
-            })
-        return result
+            }
+            for i in range(len(items))
+        ]
 
     def _mock_analyzer_response(self, item: dict) -> dict:
         """Generate mock analysis response."""
-        title = item.get("title", "Unknown") if isinstance(item, dict) else "Unknown"
+        title = _input_field(item, "title", "Unknown")
         return {
             "summary": f"Mock analysis summary for: {title}",
             "key_insights": [
@@ -271,7 +280,7 @@ class SubagentInvoker:
 
     def _mock_synthesizer_response(self, data: dict) -> dict:
         """Generate mock synthesis response."""
-        mode = data.get("mode", "daily") if isinstance(data, dict) else "daily"
+        mode = _input_field(data, "mode", "daily")
         return {
             "mode": mode,
             "relevance_score": 5,
@@ -292,7 +301,7 @@ class SubagentInvoker:
 
     def _mock_competitive_response(self, data: dict) -> dict:
         """Generate mock competitive analysis response."""
-        week = data.get("week", "2026-W07") if isinstance(data, dict) else "2026-W07"
+        week = _input_field(data, "week", "2026-W07")
         return {
             "week": week,
             "tools": [
@@ -313,9 +322,23 @@ class SubagentInvoker:
             ]
         }
 
+    # Mock builders by agent name (plain functions, called with self)
+    _MOCKS = {
+        "agent-ranker": _mock_ranker_response,
+        "agent-analyzer": _mock_analyzer_response,
+        "agent-synthesizer": _mock_synthesizer_response,
+        "agent-competitive": _mock_competitive_response,
+    }
+
 
 # Convenience functions for common agent invocations
 
+@functools.lru_cache(maxsize=None)
+def _get_invoker(agent_name: str) -> SubagentInvoker:
+    """Create (once) the shared invoker for an agent."""
+    return SubagentInvoker(agent_name)
+
+
 def invoke_ranker(items: list[dict]) -> list[dict]:
     """
     Invoke the ranker agent to score and classify items.
@@ -326,8 +349,7 @@ def invoke_ranker(items: list[dict]) -> list[dict]:
     Returns:
         List of ranked items with signal_score, impact, maturity
     """
-    invoker = SubagentInvoker("agent-ranker")
-    return invoker.invoke(items)
+    return _get_invoker("agent-ranker").invoke(items)
 
 
 def invoke_analyzer(item: dict) -> dict:
@@ -340,8 +362,7 @@ def invoke_analyzer(item: dict) -> dict:
     Returns:
         Analysis dict with summary, key_insights, actionability, confidence
     """
-    invoker = SubagentInvoker("agent-analyzer")
-    return invoker.invoke(item)
+    return _get_invoker("agent-analyzer").invoke(item)
 
 
 def invoke_synthesizer(data: dict) -> dict:
@@ -354,8 +375,7 @@ def invoke_synthesizer(data: dict) -> dict:
     Returns:
         Synthesis dict with relevance_score, highlights, patterns, recommendations
     """
-    invoker = SubagentInvoker("agent-synthesizer")
-    return invoker.invoke(data)
+    return _get_invoker("agent-synthesizer").invoke(data)
 
 
 def invoke_competitive(data: dict) -> dict:
@@ -368,5 +388,4 @@ def invoke_competitive(data: dict) -> dict:
     Returns:
         Competitive analysis dict with week, tools, feature_gaps, adoption_trends
     """
-    invoker = SubagentInvoker("agent-competitive")
-    return invoker.invoke(data)
+    return _get_invoker("agent-competitive").invoke(data)
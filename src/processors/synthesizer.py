@@ -5,9 +5,14 @@ Generates strategic synthesis from analyzed items using Claude Opus.
 Supports daily, weekly, and monthly synthesis modes.
 """
 
+import atexit
+import string
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
+from itertools import islice
 from typing import Any
 
 from .analyzer import AnalysisResult
@@ -18,6 +23,11 @@ from ..utils.logger import get_logger
 
 log = get_logger("processor.synthesizer")
 
+# Items included in each synthesis prompt
+DAILY_MAX_ITEMS = 50
+WEEKLY_MAX_ITEMS = 50
+MONTHLY_MAX_ITEMS = 100
+
 
 class SynthesisMode(str, Enum):
     """Synthesis modes."""
@@ -26,7 +36,7 @@ class SynthesisMode(str, Enum):
     MONTHLY = "monthly"
 
 
-@dataclass
+@dataclass(slots=True)
 class DailySynthesis:
     """Daily synthesis result."""
     date: str
@@ -38,7 +48,7 @@ class DailySynthesis:
     summary: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WeeklySynthesis:
     """Weekly synthesis result."""
     week: str  # YYYY-WNN format
@@ -51,7 +61,7 @@ class WeeklySynthesis:
     summary: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MonthlySynthesis:
     """Monthly synthesis result."""
     month: str  # YYYY-MM format
@@ -168,6 +178,58 @@ Focus on strategic intelligence and predictive insights.
 """
 
 
+def _relevance_score(data: dict[str, Any]) -> int:
+    """Relevance score clamped to 1-10; malformed values count as 5."""
+    try:
+        return min(10, max(1, int(data.get("relevance_score", 5))))
+    except (TypeError, ValueError):
+        return 5
+
+
+def _list_field(data: dict[str, Any], key: str) -> list:
+    """List field from a synthesis response ([] if missing or not a list)."""
+    value = data.get(key)
+    return value if isinstance(value, list) else []
+
+
+def _split_template(template: str) -> list[tuple[str, str | None]]:
+    """Pre-split a format template into (literal, field_name) pairs."""
+    return [
+        (literal, field_name)
+        for literal, field_name, _, _ in string.Formatter().parse(template)
+    ]
+
+
+def _render(segments: list[tuple[str, str | None]], **fields: Any) -> str:
+    """Render a template from its pre-split segments (same output as str.format)."""
+    return "".join(
+        literal + (str(fields[name]) if name else "")
+        for literal, name in segments
+    )
+
+
+# Synthesis prompts pre-split so rendering doesn't re-scan the brace syntax
+# (including the escaped JSON examples) on every call
+_DAILY_SEGMENTS = _split_template(DAILY_SYNTHESIS_PROMPT)
+_WEEKLY_SEGMENTS = _split_template(WEEKLY_SYNTHESIS_PROMPT)
+_MONTHLY_SEGMENTS = _split_template(MONTHLY_SYNTHESIS_PROMPT)
+
+
+_store_pool: ThreadPoolExecutor | None = None
+_store_pool_lock = threading.Lock()
+
+
+def _get_store_pool() -> ThreadPoolExecutor:
+    """Get or create the background pool for vector store writes."""
+    global _store_pool
+    with _store_pool_lock:
+        if _store_pool is None:
+            _store_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="synth-store")
+            # Let pending writes finish before the interpreter exits
+            atexit.register(_store_pool.shutdown, wait=True)
+        return _store_pool
+
+
 class Synthesizer:
     """
     Generates synthesis reports using Claude Opus.
@@ -190,6 +252,7 @@ class Synthesizer:
         self.client = client or get_synthesis_client()
         self.store_results = store_results
         self._vector_store = None
+        self._pending_stores: list[Future] = []
 
     @property
     def vector_store(self):
@@ -214,13 +277,16 @@ class Synthesizer:
         Returns:
             DailySynthesis or None if synthesis fails
         """
-        date = date or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        if date is None:
+            date = time.strftime("%Y-%m-%d", time.gmtime())
 
-        # Build items content
-        items_content = self._format_items_for_prompt(items)
+        # Build items content from one bounded view of the items
+        view = items[:DAILY_MAX_ITEMS]
+        items_content = self._format_items_for_prompt(view, max_items=DAILY_MAX_ITEMS)
         item_count = len(items)
 
-        prompt = DAILY_SYNTHESIS_PROMPT.format(
+        prompt = _render(
+            _DAILY_SEGMENTS,
             date=date,
             items_content=items_content,
             item_count=item_count,
@@ -237,7 +303,7 @@ class Synthesizer:
 
             if not response.json_data:
                 log.warning("daily_synthesis_no_json")
-                return self._fallback_daily(date, items)
+                return self._fallback_daily(date, view, item_count)
 
             result = self._parse_daily_synthesis(date, response.json_data)
 
@@ -254,12 +320,12 @@ class Synthesizer:
 
         except ClaudeClientError as e:
             log.error("daily_synthesis_error", error=str(e)[:200])
-            return self._fallback_daily(date, items)
+            return self._fallback_daily(date, view, item_count)
 
         except Exception as e:
             # Catch-all for any unexpected errors (timeouts, network issues, etc.)
             log.error("daily_synthesis_unexpected_error", error=str(e)[:200], error_type=type(e).__name__)
-            return self._fallback_daily(date, items)
+            return self._fallback_daily(date, view, item_count)
 
     def _parse_daily_synthesis(
         self,
@@ -269,11 +335,11 @@ class Synthesizer:
         """Parse daily synthesis from JSON."""
         return DailySynthesis(
             date=date,
-            relevance_score=min(10, max(1, int(data.get("relevance_score", 5)))),
-            highlights=data.get("highlights", []),
-            patterns=data.get("patterns", []),
-            recommendations=data.get("recommendations", []),
-            key_changes=data.get("key_changes", []),
+            relevance_score=_relevance_score(data),
+            highlights=_list_field(data, "highlights"),
+            patterns=_list_field(data, "patterns"),
+            recommendations=_list_field(data, "recommendations"),
+            key_changes=_list_field(data, "key_changes"),
             summary=data.get("summary", "Synthesis unavailable."),
         )
 
@@ -281,8 +347,10 @@ class Synthesizer:
         self,
         date: str,
         items: list[tuple[CollectedItem, AnalysisResult | None]],
+        item_count: int | None = None,
     ) -> DailySynthesis:
         """Generate fallback daily synthesis."""
+        item_count = len(items) if item_count is None else item_count
         highlights = [item.title for item, _ in items[:3]]
         return DailySynthesis(
             date=date,
@@ -291,7 +359,7 @@ class Synthesizer:
             patterns=["Synthesis unavailable - using fallback"],
             recommendations=["Review items manually"],
             key_changes=[],
-            summary=f"Processed {len(items)} items. Synthesis generation failed.",
+            summary=f"Processed {item_count} items. Synthesis generation failed.",
         )
 
     def synthesize_weekly(
@@ -300,17 +368,21 @@ class Synthesizer:
         week: str | None = None,
     ) -> WeeklySynthesis | None:
         """Generate weekly synthesis."""
-        week = week or datetime.now(timezone.utc).strftime("%Y-W%W")
-        items_content = self._format_items_for_prompt(items)
+        if week is None:
+            week = time.strftime("%Y-W%W", time.gmtime())
+        view = items[:WEEKLY_MAX_ITEMS]
+        item_count = len(items)
+        items_content = self._format_items_for_prompt(view, max_items=WEEKLY_MAX_ITEMS)
 
-        prompt = WEEKLY_SYNTHESIS_PROMPT.format(
+        prompt = _render(
+            _WEEKLY_SEGMENTS,
             week=week,
-            item_count=len(items),
+            item_count=item_count,
             items_content=items_content,
         )
 
         try:
-            log.info("synthesizing_weekly", week=week, items=len(items))
+            log.info("synthesizing_weekly", week=week, items=item_count)
 
             response = self.client.complete(
                 prompt=prompt,
@@ -319,7 +391,7 @@ class Synthesizer:
             )
 
             if not response.json_data:
-                return self._fallback_weekly(week, items)
+                return self._fallback_weekly(week, view, item_count)
 
             result = self._parse_weekly_synthesis(week, response.json_data)
 
@@ -330,23 +402,23 @@ class Synthesizer:
 
         except ClaudeClientError as e:
             log.error("weekly_synthesis_error", error=str(e)[:200])
-            return self._fallback_weekly(week, items)
+            return self._fallback_weekly(week, view, item_count)
 
         except Exception as e:
             # Catch-all for any unexpected errors (timeouts, network issues, etc.)
             log.error("weekly_synthesis_unexpected_error", error=str(e)[:200], error_type=type(e).__name__)
-            return self._fallback_weekly(week, items)
+            return self._fallback_weekly(week, view, item_count)
 
     def _parse_weekly_synthesis(self, week: str, data: dict[str, Any]) -> WeeklySynthesis:
         """Parse weekly synthesis from JSON."""
         return WeeklySynthesis(
             week=week,
-            relevance_score=min(10, max(1, int(data.get("relevance_score", 5)))),
-            top_stories=data.get("top_stories", []),
-            trends=data.get("trends", []),
-            competitive_moves=data.get("competitive_moves", []),
-            emerging_technologies=data.get("emerging_technologies", []),
-            recommendations=data.get("recommendations", []),
+            relevance_score=_relevance_score(data),
+            top_stories=_list_field(data, "top_stories"),
+            trends=_list_field(data, "trends"),
+            competitive_moves=_list_field(data, "competitive_moves"),
+            emerging_technologies=_list_field(data, "emerging_technologies"),
+            recommendations=_list_field(data, "recommendations"),
             summary=data.get("summary", ""),
         )
 
@@ -354,8 +426,10 @@ class Synthesizer:
         self,
         week: str,
         items: list[tuple[CollectedItem, AnalysisResult | None]],
+        item_count: int | None = None,
     ) -> WeeklySynthesis:
         """Generate fallback weekly synthesis."""
+        item_count = len(items) if item_count is None else item_count
         top_stories = [{"title": item.title, "significance": ""} for item, _ in items[:5]]
         return WeeklySynthesis(
             week=week,
@@ -365,7 +439,7 @@ class Synthesizer:
             competitive_moves=[],
             emerging_technologies=[],
             recommendations=["Review items manually"],
-            summary=f"Weekly synthesis for {week}. Processed {len(items)} items.",
+            summary=f"Weekly synthesis for {week}. Processed {item_count} items.",
         )
 
     def synthesize_monthly(
@@ -374,17 +448,21 @@ class Synthesizer:
         month: str | None = None,
     ) -> MonthlySynthesis | None:
         """Generate monthly synthesis."""
-        month = month or datetime.now(timezone.utc).strftime("%Y-%m")
-        items_content = self._format_items_for_prompt(items, max_items=100)
+        if month is None:
+            month = time.strftime("%Y-%m", time.gmtime())
+        view = items[:MONTHLY_MAX_ITEMS]
+        item_count = len(items)
+        items_content = self._format_items_for_prompt(view, max_items=MONTHLY_MAX_ITEMS)
 
-        prompt = MONTHLY_SYNTHESIS_PROMPT.format(
+        prompt = _render(
+            _MONTHLY_SEGMENTS,
             month=month,
-            item_count=len(items),
+            item_count=item_count,
             items_content=items_content,
         )
 
         try:
-            log.info("synthesizing_monthly", month=month, items=len(items))
+            log.info("synthesizing_monthly", month=month, items=item_count)
 
             response = self.client.complete(
                 prompt=prompt,
@@ -393,7 +471,7 @@ class Synthesizer:
             )
 
             if not response.json_data:
-                return self._fallback_monthly(month, items)
+                return self._fallback_monthly(month, view, item_count)
 
             result = self._parse_monthly_synthesis(month, response.json_data)
 
@@ -404,24 +482,24 @@ class Synthesizer:
 
         except ClaudeClientError as e:
             log.error("monthly_synthesis_error", error=str(e)[:200])
-            return self._fallback_monthly(month, items)
+            return self._fallback_monthly(month, view, item_count)
 
         except Exception as e:
             # Catch-all for any unexpected errors (timeouts, network issues, etc.)
             log.error("monthly_synthesis_unexpected_error", error=str(e)[:200], error_type=type(e).__name__)
-            return self._fallback_monthly(month, items)
+            return self._fallback_monthly(month, view, item_count)
 
     def _parse_monthly_synthesis(self, month: str, data: dict[str, Any]) -> MonthlySynthesis:
         """Parse monthly synthesis from JSON."""
         return MonthlySynthesis(
             month=month,
-            relevance_score=min(10, max(1, int(data.get("relevance_score", 5)))),
-            major_developments=data.get("major_developments", []),
+            relevance_score=_relevance_score(data),
+            major_developments=_list_field(data, "major_developments"),
             trend_analysis=data.get("trend_analysis", ""),
-            ecosystem_changes=data.get("ecosystem_changes", []),
+            ecosystem_changes=_list_field(data, "ecosystem_changes"),
             competitive_landscape=data.get("competitive_landscape", ""),
-            predictions=data.get("predictions", []),
-            recommendations=data.get("recommendations", []),
+            predictions=_list_field(data, "predictions"),
+            recommendations=_list_field(data, "recommendations"),
             summary=data.get("summary", ""),
         )
 
@@ -429,8 +507,10 @@ class Synthesizer:
         self,
         month: str,
         items: list[tuple[CollectedItem, AnalysisResult | None]],
+        item_count: int | None = None,
     ) -> MonthlySynthesis:
         """Generate fallback monthly synthesis."""
+        item_count = len(items) if item_count is None else item_count
         major = [{"title": item.title, "impact": "", "timeline": ""} for item, _ in items[:10]]
         return MonthlySynthesis(
             month=month,
@@ -441,26 +521,36 @@ class Synthesizer:
             competitive_landscape="",
             predictions=[],
             recommendations=["Review items manually"],
-            summary=f"Monthly synthesis for {month}. Processed {len(items)} items.",
+            summary=f"Monthly synthesis for {month}. Processed {item_count} items.",
         )
 
     def _format_items_for_prompt(
         self,
         items: list[tuple[CollectedItem, AnalysisResult | None]],
-        max_items: int = 50,
+        max_items: int = DAILY_MAX_ITEMS,
     ) -> str:
         """Format items for inclusion in prompt."""
-        formatted = []
-        for item, analysis in items[:max_items]:
-            entry = f"- [{item.source_type.value}] {item.title}"
-            if analysis:
-                entry += f"\n  Summary: {analysis.summary[:200]}"
-            formatted.append(entry)
-
-        return "\n\n".join(formatted)
+        # One f-string per entry, joined straight from the generator
+        return "\n\n".join(
+            f"- [{item.source_type.value}] {item.title}\n  Summary: {analysis.summary[:200]}"
+            if analysis is not None
+            else f"- [{item.source_type.value}] {item.title}"
+            for item, analysis in islice(items, max_items)
+        )
 
     def _store_synthesis(self, mode: str, period: str, content: str) -> None:
-        """Store synthesis in vector store."""
+        """
+        Store synthesis in vector store without blocking the caller.
+
+        The write runs on a background thread; use `flush()` to wait for it.
+        """
+        self._pending_stores = [f for f in self._pending_stores if not f.done()]
+        self._pending_stores.append(
+            _get_store_pool().submit(self._write_synthesis, mode, period, content)
+        )
+
+    def _write_synthesis(self, mode: str, period: str, content: str) -> None:
+        """Write a synthesis to the vector store (runs on the store pool)."""
         try:
             self.vector_store.add(
                 collection="synthesis",
@@ -473,3 +563,14 @@ class Synthesizer:
             )
         except Exception as e:
             log.warning("synthesis_storage_failed", error=str(e)[:200])
+
+    def flush(self, timeout: float | None = None) -> None:
+        """
+        Wait for background synthesis writes to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        """
+        if self._pending_stores:
+            wait(self._pending_stores, timeout=timeout)
+            self._pending_stores = [f for f in self._pending_stores if not f.done()]
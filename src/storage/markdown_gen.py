@@ -4,11 +4,14 @@ AI Architect v2 - Markdown Generator
 Generates structured Markdown outputs for daily, weekly, and monthly digests.
 """
 
+import heapq
+import os
 from datetime import datetime, timezone
+from itertools import chain, groupby, repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
-from ..collectors.base import CollectedItem
+from ..collectors.base import CollectedItem, SourceType
 from ..processors.analyzer import AnalysisResult
 from ..processors.synthesizer import DailySynthesis, MonthlySynthesis, WeeklySynthesis
 from ..utils.config import get_config
@@ -16,6 +19,80 @@ from ..utils.logger import get_logger
 
 log = get_logger("storage.markdown_gen")
 
+# Static section headers, spliced into the line lists with extend()
+_SECTION_SUMMARY = ("", "---", "", "## Summary", "")
+_SECTION_EXECUTIVE_SUMMARY = ("", "---", "", "## Executive Summary", "")
+_SECTION_HIGHLIGHTS = ("", "## Highlights", "")
+_SECTION_PATTERNS = ("", "## Patterns Detected", "")
+_SECTION_KEY_CHANGES = ("", "## Key Changes", "")
+_SECTION_DAILY_RECOMMENDATIONS = ("", "## Recommendations", "")
+_SECTION_ITEMS = ("", "---", "", "## Items Analyzed", "")
+_SECTION_TOP_STORIES = ("", "## Top Stories", "")
+_SECTION_MAJOR_DEVELOPMENTS = ("", "## Major Developments", "")
+_SECTION_TRENDS = ("## Trends", "")
+_SECTION_COMPETITIVE_MOVES = ("## Competitive Moves", "")
+_SECTION_EMERGING_TECHNOLOGIES = ("## Emerging Technologies", "")
+_SECTION_TREND_ANALYSIS = ("## Trend Analysis", "")
+_SECTION_ECOSYSTEM_CHANGES = ("## Ecosystem Changes", "")
+_SECTION_COMPETITIVE_LANDSCAPE = ("## Competitive Landscape", "")
+_SECTION_PREDICTIONS = ("## Predictions", "")
+_SECTION_RECOMMENDATIONS = ("## Recommendations", "")
+_SECTION_INDEX_WEEKLY = ("", "## Weekly Reports", "")
+_SECTION_INDEX_MONTHLY = ("", "## Monthly Reports", "")
+
+# Reports listed in the index, per output subdirectory
+_INDEX_LIMITS = {"daily": 10, "weekly": 5, "monthly": 6}
+
+# Daily digest source headings ("github_repos" -> "### Github Repos")
+_SOURCE_HEADER = {st: f"### {st.value.replace('_', ' ').title()}" for st in SourceType}
+
+# Blank line, rule, blank line after each daily digest item
+_ITEM_SEPARATOR = "\n---\n"
+
+
+# Write buffer for generated files: large enough that a whole digest
+# usually goes out in a single write(2)
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _write_lines(filepath: Path, lines: Iterable[str]) -> None:
+    """Stream lines to a file without joining them into one string first."""
+    with filepath.open("w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        # Interleave newlines in C instead of concatenating per line
+        f.writelines(chain.from_iterable(zip(lines, repeat("\n"))))
+
+
+def _source_key(pair: tuple[CollectedItem, AnalysisResult | None]) -> SourceType:
+    """Sort/group key for (item, analysis) pairs: the item's source type."""
+    return pair[0].source_type
+
+
+def _bullets(items: Iterable[str]) -> str:
+    """Render items as one pre-joined block of markdown bullets."""
+    return "\n".join(f"- {x}" for x in items)
+
+
+def _top_md(directory: Path, n: int) -> list[str]:
+    """
+    Get the newest markdown file names in a directory.
+
+    Report names are zero-padded dates, so the lexicographically largest
+    names are the most recent.
+
+    Args:
+        directory: Directory to scan
+        n: Number of names to return
+
+    Returns:
+        Up to n file names, newest first (empty if the directory is missing)
+    """
+    try:
+        with os.scandir(directory) as entries:
+            names = [e.name for e in entries if e.name.endswith(".md") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    return heapq.nlargest(n, names)
+
 
 class MarkdownGenerator:
     """
@@ -44,7 +121,7 @@ class MarkdownGenerator:
         self.output_dir = Path(output_dir or "output")
 
         # Ensure directories exist
-        for subdir in ["daily", "weekly", "monthly", "topics", "competitive"]:
+        for subdir in ("daily", "weekly", "monthly", "topics", "competitive"):
             (self.output_dir / subdir).mkdir(parents=True, exist_ok=True)
 
     def generate_daily(
@@ -65,294 +142,218 @@ class MarkdownGenerator:
         date = synthesis.date
         filepath = self.output_dir / "daily" / f"{date}.md"
 
-        content = self._build_daily_markdown(synthesis, items)
-        filepath.write_text(content, encoding="utf-8")
+        _write_lines(filepath, self._iter_daily_lines(synthesis, items))
 
         log.info("daily_digest_generated", path=str(filepath))
         return filepath
 
-    def _build_daily_markdown(
+    def _iter_daily_lines(
         self,
         synthesis: DailySynthesis,
         items: list[tuple[CollectedItem, AnalysisResult | None]],
-    ) -> str:
-        """Build daily digest markdown content."""
-        lines = [
-            f"# AI Architect Daily Digest",
-            f"",
-            f"**Date:** {synthesis.date}",
-            f"**Relevance Score:** {synthesis.relevance_score}/10",
-            f"",
-            "---",
-            f"",
-            "## Summary",
-            f"",
-            synthesis.summary,
-            f"",
-            "## Highlights",
-            f"",
-        ]
-
-        for highlight in synthesis.highlights:
-            lines.append(f"- {highlight}")
-
-        lines.extend([
-            "",
-            "## Patterns Detected",
-            "",
-        ])
-
-        for pattern in synthesis.patterns:
-            lines.append(f"- {pattern}")
+    ) -> Iterator[str]:
+        """Yield daily digest markdown lines."""
+        yield "# AI Architect Daily Digest"
+        yield ""
+        yield f"**Date:** {synthesis.date}"
+        yield f"**Relevance Score:** {synthesis.relevance_score}/10"
+        yield from _SECTION_SUMMARY
+        yield synthesis.summary
+
+        yield from _SECTION_HIGHLIGHTS
+        if synthesis.highlights:
+            yield _bullets(synthesis.highlights)
+
+        yield from _SECTION_PATTERNS
+        if synthesis.patterns:
+            yield _bullets(synthesis.patterns)
 
         if synthesis.key_changes:
-            lines.extend([
-                "",
-                "## Key Changes",
-                "",
-            ])
-            for change in synthesis.key_changes:
-                lines.append(f"- {change}")
-
-        lines.extend([
-            "",
-            "## Recommendations",
-            "",
-        ])
-
-        for rec in synthesis.recommendations:
-            lines.append(f"- {rec}")
+            yield from _SECTION_KEY_CHANGES
+            yield _bullets(synthesis.key_changes)
+
+        yield from _SECTION_DAILY_RECOMMENDATIONS
+        if synthesis.recommendations:
+            yield _bullets(synthesis.recommendations)
 
         # Add items section
-        lines.extend([
-            "",
-            "---",
-            "",
-            "## Items Analyzed",
-            "",
-        ])
-
-        # Group items by source type
-        by_source: dict[str, list[tuple[CollectedItem, AnalysisResult | None]]] = {}
-        for item, analysis in items:
-            source = item.source_type.value
-            if source not in by_source:
-                by_source[source] = []
-            by_source[source].append((item, analysis))
-
-        for source, source_items in sorted(by_source.items()):
-            lines.append(f"### {source.replace('_', ' ').title()}")
-            lines.append("")
+        yield from _SECTION_ITEMS
+
+        # Group items by source type (the sort is stable, so items keep
+        # their input order within each source)
+        for source, source_items in groupby(sorted(items, key=_source_key), key=_source_key):
+            yield _SOURCE_HEADER[source]
+            yield ""
 
             for item, analysis in source_items:
-                lines.append(f"#### [{item.title}]({item.source_url})")
-                lines.append("")
+                yield f"#### [{item.title}]({item.source_url})"
+                yield ""
 
                 if analysis:
-                    lines.append(analysis.summary)
-                    lines.append("")
+                    yield analysis.summary
+                    yield ""
 
                     if analysis.key_insights:
-                        lines.append("**Key Insights:**")
-                        for insight in analysis.key_insights[:3]:
-                            lines.append(f"- {insight}")
-                        lines.append("")
-
-                lines.append(f"*Signal: {item.signal_score}/10 | Novelty: {item.novelty_score:.2f}*")
-                lines.append("")
-                lines.append("---")
-                lines.append("")
+                        yield "**Key Insights:**"
+                        yield _bullets(analysis.key_insights[:3])
+                        yield ""
 
-        return "\n".join(lines)
+                yield f"*Signal: {item.signal_score}/10 | Novelty: {item.novelty_score:.2f}*"
+                yield _ITEM_SEPARATOR
 
     def generate_weekly(self, synthesis: WeeklySynthesis) -> Path:
         """Generate weekly report markdown."""
-        week = synthesis.week
-        filepath = self.output_dir / "weekly" / f"{week}.md"
-
-        lines = [
-            f"# AI Architect Weekly Report",
-            "",
-            f"**Week:** {week}",
-            f"**Relevance Score:** {synthesis.relevance_score}/10",
-            "",
-            "---",
-            "",
-            "## Summary",
-            "",
-            synthesis.summary,
-            "",
-            "## Top Stories",
-            "",
-        ]
+        filepath = self.output_dir / "weekly" / f"{synthesis.week}.md"
+        _write_lines(filepath, self._iter_weekly_lines(synthesis))
+        log.info("weekly_report_generated", path=str(filepath))
+        return filepath
+
+    def _iter_weekly_lines(self, synthesis: WeeklySynthesis) -> Iterator[str]:
+        """Yield weekly report markdown lines."""
+        yield "# AI Architect Weekly Report"
+        yield ""
+        yield f"**Week:** {synthesis.week}"
+        yield f"**Relevance Score:** {synthesis.relevance_score}/10"
+        yield from _SECTION_SUMMARY
+        yield synthesis.summary
+        yield from _SECTION_TOP_STORIES
 
         for story in synthesis.top_stories:
-            lines.append(f"### {story.get('title', 'Untitled')}")
+            yield f"### {story.get('title', 'Untitled')}"
             if story.get("significance"):
-                lines.append("")
-                lines.append(story["significance"])
-            lines.append("")
+                yield ""
+                yield story["significance"]
+            yield ""
 
         if synthesis.trends:
-            lines.extend([
-                "## Trends",
-                "",
-            ])
-            for trend in synthesis.trends:
-                lines.append(f"- {trend}")
-            lines.append("")
+            yield from _SECTION_TRENDS
+            yield _bullets(synthesis.trends)
+            yield ""
 
         if synthesis.competitive_moves:
-            lines.extend([
-                "## Competitive Moves",
-                "",
-            ])
-            for move in synthesis.competitive_moves:
-                lines.append(f"- {move}")
-            lines.append("")
+            yield from _SECTION_COMPETITIVE_MOVES
+            yield _bullets(synthesis.competitive_moves)
+            yield ""
 
         if synthesis.emerging_technologies:
-            lines.extend([
-                "## Emerging Technologies",
-                "",
-            ])
-            for tech in synthesis.emerging_technologies:
-                lines.append(f"- {tech}")
-            lines.append("")
-
-        lines.extend([
-            "## Recommendations",
-            "",
-        ])
-        for rec in synthesis.recommendations:
-            lines.append(f"- {rec}")
-
-        filepath.write_text("\n".join(lines), encoding="utf-8")
-        log.info("weekly_report_generated", path=str(filepath))
-        return filepath
+            yield from _SECTION_EMERGING_TECHNOLOGIES
+            yield _bullets(synthesis.emerging_technologies)
+            yield ""
+
+        yield from _SECTION_RECOMMENDATIONS
+        if synthesis.recommendations:
+            yield _bullets(synthesis.recommendations)
 
     def generate_monthly(self, synthesis: MonthlySynthesis) -> Path:
         """Generate monthly report markdown."""
-        month = synthesis.month
-        filepath = self.output_dir / "monthly" / f"{month}.md"
-
-        lines = [
-            f"# AI Architect Monthly Report",
-            "",
-            f"**Month:** {month}",
-            f"**Relevance Score:** {synthesis.relevance_score}/10",
-            "",
-            "---",
-            "",
-            "## Executive Summary",
-            "",
-            synthesis.summary,
-            "",
-            "## Major Developments",
-            "",
-        ]
+        filepath = self.output_dir / "monthly" / f"{synthesis.month}.md"
+        _write_lines(filepath, self._iter_monthly_lines(synthesis))
+        log.info("monthly_report_generated", path=str(filepath))
+        return filepath
+
+    def _iter_monthly_lines(self, synthesis: MonthlySynthesis) -> Iterator[str]:
+        """Yield monthly report markdown lines."""
+        yield "# AI Architect Monthly Report"
+        yield ""
+        yield f"**Month:** {synthesis.month}"
+        yield f"**Relevance Score:** {synthesis.relevance_score}/10"
+        yield from _SECTION_EXECUTIVE_SUMMARY
+        yield synthesis.summary
+        yield from _SECTION_MAJOR_DEVELOPMENTS
 
         for dev in synthesis.major_developments:
-            lines.append(f"### {dev.get('title', 'Untitled')}")
+            yield f"### {dev.get('title', 'Untitled')}"
             if dev.get("impact"):
-                lines.append(f"**Impact:** {dev['impact']}")
+                yield f"**Impact:** {dev['impact']}"
             if dev.get("timeline"):
-                lines.append(f"**Timeline:** {dev['timeline']}")
-            lines.append("")
+                yield f"**Timeline:** {dev['timeline']}"
+            yield ""
 
-        lines.extend([
-            "## Trend Analysis",
-            "",
-            synthesis.trend_analysis,
-            "",
-        ])
+        yield from _SECTION_TREND_ANALYSIS
+        yield synthesis.trend_analysis
+        yield ""
 
         if synthesis.ecosystem_changes:
-            lines.extend([
-                "## Ecosystem Changes",
-                "",
-            ])
-            for change in synthesis.ecosystem_changes:
-                lines.append(f"- {change}")
-            lines.append("")
-
-        lines.extend([
-            "## Competitive Landscape",
-            "",
-            synthesis.competitive_landscape,
-            "",
-        ])
+            yield from _SECTION_ECOSYSTEM_CHANGES
+            yield _bullets(synthesis.ecosystem_changes)
+            yield ""
+
+        yield from _SECTION_COMPETITIVE_LANDSCAPE
+        yield synthesis.competitive_landscape
+        yield ""
 
         if synthesis.predictions:
-            lines.extend([
-                "## Predictions",
-                "",
-            ])
-            for pred in synthesis.predictions:
-                lines.append(f"- {pred}")
-            lines.append("")
-
-        lines.extend([
-            "## Recommendations",
-            "",
-        ])
-        for rec in synthesis.recommendations:
-            lines.append(f"- {rec}")
-
-        filepath.write_text("\n".join(lines), encoding="utf-8")
-        log.info("monthly_report_generated", path=str(filepath))
-        return filepath
+            yield from _SECTION_PREDICTIONS
+            yield _bullets(synthesis.predictions)
+            yield ""
+
+        yield from _SECTION_RECOMMENDATIONS
+        if synthesis.recommendations:
+            yield _bullets(synthesis.recommendations)
 
     def update_index(self, daily_files: list[Path] | None = None) -> Path:
         """Update the main index file."""
         filepath = self.output_dir / "index.md"
+        _write_lines(filepath, self._iter_index_lines())
+        log.info("index_updated", path=str(filepath))
+        return filepath
+
+    def _iter_index_lines(self) -> Iterator[str]:
+        """Yield index markdown lines."""
+        yield "# AI Architect - Knowledge Index"
+        yield ""
+        yield f"*Last updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}*"
+        yield ""
+        yield "---"
+        yield ""
+        yield "## Recent Digests"
+        yield ""
 
-        lines = [
-            "# AI Architect - Knowledge Index",
-            "",
-            f"*Last updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}*",
-            "",
-            "---",
-            "",
-            "## Recent Digests",
-            "",
-        ]
+        recent = self._recent_reports()
 
         # List recent daily files
-        daily_dir = self.output_dir / "daily"
-        if daily_dir.exists():
-            daily_files = sorted(daily_dir.glob("*.md"), reverse=True)[:10]
-            for f in daily_files:
-                date = f.stem
-                lines.append(f"- [{date}](daily/{f.name})")
-
-        lines.extend([
-            "",
-            "## Weekly Reports",
-            "",
-        ])
-
-        weekly_dir = self.output_dir / "weekly"
-        if weekly_dir.exists():
-            weekly_files = sorted(weekly_dir.glob("*.md"), reverse=True)[:5]
-            for f in weekly_files:
-                lines.append(f"- [{f.stem}](weekly/{f.name})")
-
-        lines.extend([
-            "",
-            "## Monthly Reports",
-            "",
-        ])
-
-        monthly_dir = self.output_dir / "monthly"
-        if monthly_dir.exists():
-            monthly_files = sorted(monthly_dir.glob("*.md"), reverse=True)[:6]
-            for f in monthly_files:
-                lines.append(f"- [{f.stem}](monthly/{f.name})")
-
-        filepath.write_text("\n".join(lines), encoding="utf-8")
-        log.info("index_updated", path=str(filepath))
-        return filepath
+        for name in recent["daily"]:
+            yield f"- [{name[:-3]}](daily/{name})"
+
+        yield from _SECTION_INDEX_WEEKLY
+        for name in recent["weekly"]:
+            yield f"- [{name[:-3]}](weekly/{name})"
+
+        yield from _SECTION_INDEX_MONTHLY
+        for name in recent["monthly"]:
+            yield f"- [{name[:-3]}](monthly/{name})"
+
+    def _recent_reports(self) -> dict[str, list[str]]:
+        """
+        Find the newest report files for each indexed subdirectory.
+
+        Walks the output root once and only scans the report directories
+        that exist.
+
+        Returns:
+            Dict of subdirectory name -> newest file names, newest first
+        """
+        recent: dict[str, list[str]] = {subdir: [] for subdir in _INDEX_LIMITS}
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    limit = _INDEX_LIMITS.get(entry.name)
+                    if limit is not None and entry.is_dir():
+                        recent[entry.name] = _top_md(Path(entry.path), limit)
+        except FileNotFoundError:
+            pass
+        return recent
+
+
+_default_markdown_gen: MarkdownGenerator | None = None
+
+
+def _get_default_markdown_gen() -> MarkdownGenerator:
+    """Get or create the shared MarkdownGenerator instance."""
+    global _default_markdown_gen
+    if _default_markdown_gen is None:
+        _default_markdown_gen = MarkdownGenerator()
+    return _default_markdown_gen
 
 
 def generate_daily_digest(
@@ -360,5 +361,4 @@ def generate_daily_digest(
     items: list[tuple[CollectedItem, AnalysisResult | None]],
 ) -> Path:
     """Convenience function to generate daily digest."""
-    gen = MarkdownGenerator()
-    return gen.generate_daily(synthesis, items)
+    return _get_default_markdown_gen().generate_daily(synthesis, items)
@@ -4,6 +4,8 @@ AI Architect v2 - Vector Store (ChromaDB)
 Embedded ChromaDB for vector storage with ARM64 compatibility.
 """
 
+import hashlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +21,15 @@ log = get_logger("storage.vector_store")
 # Default collections as per plan
 DEFAULT_COLLECTIONS = ["items", "analysis", "synthesis", "snapshots"]
 
+# Texts per embedding call, and embeddings kept in memory for reuse
+EMBEDDING_BATCH_SIZE = 32
+EMBEDDING_CACHE_SIZE = 4096
+
+
+def _text_key(text: str) -> bytes:
+    """Compact content hash used to key cached embeddings."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
 
 class VectorStore:
     """
@@ -53,6 +64,7 @@ class VectorStore:
         # Initialize ChromaDB client (embedded mode)
         self._client: chromadb.Client | None = None
         self._collections: dict[str, chromadb.Collection] = {}
+        self._embedding_cache: OrderedDict[bytes, Any] = OrderedDict()
 
         log.info(
             "vector_store_init",
@@ -71,8 +83,18 @@ class VectorStore:
                     allow_reset=True,
                 ),
             )
+            self._warm_collections()
         return self._client
 
+    def _warm_collections(self) -> None:
+        """Resolve every configured collection handle once, up front."""
+        for name in self.collections:
+            if name not in self._collections:
+                self._collections[name] = self._client.get_or_create_collection(
+                    name=name,
+                    metadata={"hnsw:space": "l2"},
+                )
+
     def get_collection(self, name: str) -> chromadb.Collection:
         """
         Get or create a collection.
@@ -83,14 +105,24 @@ class VectorStore:
         Returns:
             Collection object
         """
-        if name not in self._collections:
-            self._collections[name] = self.client.get_or_create_collection(
+        # Configured collections are resolved when the client is created,
+        # so the common case is a single dict lookup
+        try:
+            return self._collections[name]
+        except KeyError:
+            pass
+
+        # First client access warms the configured collections
+        client = self.client
+        col = self._collections.get(name)
+        if col is None:
+            col = client.get_or_create_collection(
                 name=name,
                 metadata={"hnsw:space": "l2"},
             )
+            self._collections[name] = col
             log.debug("collection_created", name=name)
-
-        return self._collections[name]
+        return col
 
     def add(
         self,
@@ -124,7 +156,7 @@ class VectorStore:
 
     def search(
         self,
-        query: str,
+        query: str | list[str],
         collection: str = "items",
         n_results: int = 5,
         where: dict[str, Any] | None = None,
@@ -133,18 +165,18 @@ class VectorStore:
         Search for similar documents.
 
         Args:
-            query: Query text
+            query: Query text, or a list of query texts to run in one call
             collection: Collection to search
             n_results: Number of results
             where: Optional metadata filter
 
         Returns:
-            Dict with ids, documents, metadatas, distances
+            Dict with ids, documents, metadatas, distances (one list per query)
         """
         col = self.get_collection(collection)
 
         results = col.query(
-            query_texts=[query],
+            query_texts=[query] if isinstance(query, str) else query,
             n_results=n_results,
             where=where,
             include=["documents", "metadatas", "distances"],
@@ -179,23 +211,52 @@ class VectorStore:
 
         return results
 
-    def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+    def get_embeddings(
+        self,
+        texts: list[str],
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+    ) -> list[list[float]]:
         """
         Get embeddings for texts.
 
-        Uses ChromaDB's default embedding function.
+        Uses ChromaDB's default embedding function. Recently embedded texts
+        (by content hash, LRU of EMBEDDING_CACHE_SIZE) are served from
+        memory; the rest are embedded once each, in chunks of `batch_size`.
 
         Args:
             texts: Texts to embed
+            batch_size: Max texts per embedding call (bounds peak memory)
 
         Returns:
             List of embedding vectors
         """
-        # Get the default embedding function from a collection
-        col = self.get_collection("items")
-
-        # Use ChromaDB's embedding function
-        embeddings = col._embedding_function(texts)
+        keys = [_text_key(text) for text in texts]
+        cache = self._embedding_cache
+
+        # Unique texts not cached yet, in first-seen order; cached ones
+        # are marked as recently used
+        missing: dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key in cache:
+                cache.move_to_end(key)
+            elif key not in missing:
+                missing[key] = text
+
+        if missing:
+            # Get the default embedding function from a collection
+            embed = self.get_collection("items")._embedding_function
+            pending = list(missing.items())
+            for start in range(0, len(pending), batch_size):
+                chunk = pending[start:start + batch_size]
+                vectors = embed([text for _, text in chunk])
+                for (key, _), vector in zip(chunk, vectors):
+                    cache[key] = vector
+
+        embeddings = [cache[key] for key in keys]
+
+        # Keep the cache bounded: drop the least recently used entries
+        while len(cache) > EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
 
         return embeddings
 
@@ -277,10 +338,16 @@ class VectorStore:
         Returns:
             Dict of collection_name -> count
         """
+        try:
+            self.client  # Resolves every configured collection handle
+        except Exception:
+            return dict.fromkeys(self.collections, 0)
+
         stats = {}
+        collections = self._collections
         for name in self.collections:
             try:
-                stats[name] = self.count(name)
+                stats[name] = collections[name].count()
             except Exception:
                 stats[name] = 0
 
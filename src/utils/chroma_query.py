@@ -4,6 +4,12 @@ ChromaDB Query Helper for chroma-query skill.
 Provides structured querying and formatting for Claude Code agents.
 """
 
+import argparse
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -12,12 +18,20 @@ from typing import Any
 from ..storage.vector_store import VectorStore
 
 
+# Recent query results, reused when a session repeats a question
+QUERY_CACHE_SIZE = 128
+QUERY_CACHE_TTL = 300  # seconds
+
+_query_cache: OrderedDict[tuple, tuple[float, list["QueryResult"]]] = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+
 class ChromaQueryError(Exception):
     """Exception raised when ChromaDB query fails."""
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """A single query result with structured fields."""
 
@@ -35,6 +49,44 @@ class QueryResult:
         return "unknown"
 
 
+def _parse_results(
+    raw_results: dict[str, Any],
+    collection: str,
+    cutoff_iso: str | None,
+) -> list[QueryResult]:
+    """Convert one collection's raw Chroma response into QueryResults."""
+    results: list[QueryResult] = []
+
+    ids = raw_results.get("ids", [[]])[0]
+    documents = raw_results.get("documents", [[]])[0]
+    metadatas = raw_results.get("metadatas", [[]])[0]
+    distances = raw_results.get("distances", [[]])[0]
+
+    # Chroma returns aligned lists for every included field
+    for doc_id, document, metadata, distance in zip(ids, documents, metadatas, distances):
+        metadata = metadata or {}
+
+        # Convert distance to similarity score (lower distance = higher score)
+        score = max(0.0, 1.0 - (distance / 2.0))
+
+        # Date filtering: zero-padded ISO-8601 strings sort chronologically,
+        # so compare them directly instead of parsing each one
+        if cutoff_iso:
+            date_field = metadata.get("date")
+            if isinstance(date_field, str) and date_field < cutoff_iso:
+                continue
+
+        results.append(QueryResult(
+            title=metadata.get("title", doc_id),
+            content=document or "",
+            source=collection,
+            score=round(score, 2),
+            metadata=metadata,
+        ))
+
+    return results
+
+
 def query_chromadb(
     query: str,
     collections: list[str] | None = None,
@@ -45,6 +97,9 @@ def query_chromadb(
     """
     Query ChromaDB collections and return structured results.
 
+    Non-empty results are cached for QUERY_CACHE_TTL seconds, keyed by
+    every argument, so repeated questions skip the embedding and search.
+
     Args:
         query: Search query text
         collections: Collections to search (default: ["items", "analysis"])
@@ -61,59 +116,81 @@ def query_chromadb(
     if collections is None:
         collections = ["items", "analysis"]
 
+    key = (query, tuple(collections), str(persist_directory), n_results, days)
+    now = time.monotonic()
+    with _query_cache_lock:
+        cached = _query_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                _query_cache.move_to_end(key)
+                return list(cached[1])
+            del _query_cache[key]
+
+    results = _query_collections(query, collections, persist_directory, n_results, days)
+
+    # Empty results may come from a transient failure; don't pin them
+    if results:
+        with _query_cache_lock:
+            _query_cache[key] = (now + QUERY_CACHE_TTL, results)
+            _query_cache.move_to_end(key)
+            while len(_query_cache) > QUERY_CACHE_SIZE:
+                _query_cache.popitem(last=False)
+
+    return list(results)
+
+
+def clear_query_cache() -> None:
+    """Drop cached query results (for testing)."""
+    with _query_cache_lock:
+        _query_cache.clear()
+
+
+def _query_collections(
+    query: str,
+    collections: list[str],
+    persist_directory: str | Path | None,
+    n_results: int,
+    days: int | None,
+) -> list[QueryResult]:
+    """Run a query against ChromaDB (uncached part of query_chromadb)."""
     try:
         vs = VectorStore(persist_directory=persist_directory)
     except Exception as e:
         raise ChromaQueryError(f"Failed to initialize VectorStore: {e}") from e
 
-    all_results: list[QueryResult] = []
-    cutoff_date = None
+    cutoff_iso = None
 
     if days is not None:
-        cutoff_date = datetime.now() - timedelta(days=days)
+        cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat()
+
+    # Embed the query once and reuse the vector for every collection
+    try:
+        embedding = vs.get_embeddings([query])[0]
+    except Exception:
+        return []
 
-    for collection in collections:
+    def search_collection(collection: str) -> list[QueryResult]:
         try:
-            raw_results = vs.search(
-                query=query,
+            raw_results = vs.search_by_embedding(
+                embedding,
                 collection=collection,
                 n_results=n_results,
             )
+        except Exception:
+            # Skip this collection but keep the others
+            return []
+        return _parse_results(raw_results, collection, cutoff_iso)
 
-            # Parse results
-            ids = raw_results.get("ids", [[]])[0]
-            documents = raw_results.get("documents", [[]])[0]
-            metadatas = raw_results.get("metadatas", [[]])[0]
-            distances = raw_results.get("distances", [[]])[0]
-
-            for i, doc_id in enumerate(ids):
-                metadata = metadatas[i] if i < len(metadatas) else {}
-                distance = distances[i] if i < len(distances) else 1.0
-
-                # Convert distance to similarity score (lower distance = higher score)
-                score = max(0.0, 1.0 - (distance / 2.0))
-
-                # Date filtering
-                if cutoff_date and "date" in metadata:
-                    try:
-                        item_date = datetime.fromisoformat(metadata["date"])
-                        if item_date < cutoff_date:
-                            continue
-                    except (ValueError, TypeError):
-                        pass
-
-                result = QueryResult(
-                    title=metadata.get("title", doc_id),
-                    content=documents[i] if i < len(documents) else "",
-                    source=collection,
-                    score=round(score, 2),
-                    metadata=metadata,
-                )
-                all_results.append(result)
-
-        except Exception as e:
-            # Log but continue with other collections
-            continue
+    all_results: list[QueryResult] = []
+    if len(collections) <= 1:
+        for collection in collections:
+            all_results.extend(search_collection(collection))
+    else:
+        # Chroma releases the GIL during the HNSW search, so collections
+        # are queried concurrently; results are gathered in collection order
+        with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+            for results in executor.map(search_collection, collections):
+                all_results.extend(results)
 
     # Sort by score descending
     all_results.sort(key=lambda r: r.score, reverse=True)
@@ -121,6 +198,10 @@ def query_chromadb(
     return all_results
 
 
+# One numbered entry in the "Fuentes" section of format_results_markdown
+_RESULT_TMPL = "{i}. **{title}** - {date} - score: {score}\n   > {preview}\n\n"
+
+
 def format_results_markdown(results: list[QueryResult], query: str) -> str:
     """
     Format query results as structured markdown.
@@ -144,74 +225,72 @@ No se encontraron resultados para: "{query}"
 - Prueba con palabras clave alternativas
 """
 
-    # Build summary
-    top_sources = set(r.source for r in results[:3])
-    sources_str = ", ".join(top_sources)
-
-    lines = [
-        f"## Resumen",
-        f"",
-        f"Encontrados {len(results)} resultados para \"{query}\" en: {sources_str}",
-        f"",
-        f"## Fuentes ({len(results)} resultados)",
-        f"",
-    ]
-
-    for i, result in enumerate(results, 1):
-        lines.append(f"{i}. **{result.title}** - {result.date_str} - score: {result.score}")
-        # Truncate content for preview
-        content_preview = result.content[:200]
-        if len(result.content) > 200:
-            content_preview += "..."
-        lines.append(f"   > {content_preview}")
-        lines.append("")
-
-    # Add details section
-    lines.extend([
-        "## Detalles",
-        "",
-    ])
-
-    # Group by source
-    by_source: dict[str, list[QueryResult]] = {}
-    for r in results:
-        by_source.setdefault(r.source, []).append(r)
-
-    for source, source_results in by_source.items():
-        lines.append(f"### {source.capitalize()} ({len(source_results)} resultados)")
-        lines.append("")
-
-        # Extract key terms from titles
-        titles = [r.title for r in source_results[:5]]
-        lines.append("Temas principales:")
-        for title in titles:
-            lines.append(f"- {title}")
-        lines.append("")
-
-    return "\n".join(lines)
+    # Build summary (dict.fromkeys keeps first-seen order, unlike a set)
+    sources_str = ", ".join(dict.fromkeys(r.source for r in results[:3]))
+
+    header = (
+        f"## Resumen\n\n"
+        f"Encontrados {len(results)} resultados para \"{query}\" en: {sources_str}\n\n"
+        f"## Fuentes ({len(results)} resultados)\n\n"
+    )
+
+    # One pass: render the numbered list and group by source together
+    numbered: list[str] = []
+    by_source: dict[str, list[QueryResult]] = defaultdict(list)
+    for i, r in enumerate(results, 1):
+        content = r.content
+        numbered.append(_RESULT_TMPL.format(
+            i=i,
+            title=r.title,
+            date=r.date_str,
+            score=r.score,
+            # Truncate content for preview
+            preview=content[:200] + "..." if len(content) > 200 else content,
+        ))
+        by_source[r.source].append(r)
+
+    # Extract key terms from titles
+    details = "\n".join(
+        f"### {source.capitalize()} ({len(source_results)} resultados)\n\n"
+        "Temas principales:\n"
+        + "".join(f"- {r.title}\n" for r in source_results[:5])
+        for source, source_results in by_source.items()
+    )
+
+    return "".join((header, *numbered, "## Detalles\n\n", details))
 
 
 # CLI entry point for skill usage
-def main():
-    """CLI entry point for chroma-query skill."""
-    import argparse
-    import sys
-
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the chroma-query CLI parser."""
     parser = argparse.ArgumentParser(description="Query ChromaDB")
     parser.add_argument("query", help="Search query")
     parser.add_argument("--days", type=int, help="Filter to last N days")
     parser.add_argument("--collection", choices=["items", "analysis", "both"],
                        default="both", help="Collection to search")
     parser.add_argument("--n-results", type=int, default=5, help="Max results")
+    return parser
 
-    args = parser.parse_args()
 
-    collections = ["items", "analysis"] if args.collection == "both" else [args.collection]
+# Built once at import so repeated in-process invocations reuse it
+_PARSER = _build_parser()
+
+# --collection choice -> collections to search
+_COLL_MAP = {
+    "both": ["items", "analysis"],
+    "items": ["items"],
+    "analysis": ["analysis"],
+}
+
+
+def main(argv: list[str] | None = None):
+    """CLI entry point for chroma-query skill."""
+    args = _PARSER.parse_args(argv)
 
     try:
         results = query_chromadb(
             query=args.query,
-            collections=collections,
+            collections=_COLL_MAP[args.collection],
             n_results=args.n_results,
             days=args.days,
         )
@@ -4,15 +4,31 @@ AI Architect v2 - Configuration Loader
 Loads configuration from config.yaml with environment variable support.
 """
 
+import functools
+import json
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, get_args, get_origin
 
 import yaml
-from pydantic import BaseModel, Field
+from dotenv import dotenv_values
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings
 
+try:
+    # LibYAML C parser (bundled with the PyYAML wheels on most platforms)
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python fallback
+    from yaml import SafeLoader as _SafeLoader
 
-class ModelsConfig(BaseModel):
+
+class _ConfigModel(BaseModel):
+    """Base for config sections: frozen, so loaded configs can be shared."""
+    model_config = ConfigDict(frozen=True)
+
+
+class ModelsConfig(_ConfigModel):
     """Model configuration."""
     # Provider: "claude" or "glm"
     provider: str = "claude"
@@ -24,37 +40,39 @@ class ModelsConfig(BaseModel):
     glm_synthesis: str = "glm-4-plus"
 
 
-class ThresholdsConfig(BaseModel):
+class ThresholdsConfig(_ConfigModel):
     """Processing thresholds."""
     signal_score_min: int = Field(default=4, ge=1, le=10)
     novelty_score_min: float = Field(default=0.3, ge=0.0, le=1.0)
     batch_size: int = Field(default=10, ge=1, le=50)
     # Rate limiting delays (seconds)
     request_delay: float = Field(default=5.0, ge=0.0, le=60.0)  # Delay between individual API calls
-    batch_delay: float = Field(default=3.0, ge=0.0, le=60.0)    # Delay between batch API calls
+    claude_rpm: int = Field(default=20, ge=1, le=10000)        # Ranking calls per minute per model
+    analysis_concurrency: int = Field(default=4, ge=1, le=32)  # Analysis requests in flight
+    rank_parallelism: int = Field(default=4, ge=1, le=16)      # Ranking batches in flight
 
 
-class GitHubRepoConfig(BaseModel):
+class GitHubRepoConfig(_ConfigModel):
     """GitHub repository configuration."""
     owner: str
     repo: str
 
 
-class DocsCollectorConfig(BaseModel):
+class DocsCollectorConfig(_ConfigModel):
     """Documentation collector configuration."""
     enabled: bool = True
     sources: list[str] = []
     snapshot_dir: str = "data/snapshots"
 
 
-class GitHubSignalsCollectorConfig(BaseModel):
+class GitHubSignalsCollectorConfig(_ConfigModel):
     """GitHub signals collector configuration."""
     enabled: bool = True
     repos: list[GitHubRepoConfig] = []
     max_items: int = 50
 
 
-class GitHubEmergingCollectorConfig(BaseModel):
+class GitHubEmergingCollectorConfig(_ConfigModel):
     """GitHub emerging repos collector configuration."""
     enabled: bool = True
     max_stars: int = 100
@@ -63,7 +81,7 @@ class GitHubEmergingCollectorConfig(BaseModel):
     max_items: int = 30
 
 
-class GitHubReposCollectorConfig(BaseModel):
+class GitHubReposCollectorConfig(_ConfigModel):
     """GitHub consolidated repos collector configuration."""
     enabled: bool = True
     min_stars: int = 100
@@ -71,20 +89,20 @@ class GitHubReposCollectorConfig(BaseModel):
     max_items: int = 30
 
 
-class FeedConfig(BaseModel):
+class FeedConfig(_ConfigModel):
     """RSS feed configuration."""
     name: str
     url: str
 
 
-class BlogsCollectorConfig(BaseModel):
+class BlogsCollectorConfig(_ConfigModel):
     """Blogs collector configuration."""
     enabled: bool = True
     feeds: list[FeedConfig] = []
     max_items: int = 20
 
 
-class StackOverflowCollectorConfig(BaseModel):
+class StackOverflowCollectorConfig(_ConfigModel):
     """StackOverflow collector configuration."""
     enabled: bool = True
     tags: list[str] = []
@@ -92,7 +110,7 @@ class StackOverflowCollectorConfig(BaseModel):
     max_items: int = 30
 
 
-class CollectorsConfig(BaseModel):
+class CollectorsConfig(_ConfigModel):
     """All collectors configuration."""
     docs: DocsCollectorConfig = DocsCollectorConfig()
     github_signals: GitHubSignalsCollectorConfig = GitHubSignalsCollectorConfig()
@@ -102,18 +120,18 @@ class CollectorsConfig(BaseModel):
     stackoverflow: StackOverflowCollectorConfig = StackOverflowCollectorConfig()
 
 
-class ChromaDBConfig(BaseModel):
+class ChromaDBConfig(_ConfigModel):
     """ChromaDB storage configuration."""
     persist_directory: str = "data/chromadb"
     collections: list[str] = ["items", "analysis", "synthesis", "snapshots"]
 
 
-class StorageConfig(BaseModel):
+class StorageConfig(_ConfigModel):
     """Storage configuration."""
     chromadb: ChromaDBConfig = ChromaDBConfig()
 
 
-class OutputConfig(BaseModel):
+class OutputConfig(_ConfigModel):
     """Output directories configuration."""
     daily_dir: str = "output/daily"
     weekly_dir: str = "output/weekly"
@@ -124,14 +142,14 @@ class OutputConfig(BaseModel):
     index_file: str = "output/index.md"
 
 
-class NtfyConfig(BaseModel):
+class NtfyConfig(_ConfigModel):
     """ntfy.sh notification configuration."""
     enabled: bool = True
     topic: str = "ai-architect"
     url: str = "https://ntfy.sh"
 
 
-class EmailConfig(BaseModel):
+class EmailConfig(_ConfigModel):
     """Email notification configuration (Gmail SMTP)."""
     enabled: bool = False
     smtp_host: str = "smtp.gmail.com"
@@ -146,19 +164,19 @@ class EmailConfig(BaseModel):
     send_on_modes: list[str] = ["daily"]
 
 
-class NotificationsConfig(BaseModel):
+class NotificationsConfig(_ConfigModel):
     """Notifications configuration."""
     ntfy: NtfyConfig = NtfyConfig()
     email: EmailConfig = EmailConfig()
 
 
-class LoggingConfig(BaseModel):
+class LoggingConfig(_ConfigModel):
     """Logging configuration."""
     level: str = "INFO"
     format: str = "json"  # json | text
 
 
-class Config(BaseModel):
+class Config(_ConfigModel):
     """Main configuration model."""
     models: ModelsConfig = ModelsConfig()
     thresholds: ThresholdsConfig = ThresholdsConfig()
@@ -169,6 +187,23 @@ class Config(BaseModel):
     notifications: NotificationsConfig = NotificationsConfig()
     logging: LoggingConfig = LoggingConfig()
 
+    @classmethod
+    def trusted_construct(cls, data: dict[str, Any]) -> "Config":
+        """
+        Build a Config from data that has already been validated.
+
+        Skips pydantic validation for the whole tree (sub-models, and
+        lists of sub-models, are built with model_construct). Only use
+        it on data produced by a validated Config, such as its JSON dump.
+
+        Args:
+            data: Config data as produced by model_dump
+
+        Returns:
+            Config object
+        """
+        return _construct(cls, data)
+
 
 class Settings(BaseSettings):
     """Environment-based settings."""
@@ -186,56 +221,207 @@ class Settings(BaseSettings):
         """Get GLM API key from either variable."""
         return self.glm_api_key or self.zhipuai_api_key
 
+    @classmethod
+    def cached(cls) -> "Settings":
+        """
+        Build settings using a cached parse of the .env file.
+
+        Environment variables still take precedence over .env values.
+
+        Returns:
+            Settings instance
+        """
+        environ = {key.lower() for key in os.environ}
+        values = {
+            key: value
+            for key, value in _load_env(cls.model_config["env_file"]).items()
+            if key in cls.model_fields and key not in environ
+        }
+        return cls(_env_file=None, **values)
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         extra = "ignore"
 
 
-def load_config(config_path: str | Path = "config.yaml") -> Config:
+@functools.lru_cache(maxsize=8)
+def _parse_env(path: Path, mtime_ns: int) -> dict[str, str]:
+    """Parse a .env file (cached per modification time)."""
+    return {
+        key.lower(): value
+        for key, value in dotenv_values(path, encoding="utf-8").items()
+        if value is not None
+    }
+
+
+def _load_env(path: str | Path = ".env") -> dict[str, str]:
+    """
+    Load .env values with lowercased keys, re-parsing only when the file changes.
+
+    Args:
+        path: Path to the .env file
+
+    Returns:
+        Parsed values (empty if the file does not exist)
+    """
+    path = Path(path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {}
+    return _parse_env(path, mtime_ns)
+
+
+# Parsed configs keyed by resolved path: (mtime_ns, size, config)
+_LOAD_CACHE: OrderedDict[Path, tuple[int, int, Config]] = OrderedDict()
+_LOAD_CACHE_SIZE = 8
+
+# Bump when the Config schema changes to invalidate on-disk JSON caches
+CONFIG_CACHE_VERSION = 1
+
+
+def _is_model(annotation: Any) -> bool:
+    """Whether a field annotation is a pydantic model class."""
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _construct(model_cls: type[BaseModel], data: dict[str, Any]) -> BaseModel:
+    """Build a model from already-validated data without re-validating."""
+    values = {}
+    for name, value in data.items():
+        field = model_cls.model_fields.get(name)
+        if field is None:
+            continue
+        annotation = field.annotation
+        if _is_model(annotation) and isinstance(value, dict):
+            value = _construct(annotation, value)
+        elif get_origin(annotation) is list and isinstance(value, list):
+            item_cls = (get_args(annotation) or (None,))[0]
+            if _is_model(item_cls):
+                value = [_construct(item_cls, v) if isinstance(v, dict) else v for v in value]
+        values[name] = value
+    return model_cls.model_construct(**values)
+
+
+def _json_cache_path(config_path: Path) -> Path:
+    """Location of the parsed-config JSON cache (config.yaml -> .config.cache.json)."""
+    return config_path.with_name(f".{config_path.stem}.cache.json")
+
+
+def _cache_header(stat: os.stat_result) -> dict[str, int]:
+    """Header identifying the YAML file (and schema version) a JSON cache was built from."""
+    return {"version": CONFIG_CACHE_VERSION, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _read_json_cache(config_path: Path, stat: os.stat_result) -> Config | None:
+    """Load a previously validated config from its JSON cache, if still fresh."""
+    try:
+        with _json_cache_path(config_path).open("rb") as f:
+            if json.loads(f.readline()) != _cache_header(stat):
+                return None
+            return Config.trusted_construct(json.loads(f.read()))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json_cache(config_path: Path, stat: os.stat_result, config: Config) -> None:
+    """Write the JSON cache atomically; a read-only config directory is not an error."""
+    cache_path = _json_cache_path(config_path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps(_cache_header(stat)) + "\n" + config.model_dump_json(),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+
+
+def load_config(
+    config_path: str | Path = "config.yaml",
+    use_cache: bool = True,
+    validate: bool = True,
+) -> Config:
     """
     Load configuration from YAML file.
 
+    Parsed files are cached by modification time and size: in memory for
+    this process, and as a JSON file next to the YAML (loaded without
+    re-running validation) for later processes.
+
     Args:
         config_path: Path to config.yaml file
+        use_cache: Reuse a cached parse of an unchanged file
+        validate: Validate the YAML data; when False the file is trusted,
+            built with Config.trusted_construct, and not cached
 
     Returns:
-        Config object with validated settings
+        Config object with validated settings (frozen; shared between callers)
     """
     config_path = Path(config_path)
 
-    if not config_path.exists():
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
         return Config()
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+    key = config_path.resolve()
+    config = None
+    if use_cache:
+        cached = _LOAD_CACHE.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            _LOAD_CACHE.move_to_end(key)
+            return cached[2]
+        config = _read_json_cache(config_path, stat)
+
+    if config is None:
+        # Binary handle: the loader detects the encoding and reads in chunks
+        with config_path.open("rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader) or {}
+
+        if not validate:
+            return Config.trusted_construct(data)
+
+        config = Config(**data)
+        _write_json_cache(config_path, stat, config)
+
+    _LOAD_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config)
+    _LOAD_CACHE.move_to_end(key)
+    while len(_LOAD_CACHE) > _LOAD_CACHE_SIZE:
+        _LOAD_CACHE.popitem(last=False)
 
-    return Config(**data)
+    return config
 
 
-# Global instances
-_config: Config | None = None
-_settings: Settings | None = None
+# Where get_config loads from; reload_config repoints it
+_config_source: dict[str, Any] = {"config_path": "config.yaml", "validate": True}
 
 
+@functools.cache
 def get_config() -> Config:
     """Get or create configuration instance."""
-    global _config
-    if _config is None:
-        _config = load_config()
-    return _config
+    return load_config(**_config_source)
 
 
+@functools.cache
 def get_settings() -> Settings:
     """Get or create settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings.cached()
 
 
-def reload_config(config_path: str | Path = "config.yaml") -> Config:
-    """Reload configuration from file."""
-    global _config
-    _config = load_config(config_path)
-    return _config
+def reload_config(config_path: str | Path = "config.yaml", unsafe: bool = False) -> Config:
+    """
+    Reload configuration from file.
+
+    Args:
+        config_path: Path to config.yaml file
+        unsafe: Skip validation (for trusted, previously validated files)
+
+    Returns:
+        Reloaded Config object
+    """
+    _config_source.update(config_path=config_path, validate=not unsafe)
+    get_config.cache_clear()
+    return get_config()
@@ -4,6 +4,7 @@ AI Architect v2 - Structured Logging
 Provides JSON structured logging with component-aware formatting.
 """
 
+import functools
 import logging
 import sys
 from datetime import datetime, timezone
@@ -15,24 +16,28 @@ from structlog.types import Processor
 from .config import get_config
 
 
-def add_timestamp(
-    logger: logging.Logger,
-    method_name: str,
-    event_dict: dict[str, Any],
-) -> dict[str, Any]:
-    """Add ISO timestamp to log entry."""
-    event_dict["timestamp"] = datetime.now(timezone.utc).isoformat()
-    return event_dict
+# Method names that log under another level name (as structlog maps them)
+_LEVEL_ALIASES = {"warn": "warning", "exception": "error"}
 
 
-def add_component(
+def add_standard_fields(
     logger: logging.Logger,
     method_name: str,
     event_dict: dict[str, Any],
 ) -> dict[str, Any]:
-    """Ensure component field exists."""
-    if "component" not in event_dict:
-        event_dict["component"] = "unknown"
+    """
+    Add context variables, level, logger name and UTC timestamp.
+
+    One processor doing the work of merge_contextvars, add_log_level,
+    add_logger_name and TimeStamper(fmt="iso", utc=True), so each record
+    pays for a single processor call.
+    """
+    for key, value in structlog.contextvars.get_contextvars().items():
+        event_dict.setdefault(key, value)
+    event_dict["level"] = _LEVEL_ALIASES.get(method_name, method_name)
+    record = event_dict.get("_record")
+    event_dict["logger"] = logger.name if record is None else record.name
+    event_dict["timestamp"] = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
     return event_dict
 
 
@@ -42,23 +47,31 @@ def get_log_level() -> str:
     return config.logging.level.upper()
 
 
-def configure_logging() -> None:
+# (level, format) that logging was last configured with
+_configured: tuple[str, str] | None = None
+
+
+def configure_logging(force: bool = False) -> None:
     """
     Configure structured logging for the application.
 
-    Call this once at application startup.
+    Call this once at application startup. Later calls with the same level
+    and format are no-ops, so handlers and processors are built once.
+
+    Args:
+        force: Reconfigure even if the level and format are unchanged
     """
+    global _configured
     config = get_config()
     log_level = get_log_level()
-    use_json = config.logging.format == "json"
+    log_format = config.logging.format
+    if not force and _configured == (log_level, log_format):
+        return
+    use_json = log_format == "json"
 
     # Shared processors for all loggers
     shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        add_timestamp,
-        add_component,
+        add_standard_fields,
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.StackInfoRenderer(),
         structlog.processors.UnicodeDecoder(),
@@ -85,6 +98,10 @@ def configure_logging() -> None:
         cache_logger_on_first_use=True,
     )
 
+    # Default component for records from loggers that did not bind one
+    # (merge_contextvars never overrides a logger's own binding)
+    structlog.contextvars.bind_contextvars(component="unknown")
+
     # Configure standard logging
     formatter = structlog.stdlib.ProcessorFormatter(
         foreign_pre_chain=shared_processors,
@@ -107,6 +124,8 @@ def configure_logging() -> None:
     logging.getLogger("chromadb").setLevel(logging.WARNING)
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
+    _configured = (log_level, log_format)
+
 
 def get_logger(component: str) -> structlog.stdlib.BoundLogger:
     """
@@ -125,11 +144,24 @@ def get_logger(component: str) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger().bind(component=component)
 
 
+# Package -> component prefix for the known src/ layout
+_COMPONENT_PREFIX = {
+    "collectors": "collector",
+    "processors": "processor",
+    "notifications": "notification",
+    "storage": "storage",
+    "utils": "util",
+}
+
+
 # Convenience function for creating component loggers
+@functools.cache
 def logger_for(module_name: str) -> structlog.stdlib.BoundLogger:
     """
     Create a logger for a module.
 
+    Loggers are cached per module name.
+
     Usage:
         log = logger_for(__name__)  # e.g., "src.collectors.github"
         log.info("starting_collection", source="github")
@@ -138,7 +170,7 @@ def logger_for(module_name: str) -> structlog.stdlib.BoundLogger:
     # e.g., "src.collectors.github_repos" -> "collector.github_repos"
     parts = module_name.split(".")
     if len(parts) >= 2:
-        component_type = parts[1].rstrip("s")  # "collectors" -> "collector"
+        component_type = _COMPONENT_PREFIX.get(parts[1]) or parts[1].rstrip("s")
         component_name = parts[2] if len(parts) > 2 else parts[1]
         component = f"{component_type}.{component_name}"
     else:
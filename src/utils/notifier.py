@@ -4,8 +4,12 @@ AI Architect v2 - Notifier
 Sends notifications via ntfy.sh (free, no dependencies, mobile push).
 """
 
+import atexit
+import functools
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from enum import Enum
-from typing import Any
+from typing import Any, Sequence
 
 import httpx
 
@@ -23,6 +27,43 @@ class Priority(str, Enum):
     URGENT = "urgent"
 
 
+# Static headers per priority; send copies one and adds the optional fields
+_BASE_HEADERS = {p: {"Priority": p.value} for p in Priority}
+
+_send_pool: ThreadPoolExecutor | None = None
+_send_pool_lock = threading.Lock()
+
+
+def _get_send_pool() -> ThreadPoolExecutor:
+    """Get or create the background pool for notification sends."""
+    global _send_pool
+    with _send_pool_lock:
+        if _send_pool is None:
+            _send_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notify")
+            # Let queued notifications go out before the interpreter exits
+            atexit.register(_send_pool.shutdown, wait=True)
+        return _send_pool
+
+
+# Message templates and tags for the notify_* helpers
+_DAILY_TMPL = (
+    "✅ Daily cycle complete\n"
+    "Items: {analyzed} analyzed, {discarded} discarded\n"
+    "Relevance: {score}/10"
+)
+_DAILY_ERRORS_TMPL = "⚠️ Daily cycle with errors\nItems: {analyzed} analyzed\nErrors in: {failed}"
+_WEEKLY_TMPL = "📊 Weekly synthesis\nRelevance: {score}/10\n\nPatterns:\n{patterns}"
+_MONTHLY_TMPL = "📈 Monthly report\nRelevance: {score}/10"
+_CRITICAL_TMPL = "🚨 {title}\n{source} — {url}"
+
+_DAILY_TAGS = ("white_check_mark", "robot")
+_DAILY_ERRORS_TAGS = ("warning", "robot")
+_FAILED_TAGS = ("rotating_light", "x")
+_WEEKLY_TAGS = ("chart_with_upwards_trend", "robot")
+_MONTHLY_TAGS = ("bar_chart", "robot")
+_CRITICAL_TAGS = ("rotating_light", "fire")
+
+
 class Notifier:
     """
     Sends notifications via ntfy.sh.
@@ -35,6 +76,7 @@ class Notifier:
         self,
         topic: str | None = None,
         enabled: bool | None = None,
+        background: bool = False,
     ):
         """
         Initialize notifier.
@@ -42,6 +84,8 @@ class Notifier:
         Args:
             topic: ntfy.sh topic name
             enabled: Whether notifications are enabled
+            background: Send notify_* messages on a background thread, so
+                callers never wait on the network
         """
         config = get_config()
         settings = get_settings()
@@ -49,13 +93,46 @@ class Notifier:
         self.topic = topic or config.notifications.ntfy.topic or settings.ntfy_topic
         self.enabled = enabled if enabled is not None else config.notifications.ntfy.enabled
         self.base_url = config.notifications.ntfy.url or "https://ntfy.sh"
+        self._topic_path = f"/{self.topic}"
+
+        self.background = background
+
+        # Created on first send; reused so connections stay pooled
+        self._client: httpx.Client | None = None
+        self._client_lock = threading.Lock()
+        self._pending: list[Future] = []
+
+    @property
+    def client(self) -> httpx.Client:
+        """Lazy load the pooled HTTP client."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.base_url,
+                        timeout=10,
+                        headers={"User-Agent": "ai-architect"},
+                    )
+        return self._client
+
+    def close(self) -> None:
+        """Close the HTTP client's connection pool."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "Notifier":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def send(
         self,
         message: str,
         title: str | None = None,
         priority: Priority = Priority.DEFAULT,
-        tags: list[str] | None = None,
+        tags: Sequence[str] | None = None,
         click_url: str | None = None,
     ) -> bool:
         """
@@ -75,11 +152,7 @@ class Notifier:
             log.debug("notifications_disabled")
             return False
 
-        url = f"{self.base_url}/{self.topic}"
-
-        headers = {
-            "Priority": priority.value,
-        }
+        headers = _BASE_HEADERS[priority].copy()
 
         if title:
             headers["Title"] = title
@@ -91,13 +164,12 @@ class Notifier:
             headers["Click"] = click_url
 
         try:
-            with httpx.Client(timeout=10) as client:
-                response = client.post(
-                    url,
-                    content=message,
-                    headers=headers,
-                )
-                response.raise_for_status()
+            response = self.client.post(
+                self._topic_path,
+                content=message,
+                headers=headers,
+            )
+            response.raise_for_status()
 
             log.info(
                 "notification_sent",
@@ -115,6 +187,40 @@ class Notifier:
             )
             return False
 
+    def send_async(self, message: str, **kwargs: Any) -> Future:
+        """
+        Send a notification on a background thread.
+
+        Args:
+            message: Notification message
+            **kwargs: Other `send` arguments
+
+        Returns:
+            Future resolving to True if sent successfully
+        """
+        self._pending = [f for f in self._pending if not f.done()]
+        future = _get_send_pool().submit(self.send, message, **kwargs)
+        self._pending.append(future)
+        return future
+
+    def flush(self, timeout: float | None = None) -> None:
+        """
+        Wait for background notifications to go out.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        """
+        if self._pending:
+            wait(self._pending, timeout=timeout)
+            self._pending = [f for f in self._pending if not f.done()]
+
+    def _deliver(self, message: str, **kwargs: Any) -> bool:
+        """Send now, or queue the send when running in background mode."""
+        if self.background:
+            self.send_async(message, **kwargs)
+            return True
+        return self.send(message, **kwargs)
+
     def notify_daily_complete(
         self,
         date: str,
@@ -134,26 +240,24 @@ class Notifier:
             highlight: Optional highlight text
 
         Returns:
-            True if sent successfully
+            True if sent successfully (or queued, in background mode)
         """
         title = f"AI Architect - {date}"
 
-        lines = [
-            "✅ Daily cycle complete",
-            f"Items: {items_analyzed} analyzed, {items_discarded} discarded",
-            f"Relevance: {relevance_score}/10",
-        ]
+        message = _DAILY_TMPL.format(
+            analyzed=items_analyzed,
+            discarded=items_discarded,
+            score=relevance_score,
+        )
 
         if highlight:
-            lines.append(f"Highlight: {highlight[:100]}")
+            message += f"\nHighlight: {highlight[:100]}"
 
-        message = "\n".join(lines)
-
-        return self.send(
+        return self._deliver(
             message=message,
             title=title,
             priority=Priority.DEFAULT,
-            tags=["white_check_mark", "robot"],
+            tags=_DAILY_TAGS,
         )
 
     def notify_daily_errors(
@@ -171,21 +275,20 @@ class Notifier:
             failed_collectors: List of failed collector names
 
         Returns:
-            True if sent successfully
+            True if sent successfully (or queued, in background mode)
         """
         title = f"AI Architect - {date}"
 
-        message = (
-            "⚠️ Daily cycle with errors\n"
-            f"Items: {items_analyzed} analyzed\n"
-            f"Errors in: {', '.join(failed_collectors[:5])}"
+        message = _DAILY_ERRORS_TMPL.format(
+            analyzed=items_analyzed,
+            failed=", ".join(failed_collectors[:5]),
         )
 
-        return self.send(
+        return self._deliver(
             message=message,
             title=title,
             priority=Priority.HIGH,
-            tags=["warning", "robot"],
+            tags=_DAILY_ERRORS_TAGS,
         )
 
     def notify_cycle_failed(
@@ -201,15 +304,15 @@ class Notifier:
             error: Error message
 
         Returns:
-            True if sent successfully
+            True if sent successfully (or queued, in background mode)
         """
         title = f"AI Architect FAILED - {date}"
 
-        return self.send(
+        return self._deliver(
             message=f"🔴 {error[:500]}",
             title=title,
             priority=Priority.URGENT,
-            tags=["rotating_light", "x"],
+            tags=_FAILED_TAGS,
         )
 
     def notify_weekly_complete(
@@ -227,22 +330,20 @@ class Notifier:
             patterns: List of detected patterns
 
         Returns:
-            True if sent successfully
+            True if sent successfully (or queued, in background mode)
         """
         title = f"AI Architect Weekly - {week}"
 
-        pattern_text = "\n".join(f"- {p[:50]}" for p in patterns[:3])
-        message = (
-            "📊 Weekly synthesis\n"
-            f"Relevance: {relevance_score}/10\n"
-            f"\nPatterns:\n{pattern_text}"
+        message = _WEEKLY_TMPL.format(
+            score=relevance_score,
+            patterns="\n".join(f"- {p[:50]}" for p in patterns[:3]),
         )
 
-        return self.send(
+        return self._deliver(
             message=message,
             title=title,
             priority=Priority.DEFAULT,
-            tags=["chart_with_upwards_trend", "robot"],
+            tags=_WEEKLY_TAGS,
         )
 
     def notify_monthly_complete(
@@ -258,15 +359,15 @@ class Notifier:
             relevance_score: Month's relevance score
 
         Returns:
-            True if sent successfully
+            True if sent successfully (or queued, in background mode)
         """
         title = f"AI Architect Monthly - {month}"
 
-        return self.send(
-            message=f"📈 Monthly report\nRelevance: {relevance_score}/10",
+        return self._deliver(
+            message=_MONTHLY_TMPL.format(score=relevance_score),
             title=title,
             priority=Priority.DEFAULT,
-            tags=["bar_chart", "robot"],
+            tags=_MONTHLY_TAGS,
         )
 
     def notify_critical_signal(
@@ -284,31 +385,28 @@ class Notifier:
             url: Item URL
 
         Returns:
-            True if sent successfully
+            True if sent successfully (or queued, in background mode)
         """
         title = "Critical Signal Detected"
 
-        message = f"🚨 {title_text}\n{source} — {url}"
+        message = _CRITICAL_TMPL.format(title=title_text, source=source, url=url)
 
-        return self.send(
+        return self._deliver(
             message=message,
             title=title,
             priority=Priority.HIGH,
-            tags=["rotating_light", "fire"],
+            tags=_CRITICAL_TAGS,
             click_url=url,
         )
 
 
-# Global instance
-_notifier: Notifier | None = None
-
-
+@functools.cache
 def get_notifier() -> Notifier:
     """Get or create the global Notifier instance."""
-    global _notifier
-    if _notifier is None:
-        _notifier = Notifier()
-    return _notifier
+    # Notifications are fire-and-forget from the pipeline
+    notifier = Notifier(background=True)
+    atexit.register(notifier.close)
+    return notifier
 
 
 def notify_daily_complete(*args, **kwargs) -> bool:
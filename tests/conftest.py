@@ -11,3 +11,34 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
+
+import pytest
+
+from src.collectors.base import CollectedItem, SourceType
+from src.processors import client_factory
+
+
+@pytest.fixture(autouse=True)
+def no_client_warm_up(monkeypatch):
+    """Keep factory-created clients from pinging the API during tests."""
+    monkeypatch.setattr(client_factory, "WARM_UP_CLIENTS", False)
+
+
+@pytest.fixture
+def make_item():
+    """
+    Factory for numbered test items.
+
+    `make_item(i)` builds item-{i} ("Title {i}", "Content {i}", blogs);
+    pass a source type and any CollectedItem fields to override.
+    """
+    def make(i: int, source_type: SourceType = SourceType.BLOGS, **fields) -> CollectedItem:
+        defaults = {
+            "id": f"item-{i}",
+            "title": f"Title {i}",
+            "source_url": f"https://example.com/{i}",
+            "content": f"Content {i}",
+        }
+        return CollectedItem(source_type=source_type, **{**defaults, **fields})
+
+    return make
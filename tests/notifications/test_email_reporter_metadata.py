@@ -7,13 +7,13 @@ from src.notifications.email_reporter import EmailReporter
 class TestParseAnalysisItem:
     """Test _parse_analysis_item handles metadata correctly."""
 
-    @pytest.fixture
-    def reporter(self, tmp_path):
-        """Create email reporter with temp directories."""
+    @pytest.fixture(scope="module")
+    def reporter(self, tmp_path_factory):
+        """Create one email reporter (temp directories) for the module."""
         from pathlib import Path
         return EmailReporter(
             template_dir=Path(__file__).parent.parent.parent / "src" / "notifications" / "templates",
-            persist_directory=tmp_path / "chroma",
+            persist_directory=tmp_path_factory.mktemp("chroma"),
         )
 
     def test_signal_score_converted_to_int(self, reporter):
@@ -65,3 +65,35 @@ class TestParseAnalysisItem:
         assert item.summary == "Full summary text that is not truncated"
         assert item.signal_score == 9
         assert item.actionability == "high"
+
+
+class TestSpanishDetection:
+    """Test translation is skipped for text that is already Spanish."""
+
+    def test_spanish_text_detected(self):
+        """Spanish prose should be detected."""
+        from src.notifications.email_reporter import _looks_spanish
+
+        assert _looks_spanish("Claude Code añade soporte para los hooks de la sesión y mejora el rendimiento")
+
+    def test_english_text_not_detected(self):
+        """English technical text should not be detected as Spanish."""
+        from src.notifications.email_reporter import _looks_spanish
+
+        assert not _looks_spanish("Claude Code adds support for session hooks and improves performance")
+        assert not _looks_spanish("")
+
+    def test_translate_text_skips_spanish(self, tmp_path):
+        """_translate_text should return Spanish text without calling the API."""
+        from pathlib import Path
+        from unittest.mock import MagicMock
+
+        reporter = EmailReporter(
+            template_dir=Path(__file__).parent.parent.parent / "src" / "notifications" / "templates",
+            persist_directory=tmp_path / "chroma",
+        )
+        reporter.claude = MagicMock()
+
+        text = "El modelo es más rápido y la calidad de las respuestas es mejor"
+        assert reporter._translate_text(text, "resumen") == text
+        reporter.claude.complete_text.assert_not_called()
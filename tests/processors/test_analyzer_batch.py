@@ -0,0 +1,403 @@
+"""Tests for concurrent batch analysis."""
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.collectors.base import CollectedItem, SourceType
+from src.processors.analyzer import AnalysisResult, Analyzer
+from src.processors.claude_client import ClaudeResponse
+
+
+class TestAnalyzeBatchAsync:
+    """Test analyze_batch runs requests concurrently."""
+
+    @pytest.fixture
+    def client(self):
+        """Async client whose requests each take 0.2s."""
+        async def complete_async(prompt, max_tokens, expect_json):
+            await asyncio.sleep(0.2)
+            return ClaudeResponse(
+                content="{}",
+                model="test",
+                json_data={"summary": prompt.split("Title: ")[1].split("\n")[0], "confidence": 0.9},
+            )
+
+        client = Mock()
+        client.complete_async = complete_async
+        client.run = asyncio.run
+        client.aclose = AsyncMock()
+        return client
+
+    def test_requests_overlap(self, make_item, client):
+        """Batch wall time should be close to one request, not the sum."""
+        analyzer = Analyzer(client=client, store_results=False, cache_path=None, request_delay=0, concurrency=8)
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        items = [make_item(i) for i in range(8)]
+        start = time.perf_counter()
+        results = analyzer.analyze_batch(items)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
+        assert [item.id for item, _ in results] == [item.id for item in items]
+        assert [r.summary for _, r in results] == [item.title for item in items]
+        # The async client's pool outlives the batch
+        client.aclose.assert_not_awaited()
+
+    def test_concurrency_limit_respected(self, make_item, client):
+        """No more than `concurrency` requests should be in flight."""
+        in_flight = 0
+        peak = 0
+        inner = client.complete_async
+
+        async def tracking(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                return await inner(**kwargs)
+            finally:
+                in_flight -= 1
+
+        client.complete_async = tracking
+        analyzer = Analyzer(client=client, store_results=False, cache_path=None, request_delay=0, concurrency=2)
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        analyzer.analyze_batch([make_item(i) for i in range(6)])
+
+        assert peak == 2
+
+
+class TestAnalyzeGroup:
+    """Test grouped analysis maps array responses back to items."""
+
+    def test_one_request_per_group(self, make_item):
+        """Each group should be analyzed with a single request."""
+        client = Mock()
+        client.complete.side_effect = lambda prompt, max_tokens, expect_json: ClaudeResponse(
+            content="[]",
+            model="test",
+            json_data=[
+                {"id": f"item-{i}", "summary": f"Summary {i}", "confidence": 0.9}
+                for i in range(5)
+                if f'"id": "item-{i}"' in prompt
+            ],
+        )
+        analyzer = Analyzer(client=client, store_results=False, cache_path=None, request_delay=0)
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        results = analyzer.analyze_group([make_item(i) for i in range(5)], group_size=3)
+
+        assert client.complete.call_count == 2
+        assert [r.summary for _, r in results] == [f"Summary {i}" for i in range(5)]
+
+    def test_missing_item_falls_back_to_single_analysis(self, make_item):
+        """Items absent from the array response should be analyzed individually."""
+        client = Mock()
+        client.complete.side_effect = [
+            ClaudeResponse(content="[]", model="test", json_data=[{"id": "item-0", "summary": "Grouped"}]),
+            ClaudeResponse(content="{}", model="test", json_data={"summary": "Single"}),
+        ]
+        analyzer = Analyzer(client=client, store_results=False, cache_path=None, request_delay=0)
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        results = analyzer.analyze_group([make_item(0), make_item(1)])
+
+        assert [r.summary for _, r in results] == ["Grouped", "Single"]
+
+    def test_malformed_entry_falls_back_to_single_analysis(self, make_item):
+        """An entry that fails to parse should not lose the rest of the group."""
+        client = Mock()
+        client.complete.side_effect = [
+            ClaudeResponse(content="[]", model="test", json_data=[
+                {"id": "item-0", "summary": "Grouped", "confidence": 0.9},
+                {"id": "item-1", "summary": "Bad", "confidence": "high"},
+            ]),
+            ClaudeResponse(content="{}", model="test", json_data={"summary": "Single"}),
+        ]
+        analyzer = Analyzer(client=client, store_results=False, cache_path=None, request_delay=0)
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        results = analyzer.analyze_group([make_item(0), make_item(1)])
+
+        assert [r.summary for _, r in results] == ["Grouped", "Single"]
+
+
+def test_render_prompt_matches_format():
+    """Pre-split rendering should produce the same text as str.format."""
+    from src.processors.analyzer import ANALYSIS_PROMPT, _render_prompt
+
+    fields = {"title": "T", "source_type": "reddit", "source_url": "https://x", "content": "C {not a field}"}
+
+    assert _render_prompt(**fields) == ANALYSIS_PROMPT.format(**fields)
+
+
+def _result() -> AnalysisResult:
+    return AnalysisResult(
+        item_id="item-1", summary="Cached", key_insights=[], technical_details=None,
+        relevance_to_claude="", actionability="low", related_topics=[], confidence=0.9,
+    )
+
+
+class TestAnalysisCache:
+    """Test identical content is only analyzed once."""
+
+    def _client(self):
+        client = Mock()
+        client.model = "test-model"
+        client.complete.return_value = ClaudeResponse(
+            content="{}", model="test", json_data={"summary": "Cached", "confidence": 0.9}
+        )
+        return client
+
+    def test_duplicate_content_skips_api(self, make_item, tmp_path):
+        """Second item with the same content should be served from cache."""
+        client = self._client()
+        analyzer = Analyzer(client=client, store_results=False, cache_path=tmp_path / "cache.db")
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        first = analyzer.analyze(make_item(1))
+        duplicate = CollectedItem(
+            id="dup", title="Other title", source_type=SourceType.REDDIT,
+            source_url="https://example.com/dup", content=make_item(1).content,
+        )
+        second = analyzer.analyze(duplicate)
+
+        assert client.complete.call_count == 1
+        assert second.summary == first.summary
+        assert second.item_id == "dup"
+
+    def test_cache_persists_across_instances(self, make_item, tmp_path):
+        """Results should survive in the SQLite file for new analyzers."""
+        first = Analyzer(client=self._client(), store_results=False, cache_path=tmp_path / "cache.db")
+        first._already_analyzed = Mock(return_value=False)
+        first.analyze(make_item(1))
+
+        client = self._client()
+        analyzer = Analyzer(client=client, store_results=False, cache_path=tmp_path / "cache.db")
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        assert analyzer.analyze(make_item(1)).summary == "Cached"
+        client.complete.assert_not_called()
+
+    def test_expired_entries_miss(self, tmp_path):
+        """Entries older than the TTL should not be served."""
+        from src.processors.analyzer import _AnalysisCache
+
+        _AnalysisCache(tmp_path / "cache.db").put("k", _result())
+
+        assert _AnalysisCache(tmp_path / "cache.db").get("k") is not None
+        assert _AnalysisCache(tmp_path / "cache.db", ttl=-1).get("k") is None
+
+    def test_memory_entries_expire_and_are_bounded(self, tmp_path, monkeypatch):
+        """In-memory hits honour the TTL, and only the newest entries are kept."""
+        from src.processors import analyzer as analyzer_mod
+
+        cache = analyzer_mod._AnalysisCache(tmp_path / "cache.db", ttl=60, memory_size=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, _result())
+
+        assert list(cache._memory) == ["b", "c"]
+
+        later = analyzer_mod.time.time() + 120
+        monkeypatch.setattr(analyzer_mod.time, "time", lambda: later)
+        assert cache.get("c") is None
+        assert "c" not in cache._memory
+
+    def test_get_returns_a_copy(self, tmp_path):
+        """Mutating a returned result must not change the cached entry."""
+        from src.processors.analyzer import _AnalysisCache
+
+        cache = _AnalysisCache(tmp_path / "cache.db")
+        cache.put("k", _result())
+        cache.get("k").key_insights.append("mutated")
+
+        assert cache.get("k").key_insights == []
+
+    def test_key_includes_prompt_version(self, monkeypatch):
+        """Bumping the prompt version should change every key."""
+        from src.processors import analyzer as analyzer_mod
+
+        before = analyzer_mod._AnalysisCache.key("m", "content")
+        monkeypatch.setattr(analyzer_mod, "ANALYSIS_PROMPT_VERSION", "v-next")
+
+        assert analyzer_mod._AnalysisCache.key("m", "content") != before
+
+    def test_stale_row_is_a_miss_and_removed(self, tmp_path):
+        """Rows that no longer decode into AnalysisResult are dropped, not raised."""
+        import sqlite3
+        import time as time_mod
+        from src.processors.analyzer import _AnalysisCache
+
+        path = tmp_path / "cache.db"
+        _AnalysisCache(path).put("ok", _result())
+        with sqlite3.connect(path) as conn:
+            conn.executemany(
+                "INSERT INTO analysis_cache (key, json, created_at) VALUES (?, ?, ?)",
+                [("old", '{"item_id": "x", "removed_field": 1}', time_mod.time()),
+                 ("corrupt", "{not json", time_mod.time())],
+            )
+
+        cache = _AnalysisCache(path)
+        assert cache.get("old") is None
+        assert cache.get("corrupt") is None
+        with sqlite3.connect(path) as conn:
+            assert [row[0] for row in conn.execute("SELECT key FROM analysis_cache")] == ["ok"]
+
+    def test_pre_ttl_table_is_replaced(self, tmp_path):
+        """A cache file from before the created_at column should be rebuilt."""
+        import sqlite3
+        from src.processors.analyzer import _AnalysisCache
+
+        path = tmp_path / "cache.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE analysis_cache (key TEXT PRIMARY KEY, json TEXT NOT NULL)")
+
+        cache = _AnalysisCache(path)
+        cache.put("k", _result())
+
+        assert _AnalysisCache(path).get("k") is not None
+
+
+def test_truncate_for_prompt_keeps_short_content_and_cuts_on_space():
+    """Short content passes through; long content is cut at a word boundary."""
+    from src.processors.analyzer import _truncate_for_prompt
+
+    short = "short content"
+    assert _truncate_for_prompt(short) is short
+
+    long = "word " * 2000
+    truncated = _truncate_for_prompt(long, max_tokens=10)
+    assert len(truncated) <= 40
+    assert truncated.endswith("word")
+
+
+class TestWriteBuffer:
+    """Test vector store writes are batched during batch analysis."""
+
+    def test_batch_flushes_once_per_collection(self, make_item):
+        """A batch should issue one add per collection, not one per item."""
+        client = Mock()
+        client.complete.return_value = ClaudeResponse(
+            content="{}", model="test", json_data={"summary": "S", "confidence": 0.9}
+        )
+        store = Mock()
+        store.exists.return_value = False
+
+        analyzer = Analyzer(client=client, store_results=True, cache_path=None, request_delay=0)
+        analyzer._vector_store = store
+
+        with analyzer:
+            for i in range(5):
+                analyzer.analyze(make_item(i))
+            store.add.assert_not_called()
+
+        collections = [c.kwargs["collection"] for c in store.add.call_args_list]
+        assert sorted(collections) == ["analysis", "items"]
+        analysis_call = [c for c in store.add.call_args_list if c.kwargs["collection"] == "analysis"][0]
+        assert analysis_call.kwargs["ids"] == [f"analysis_item-{i}" for i in range(5)]
+
+    def test_single_analyze_writes_immediately(self, make_item):
+        """Outside a batch, results should be stored right away."""
+        client = Mock()
+        client.complete.return_value = ClaudeResponse(
+            content="{}", model="test", json_data={"summary": "S", "confidence": 0.9}
+        )
+        store = Mock()
+        store.exists.return_value = False
+
+        analyzer = Analyzer(client=client, store_results=True, cache_path=None, request_delay=0)
+        analyzer._vector_store = store
+        analyzer.analyze(make_item(0))
+
+        assert store.add.call_count == 2
+
+
+class TestAnalyzeBatchThreaded:
+    """Test the thread-pool batch path."""
+
+    def _slow_client(self):
+        def complete(prompt, max_tokens, expect_json):
+            time.sleep(0.2)
+            return ClaudeResponse(content="{}", model="test", json_data={"summary": "S", "confidence": 0.9})
+
+        client = Mock(spec=["complete", "model"])
+        client.complete.side_effect = complete
+        return client
+
+    def test_sync_only_client_uses_threads(self, make_item):
+        """A client without complete_async should still get concurrent requests."""
+        analyzer = Analyzer(client=self._slow_client(), store_results=False, cache_path=None,
+                            request_delay=0, concurrency=8)
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        items = [make_item(i) for i in range(8)]
+        start = time.perf_counter()
+        results = analyzer.analyze_batch(items)
+
+        assert time.perf_counter() - start < 1.0
+        assert [item.id for item, _ in results] == [item.id for item in items]
+
+    def test_running_event_loop_uses_threads(self, make_item):
+        """Calling analyze_batch inside an event loop should not fail."""
+        analyzer = Analyzer(client=self._slow_client(), store_results=False, cache_path=None, request_delay=0)
+        analyzer._already_analyzed = Mock(return_value=False)
+
+        async def run():
+            return analyzer.analyze_batch([make_item(0), make_item(1)])
+
+        assert len(asyncio.run(run())) == 2
+
+
+def test_batch_deduplicates_identical_content(make_item):
+    """Items sharing content should cost one request and get their own item_id."""
+    client = Mock(spec=["complete", "model"])
+    client.complete.return_value = ClaudeResponse(
+        content="{}", model="test", json_data={"summary": "S", "confidence": 0.9}
+    )
+    analyzer = Analyzer(client=client, store_results=False, cache_path=None, request_delay=0)
+    analyzer._already_analyzed = Mock(return_value=False)
+
+    repost = CollectedItem(
+        id="repost", title="Repost", source_type=SourceType.REDDIT,
+        source_url="https://example.com/repost", content=make_item(0).content,
+    )
+    results = analyzer.analyze_batch([make_item(0), make_item(1), repost])
+
+    assert client.complete.call_count == 2
+    assert [r.item_id for _, r in results] == ["item-0", "item-1", "repost"]
+
+
+def test_failed_analysis_stays_novel_next_run(make_item, tmp_path):
+    """Only stored analyses are remembered; a fallback item is novel again next run."""
+    from src.processors.claude_client import ClaudeAPIError
+    from src.processors.novelty_detector import NoveltyDetector
+
+    client = Mock(spec=["complete", "model"])
+    client.complete.side_effect = [
+        ClaudeResponse(content="{}", model="test", json_data={"summary": "S", "confidence": 0.9}),
+        ClaudeAPIError("overloaded"),
+    ]
+    store = Mock()
+    store.exists.return_value = False
+    analyzer = Analyzer(client=client, store_results=True, cache_path=None, request_delay=0, concurrency=1)
+    analyzer._vector_store = store
+
+    items = [make_item(0), make_item(1)]
+    results = analyzer.analyze_batch(items)
+    assert all(r is not None for _, r in results)
+
+    stored = analyzer.take_stored_ids()
+    assert stored == {"item-0"}
+    bloom_path = tmp_path / "bloom.bin"
+    NoveltyDetector(vector_store=Mock(), bloom_path=bloom_path).remember(
+        [item for item, _ in results if item.id in stored]
+    )
+
+    search_store = Mock()
+    search_store.search.return_value = {"distances": [[2.0]]}
+    next_run = NoveltyDetector(vector_store=search_store, bloom_path=bloom_path)
+
+    assert next_run.compute_novelty_batch(items) == [0.0, 1.0]
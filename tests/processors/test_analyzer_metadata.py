@@ -1,12 +1,41 @@
 """Tests for analyzer metadata enrichment."""
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch, call
+from unittest.mock import Mock, patch
 
 from src.collectors.base import CollectedItem, SourceType
 from src.processors.analyzer import Analyzer, AnalysisResult
 
 
+@pytest.fixture(scope="module")
+def store():
+    """Vector store mock shared by the module (patched once)."""
+    with patch("src.storage.vector_store.get_vector_store") as mock_get_store:
+        mock_get_store.return_value = Mock()
+        yield mock_get_store.return_value
+
+
+@pytest.fixture(scope="module")
+def analyzer(store):
+    """Analyzer writing to the shared store mock."""
+    analyzer = Analyzer(store_results=True)
+    analyzer._vector_store = store
+    return analyzer
+
+
+@pytest.fixture(autouse=True)
+def _reset_store(store):
+    yield
+    store.reset_mock()
+
+
+def _analysis_metadata(store: Mock) -> dict:
+    """Metadata of the document added to the analysis collection."""
+    calls = store.add.call_args_list
+    analysis_call = [c for c in calls if c.kwargs.get("collection") == "analysis"][0]
+    return analysis_call.kwargs["metadatas"][0]
+
+
 class TestAnalysisMetadataEnrichment:
     """Test that analysis stores enriched metadata for email reporter."""
 
@@ -39,100 +68,27 @@ class TestAnalysisMetadataEnrichment:
             confidence=0.9,
         )
 
-    @patch("src.storage.vector_store.get_vector_store")
-    def test_analysis_stores_title_in_metadata(self, mock_get_store, sample_item, sample_result):
-        """Analysis metadata should include title for email reporter."""
-        mock_store = Mock()
-        mock_get_store.return_value = mock_store
-
-        analyzer = Analyzer(store_results=True)
-        analyzer._vector_store = mock_store
-        analyzer._store_analysis(sample_item, sample_result)
-
-        # Find the call to add analysis (second call)
-        calls = mock_store.add.call_args_list
-        analysis_call = [c for c in calls if c.kwargs.get("collection") == "analysis"][0]
-
-        metadata = analysis_call.kwargs["metadatas"][0]
-        assert metadata["title"] == "Claude 4.6 Released with New Features"
-
-    @patch("src.storage.vector_store.get_vector_store")
-    def test_analysis_stores_source_in_metadata(self, mock_get_store, sample_item, sample_result):
-        """Analysis metadata should include source (not source_type) for email reporter."""
-        mock_store = Mock()
-        mock_get_store.return_value = mock_store
-
-        analyzer = Analyzer(store_results=True)
-        analyzer._vector_store = mock_store
-        analyzer._store_analysis(sample_item, sample_result)
-
-        calls = mock_store.add.call_args_list
-        analysis_call = [c for c in calls if c.kwargs.get("collection") == "analysis"][0]
-
-        metadata = analysis_call.kwargs["metadatas"][0]
-        assert metadata["source"] == "reddit"
-
-    @patch("src.storage.vector_store.get_vector_store")
-    def test_analysis_stores_url_in_metadata(self, mock_get_store, sample_item, sample_result):
-        """Analysis metadata should include URL for email reporter links."""
-        mock_store = Mock()
-        mock_get_store.return_value = mock_store
-
-        analyzer = Analyzer(store_results=True)
-        analyzer._vector_store = mock_store
-        analyzer._store_analysis(sample_item, sample_result)
-
-        calls = mock_store.add.call_args_list
-        analysis_call = [c for c in calls if c.kwargs.get("collection") == "analysis"][0]
-
-        metadata = analysis_call.kwargs["metadatas"][0]
-        assert metadata["url"] == "https://reddit.com/r/ClaudeAI/comments/abc123"
-
-    @patch("src.storage.vector_store.get_vector_store")
-    def test_analysis_stores_summary_in_metadata(self, mock_get_store, sample_item, sample_result):
-        """Analysis metadata should include full summary (not truncated)."""
-        mock_store = Mock()
-        mock_get_store.return_value = mock_store
-
-        analyzer = Analyzer(store_results=True)
-        analyzer._vector_store = mock_store
+    @pytest.mark.parametrize("key,expected", [
+        # Title, source and URL feed the email reporter's item links
+        ("title", "Claude 4.6 Released with New Features"),
+        # source (not source_type)
+        ("source", "reddit"),
+        ("url", "https://reddit.com/r/ClaudeAI/comments/abc123"),
+        # Full summary, not truncated
+        ("summary", "Claude 4.6 brings major improvements to coding capabilities."),
+        # Stored as a string (ChromaDB metadata)
+        ("signal_score", "8"),
+    ])
+    def test_analysis_metadata_field(self, analyzer, store, sample_item, sample_result, key, expected):
+        """Analysis metadata should include the fields the email reporter reads."""
         analyzer._store_analysis(sample_item, sample_result)
 
-        calls = mock_store.add.call_args_list
-        analysis_call = [c for c in calls if c.kwargs.get("collection") == "analysis"][0]
+        metadata = _analysis_metadata(store)
+        assert metadata[key] == expected
 
-        metadata = analysis_call.kwargs["metadatas"][0]
-        assert metadata["summary"] == "Claude 4.6 brings major improvements to coding capabilities."
-
-    @patch("src.storage.vector_store.get_vector_store")
-    def test_analysis_stores_signal_score_in_metadata(self, mock_get_store, sample_item, sample_result):
-        """Analysis metadata should include signal_score as string."""
-        mock_store = Mock()
-        mock_get_store.return_value = mock_store
-
-        analyzer = Analyzer(store_results=True)
-        analyzer._vector_store = mock_store
-        analyzer._store_analysis(sample_item, sample_result)
-
-        calls = mock_store.add.call_args_list
-        analysis_call = [c for c in calls if c.kwargs.get("collection") == "analysis"][0]
-
-        metadata = analysis_call.kwargs["metadatas"][0]
-        assert metadata["signal_score"] == "8"
-
-    @patch("src.storage.vector_store.get_vector_store")
-    def test_analysis_without_signal_score(self, mock_get_store, sample_item, sample_result):
+    def test_analysis_without_signal_score(self, analyzer, store, sample_item, sample_result):
         """Analysis metadata should work when signal_score is None."""
-        mock_store = Mock()
-        mock_get_store.return_value = mock_store
         sample_item.signal_score = None
-
-        analyzer = Analyzer(store_results=True)
-        analyzer._vector_store = mock_store
         analyzer._store_analysis(sample_item, sample_result)
 
-        calls = mock_store.add.call_args_list
-        analysis_call = [c for c in calls if c.kwargs.get("collection") == "analysis"][0]
-
-        metadata = analysis_call.kwargs["metadatas"][0]
-        assert "signal_score" not in metadata
+        assert "signal_score" not in _analysis_metadata(store)
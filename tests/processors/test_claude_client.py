@@ -1,255 +1,344 @@
 """Tests for ClaudeClient with Anthropic SDK."""
 
-import os
+import asyncio
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock, MagicMock, Mock
+
+from anthropic import APIError, APITimeoutError
+
+from src.processors.claude_client import (
+    RETRY_ATTEMPTS,
+    ClaudeAPIError,
+    ClaudeClient,
+    ClaudeModel,
+    ClaudeParseError,
+    ClaudeResponse,
+    ClaudeTimeoutError,
+)
+
+
+def _response(text: str) -> SimpleNamespace:
+    """Minimal stand-in for an SDK Message with one text block."""
+    return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+@pytest.fixture(scope="module")
+def claude_client():
+    """One ClaudeClient shared by the module; tests stub its SDK calls."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ANTHROPIC_API_KEY", "test-key")
+        yield ClaudeClient()
 
 
 class TestClaudeClientInit:
     """Test ClaudeClient initialization."""
 
-    def test_init_with_defaults(self):
+    def test_init_with_defaults(self, monkeypatch):
         """Should initialize with default model."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient, ClaudeModel
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = ClaudeClient()
+        assert client.model == ClaudeModel.SONNET
 
-            client = ClaudeClient()
-            assert client.model == ClaudeModel.SONNET
-
-    def test_init_with_custom_base_url(self):
+    def test_init_with_custom_base_url(self, monkeypatch):
         """Should use ANTHROPIC_BASE_URL from environment."""
-        with patch.dict(
-            os.environ,
-            {
-                "ANTHROPIC_API_KEY": "test-key",
-                "ANTHROPIC_BASE_URL": "https://custom.api.com"
-            }
-        ):
-            from src.processors.claude_client import ClaudeClient
-
-            client = ClaudeClient()
-            assert client._base_url == "https://custom.api.com"
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setenv("ANTHROPIC_BASE_URL", "https://custom.api.com")
+        client = ClaudeClient()
+        assert client._base_url == "https://custom.api.com"
 
-    def test_init_with_custom_model(self):
+    def test_init_with_custom_model(self, monkeypatch):
         """Should accept custom model parameter."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient, ClaudeModel
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = ClaudeClient(model=ClaudeModel.OPUS)
+        assert client.model == ClaudeModel.OPUS
 
-            client = ClaudeClient(model=ClaudeModel.OPUS)
-            assert client.model == ClaudeModel.OPUS
-
-    def test_init_with_explicit_base_url(self):
+    def test_init_with_explicit_base_url(self, monkeypatch):
         """Should use explicitly passed base_url over environment."""
-        with patch.dict(
-            os.environ,
-            {
-                "ANTHROPIC_API_KEY": "test-key",
-                "ANTHROPIC_BASE_URL": "https://env.api.com"
-            }
-        ):
-            from src.processors.claude_client import ClaudeClient
-
-            client = ClaudeClient(base_url="https://explicit.api.com")
-            assert client._base_url == "https://explicit.api.com"
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setenv("ANTHROPIC_BASE_URL", "https://env.api.com")
+        client = ClaudeClient(base_url="https://explicit.api.com")
+        assert client._base_url == "https://explicit.api.com"
 
 
 class TestClaudeClientModels:
     """Test ClaudeModel enum."""
 
-    def test_sonnet_model_value(self):
-        """Should have correct Sonnet model value."""
-        from src.processors.claude_client import ClaudeModel
+    @pytest.mark.parametrize("member,value", [
+        (ClaudeModel.SONNET, "claude-sonnet-4-20250514"),
+        (ClaudeModel.OPUS, "claude-opus-4-6"),
+        (ClaudeModel.GLM_5, "glm-5"),
+        (ClaudeModel.GLM_4_FLASH, "glm-4-flash"),
+    ])
+    def test_model_values(self, member, value):
+        """Should have the expected model id for each model."""
+        assert member.value == value
 
-        assert ClaudeModel.SONNET.value == "claude-sonnet-4-20250514"
 
-    def test_opus_model_value(self):
-        """Should have correct Opus model value."""
-        from src.processors.claude_client import ClaudeModel
+class TestClaudeClientComplete:
+    """Test ClaudeClient complete method."""
 
-        assert ClaudeModel.OPUS.value == "claude-opus-4-6"
+    def test_complete_returns_response(self, claude_client):
+        """Should return ClaudeResponse with content."""
+        # Mock the Anthropic client
+        mock_response = _response("Test response content")
 
-    def test_glm_models_available(self):
-        """Should include GLM model variants."""
-        from src.processors.claude_client import ClaudeModel
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-        assert ClaudeModel.GLM_5.value == "glm-5"
-        assert ClaudeModel.GLM_4_FLASH.value == "glm-4-flash"
+        response = claude_client.complete("Test prompt")
 
+        assert isinstance(response, ClaudeResponse)
+        assert response.content == "Test response content"
 
-class TestClaudeClientComplete:
-    """Test ClaudeClient complete method."""
+    def test_complete_with_system_prompt(self, claude_client):
+        """Should pass system prompt to API."""
+        mock_response = _response("Response")
 
-    def test_complete_returns_response(self):
-        """Should return ClaudeResponse with content."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient, ClaudeResponse
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-            client = ClaudeClient()
+        claude_client.complete("User prompt", system="System instructions")
 
-            # Mock the Anthropic client
-            mock_response = MagicMock()
-            mock_block = MagicMock()
-            mock_block.text = "Test response content"
-            mock_response.content = [mock_block]
+        call_kwargs = claude_client._client.messages.create.call_args[1]
+        assert call_kwargs["system"] == "System instructions"
 
-            client._client.messages.create = MagicMock(return_value=mock_response)
+    def test_complete_with_cached_system_prompt(self, claude_client):
+        """Should send system prompt as a cache_control block when cache_system=True."""
+        mock_response = _response("Response")
 
-            response = client.complete("Test prompt")
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-            assert isinstance(response, ClaudeResponse)
-            assert response.content == "Test response content"
+        claude_client.complete("User prompt", system="System instructions", cache_system=True)
 
-    def test_complete_with_system_prompt(self):
-        """Should pass system prompt to API."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient
+        call_kwargs = claude_client._client.messages.create.call_args[1]
+        assert call_kwargs["system"] == [
+            {
+                "type": "text",
+                "text": "System instructions",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
 
-            client = ClaudeClient()
+    def test_complete_with_expect_json(self, claude_client):
+        """Should parse JSON from response when expect_json=True."""
+        mock_response = _response('{"key": "value"}')
 
-            mock_response = MagicMock()
-            mock_block = MagicMock()
-            mock_block.text = "Response"
-            mock_response.content = [mock_block]
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-            client._client.messages.create = MagicMock(return_value=mock_response)
+        response = claude_client.complete("Prompt", expect_json=True)
 
-            client.complete("User prompt", system="System instructions")
+        assert response.json_data == {"key": "value"}
 
-            call_kwargs = client._client.messages.create.call_args[1]
-            assert call_kwargs["system"] == "System instructions"
+    def test_complete_json_from_markdown_block(self, claude_client):
+        """Should extract JSON from markdown code blocks."""
+        mock_response = _response('```json\n{"key": "value"}\n```')
 
-    def test_complete_with_expect_json(self):
-        """Should parse JSON from response when expect_json=True."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-            client = ClaudeClient()
+        response = claude_client.complete("Prompt", expect_json=True)
 
-            mock_response = MagicMock()
-            mock_block = MagicMock()
-            mock_block.text = '{"key": "value"}'
-            mock_response.content = [mock_block]
+        assert response.json_data == {"key": "value"}
 
-            client._client.messages.create = MagicMock(return_value=mock_response)
+    def test_parse_json_from_untagged_fence_with_prose(self, claude_client):
+        """Should extract JSON from an untagged fence surrounded by text."""
+        content = 'Here you go:\n```\n{"key": "value"}\n```\nLet me know.'
 
-            response = client.complete("Prompt", expect_json=True)
+        assert claude_client._parse_json_from_content(content) == {"key": "value"}
+        assert claude_client._parse_json_from_content("```json\n{unterminated") is None
 
-            assert response.json_data == {"key": "value"}
+    def test_complete_text_returns_raw_string(self, claude_client):
+        """Should return the text without wrapping it in ClaudeResponse."""
+        mock_response = _response("Texto traducido")
 
-    def test_complete_json_from_markdown_block(self):
-        """Should extract JSON from markdown code blocks."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-            client = ClaudeClient()
+        assert claude_client.complete_text("Prompt") == "Texto traducido"
 
-            mock_response = MagicMock()
-            mock_block = MagicMock()
-            mock_block.text = '```json\n{"key": "value"}\n```'
-            mock_response.content = [mock_block]
 
-            client._client.messages.create = MagicMock(return_value=mock_response)
+class TestClaudeClientCompleteAsync:
+    """Test ClaudeClient complete_async method."""
 
-            response = client.complete("Prompt", expect_json=True)
+    def test_complete_async_returns_response(self, monkeypatch):
+        """Should return ClaudeResponse from the async client."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = ClaudeClient()
 
-            assert response.json_data == {"key": "value"}
+        mock_response = _response('{"key": "value"}')
 
+        client.async_client.messages.create = AsyncMock(return_value=mock_response)
 
-class TestClaudeClientCompleteJson:
-    """Test ClaudeClient complete_json method."""
+        response = asyncio.run(client.complete_async("Prompt", expect_json=True))
 
-    def test_complete_json_returns_dict(self):
-        """Should return parsed JSON dict."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient
+        assert isinstance(response, ClaudeResponse)
+        assert response.json_data == {"key": "value"}
 
-            client = ClaudeClient()
+    def test_aclose_resets_async_client(self, monkeypatch):
+        """Should close and drop the async client so the next loop gets a new one."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = ClaudeClient()
+        first = client.async_client
+        first.close = AsyncMock()
 
-            mock_response = MagicMock()
-            mock_block = MagicMock()
-            mock_block.text = '{"result": "success"}'
-            mock_response.content = [mock_block]
+        asyncio.run(client.aclose())
 
-            client._client.messages.create = MagicMock(return_value=mock_response)
+        first.close.assert_awaited_once()
+        assert client.async_client is not first
 
-            result = client.complete_json("Prompt")
+    def test_run_reuses_async_client_until_close(self, monkeypatch):
+        """Coroutines passed to run() share one loop and async client; close() releases both."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = ClaudeClient()
 
-            assert result == {"result": "success"}
+        async def current_client():
+            return client.async_client
 
-    def test_complete_json_raises_on_invalid_json(self):
-        """Should raise ClaudeParseError on invalid JSON."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient, ClaudeParseError
+        first = client.run(current_client())
+        assert client.run(current_client()) is first
+
+        first.close = AsyncMock()
+        client.close()
+
+        first.close.assert_awaited_once()
+        assert client._runner is None
+
+    def test_warm_up_pings_async_pool(self, monkeypatch):
+        """Warm-up should go through the async client used by batch analysis."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = ClaudeClient()
+        warm = Mock()
+        warm.models.list = AsyncMock()
+        client.async_client.with_options = Mock(return_value=warm)
+        client._client.with_options = Mock()
+
+        client.warm_up().join(timeout=5)
+
+        warm.models.list.assert_awaited_once()
+        client._client.with_options.assert_not_called()
+
+    def test_context_manager_closes_sync_client(self, monkeypatch):
+        """Leaving a `with` block should release the connection pool."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        with ClaudeClient() as client:
+            client._client.close = Mock()
+
+        client._client.close.assert_called_once()
+
+
+class TestClaudeClientCompleteJson:
+    """Test ClaudeClient complete_json method."""
+
+    def test_complete_json_returns_dict(self, claude_client):
+        """Should return parsed JSON dict."""
+        mock_response = _response('{"result": "success"}')
+
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-            client = ClaudeClient()
+        result = claude_client.complete_json("Prompt")
 
-            mock_response = MagicMock()
-            mock_block = MagicMock()
-            mock_block.text = "Not valid JSON"
-            mock_response.content = [mock_block]
+        assert result == {"result": "success"}
 
-            client._client.messages.create = MagicMock(return_value=mock_response)
+    def test_complete_json_raises_on_invalid_json(self, claude_client):
+        """Should raise ClaudeParseError on invalid JSON."""
+        mock_response = _response("Not valid JSON")
+
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-            with pytest.raises(ClaudeParseError):
-                client.complete_json("Prompt")
+        with pytest.raises(ClaudeParseError):
+            claude_client.complete_json("Prompt")
 
 
 class TestClaudeClientAnalyze:
     """Test ClaudeClient analyze method."""
 
-    def test_analyze_formats_prompt(self):
+    def test_analyze_formats_prompt(self, claude_client):
         """Should format content into prompt template."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient
-
-            client = ClaudeClient()
-
-            mock_response = MagicMock()
-            mock_block = MagicMock()
-            mock_block.text = "Analysis result"
-            mock_response.content = [mock_block]
+        mock_response = _response("Analysis result")
 
-            client._client.messages.create = MagicMock(return_value=mock_response)
+        claude_client._client.messages.create = Mock(return_value=mock_response)
 
-            response = client.analyze("Sample content", "Analyze this: {content}")
+        response = claude_client.analyze("Sample content", "Analyze this: {content}")
 
-            assert response.content == "Analysis result"
+        assert response.content == "Analysis result"
 
-            call_kwargs = client._client.messages.create.call_args[1]
-            assert call_kwargs["messages"][0]["content"] == "Analyze this: Sample content"
+        call_kwargs = claude_client._client.messages.create.call_args[1]
+        assert call_kwargs["messages"][0]["content"] == "Analyze this: Sample content"
 
 
 class TestClaudeClientErrors:
     """Test error handling."""
 
-    def test_timeout_error(self):
+    def test_timeout_error(self, claude_client):
         """Should raise ClaudeTimeoutError on timeout."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient, ClaudeTimeoutError
-            from anthropic import APITimeoutError
+        claude_client._client.messages.create = Mock(
+            side_effect=APITimeoutError("Timeout")
+        )
 
-            client = ClaudeClient()
+        with pytest.raises(ClaudeTimeoutError):
+            claude_client.complete("Prompt")
 
-            client._client.messages.create = MagicMock(
-                side_effect=APITimeoutError("Timeout")
-            )
+    def test_api_error_retryable(self, claude_client):
+        """Should raise ClaudeAPIError for rate limit errors."""
+        # Create a mock request object for APIError
+        mock_request = Mock()
+        claude_client._client.messages.create = Mock(
+            side_effect=APIError("rate limited", request=mock_request, body=None)
+        )
+
+        with patch("src.processors.claude_client.time.sleep"), \
+                pytest.raises(ClaudeAPIError):
+            claude_client.complete("Prompt")
+
+    def test_api_error_retried_with_backoff(self, claude_client):
+        """Should retry retryable errors and re-raise after the last attempt."""
+        claude_client._client.messages.create = Mock(
+            side_effect=APIError("overloaded", request=Mock(), body=None)
+        )
+
+        with patch("src.processors.claude_client.time.sleep") as mock_sleep, \
+                patch("src.processors.claude_client.random.uniform", return_value=0.0):
+            with pytest.raises(ClaudeAPIError):
+                claude_client.complete("Prompt")
 
-            with pytest.raises(ClaudeTimeoutError):
-                client.complete("Prompt")
+        assert claude_client._client.messages.create.call_count == RETRY_ATTEMPTS
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [4.0, 4.0, 8.0, 16.0]
 
-    def test_api_error_retryable(self):
-        """Should raise ClaudeAPIError for rate limit errors."""
-        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
-            from src.processors.claude_client import ClaudeClient, ClaudeAPIError
-            from anthropic import APIError
 
-            client = ClaudeClient()
+class TestClaudeClientStreamJson:
+    """Test streaming JSON requests stop once the JSON value is complete."""
 
-            # Create a mock request object for APIError
-            mock_request = MagicMock()
-            client._client.messages.create = MagicMock(
-                side_effect=APIError("rate limited", request=mock_request, body=None)
-            )
+    def test_stream_stops_at_json_end(self, monkeypatch):
+        """Should stop reading the stream after the closing brace."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = ClaudeClient(stream_json=True)
 
-            with pytest.raises(ClaudeAPIError):
-                client.complete("Prompt")
+        consumed = []
+
+        def text_stream():
+            for chunk in ['Sure:\n```json\n{"a": "br', 'ace } in string", ', '"b": [1]}', '\n```', " trailing chatter"]:
+                consumed.append(chunk)
+                yield chunk
+
+        stream = Mock()
+        stream.text_stream = text_stream()
+        manager = MagicMock()
+        manager.__enter__.return_value = stream
+        client._client.messages.stream = Mock(return_value=manager)
+        client._client.messages.create = Mock()
+
+        response = client.complete("Prompt", expect_json=True)
+
+        assert response.json_data == {"a": "brace } in string", "b": [1]}
+        assert len(consumed) == 3
+        client._client.messages.create.assert_not_called()
+
+    def test_plain_text_requests_do_not_stream(self, monkeypatch):
+        """Should keep using messages.create when JSON isn't expected."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        client = ClaudeClient(stream_json=True)
+
+        mock_response = _response("Plain")
+        client._client.messages.create = Mock(return_value=mock_response)
+        client._client.messages.stream = Mock()
+
+        assert client.complete("Prompt").content == "Plain"
+        client._client.messages.stream.assert_not_called()
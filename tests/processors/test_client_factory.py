@@ -1,32 +1,66 @@
 """Tests for client factory."""
 
-import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.processors import client_factory
+from src.processors.claude_client import ClaudeModel
+from src.processors.client_factory import (
+    _resolve_model,
+    get_analysis_client,
+    get_synthesis_client,
+    reset_clients,
+)
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Patch ClaudeClient in the factory; memoized clients are cleared around each test."""
+    mock_cls = MagicMock()
+    monkeypatch.setattr(client_factory, "ClaudeClient", mock_cls)
+    reset_clients()
+    yield mock_cls
+    # Don't leak mocked clients into other tests
+    reset_clients()
 
 
 class TestClientFactory:
     """Test client factory functions."""
 
-    @patch("src.processors.client_factory.ClaudeClient")
     def test_get_analysis_client_returns_claude_client(self, mock_client):
         """Should return ClaudeClient instance."""
-        from src.processors.client_factory import get_analysis_client
-
-        mock_instance = MagicMock()
-        mock_client.return_value = mock_instance
-
         result = get_analysis_client()
-        assert result is not None
+        assert result is mock_client.return_value
         mock_client.assert_called()
 
-    @patch("src.processors.client_factory.ClaudeClient")
     def test_get_synthesis_client_returns_claude_client(self, mock_client):
         """Should return ClaudeClient instance with longer timeout."""
-        from src.processors.client_factory import get_synthesis_client
-
-        mock_instance = MagicMock()
-        mock_client.return_value = mock_instance
-
         result = get_synthesis_client()
-        assert result is not None
+        assert result is mock_client.return_value
         mock_client.assert_called()
+
+    def test_analysis_client_is_reused(self, mock_client):
+        """Repeated calls should share one client (and connection pool)."""
+        assert get_analysis_client() is get_analysis_client()
+        assert mock_client.call_count == 1
+
+    def test_new_client_is_warmed_up(self, mock_client, monkeypatch):
+        """Factory should start a connection warm-up for each new client."""
+        monkeypatch.setattr(client_factory, "WARM_UP_CLIENTS", True)
+        get_synthesis_client()
+        get_synthesis_client()
+
+        mock_client.return_value.warm_up.assert_called_once()
+
+    def test_warm_up_can_be_disabled(self, mock_client):
+        """With WARM_UP_CLIENTS off (as in tests), no warm-up is started."""
+        get_synthesis_client()
+
+        mock_client.return_value.warm_up.assert_not_called()
+
+    def test_resolve_model_names(self):
+        """Known names map directly; unknown names fall back by family."""
+        assert _resolve_model("claude-opus-4-6") is ClaudeModel.OPUS
+        assert _resolve_model("glm-4.7") is ClaudeModel.GLM_5
+        assert _resolve_model("claude-unknown") is ClaudeModel.SONNET
@@ -0,0 +1,167 @@
+"""Tests for novelty detector duplicate detection."""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.processors.novelty_detector import NoveltyDetector
+
+
+class TestDetectDuplicates:
+    """Test pairwise duplicate detection."""
+
+    def _detector(self, embeddings):
+        store = Mock()
+        store.get_embeddings.return_value = embeddings
+        return NoveltyDetector(vector_store=store, bloom_path=None)
+
+    def test_finds_similar_pairs(self, make_item):
+        """Only pairs above the threshold are reported, in index order."""
+        items = [make_item(i) for i in range(4)]
+        detector = self._detector([
+            [1.0, 0.0, 0.0],
+            [0.99, 0.1, 0.0],
+            [0.0, 1.0, 0.0],
+            [2.0, 0.0, 0.0],
+        ])
+
+        duplicates = detector.detect_duplicates(items, similarity_threshold=0.95)
+
+        pairs = [(a.id, b.id) for a, b, _ in duplicates]
+        assert pairs == [("item-0", "item-1"), ("item-0", "item-3"), ("item-1", "item-3")]
+        assert duplicates[1][2] == pytest.approx(1.0)
+
+    def test_zero_vector_is_never_duplicate(self, make_item):
+        """A zero embedding has no direction and matches nothing."""
+        items = [make_item(0), make_item(1)]
+        detector = self._detector([[0.0, 0.0], [1.0, 0.0]])
+
+        assert detector.detect_duplicates(items, similarity_threshold=0.5) == []
+
+    def test_single_item_skips_embedding(self, make_item):
+        """Nothing to compare with fewer than two items."""
+        detector = self._detector([])
+
+        assert detector.detect_duplicates([make_item(0)]) == []
+        detector.vector_store.get_embeddings.assert_not_called()
+
+    def test_cosine_similarity_matches_reference(self):
+        """Pairwise helper agrees with the textbook formula."""
+        detector = self._detector([])
+
+        assert detector._cosine_similarity([1, 2, 3], [4, 5, 6]) == pytest.approx(0.974631846)
+        assert detector._cosine_similarity([0, 0], [1, 1]) == 0.0
+
+
+class TestComputeNoveltyBatch:
+    """Test batched novelty scoring."""
+
+    def test_one_search_for_all_items(self, make_item):
+        """All items are scored from a single multi-query search."""
+        store = Mock()
+        store.search.return_value = {"distances": [[0.2, 1.0], [], [3.0]]}
+        detector = NoveltyDetector(vector_store=store, bloom_path=None)
+        items = [make_item(i) for i in range(3)]
+
+        scores = detector.compute_novelty_batch(items)
+
+        store.search.assert_called_once()
+        assert len(store.search.call_args.kwargs["query"]) == 3
+        assert scores == pytest.approx([0.1, 1.0, 1.0])
+
+    def test_filter_novel_uses_batch_scores(self, make_item):
+        """Items at or above the threshold pass and get their score applied."""
+        store = Mock()
+        store.search.return_value = {"distances": [[0.2], [1.6]]}
+        detector = NoveltyDetector(novelty_threshold=0.5, vector_store=store, bloom_path=None)
+        items = [make_item(0), make_item(1)]
+
+        novel = detector.filter_novel(items)
+
+        assert [i.id for i in novel] == ["item-1"]
+        assert novel[0].novelty_score == pytest.approx(0.8)
+        assert store.search.call_count == 1
+
+    def test_search_failure_defaults_to_moderate(self, make_item):
+        """A failed search gives every item the neutral score."""
+        store = Mock()
+        store.search.side_effect = RuntimeError("chroma down")
+        detector = NoveltyDetector(vector_store=store, bloom_path=None)
+
+        assert detector.compute_novelty_batch([make_item(0), make_item(1)]) == [0.5, 0.5]
+        assert detector.compute_novelty(make_item(0)) == 0.5
+
+
+class TestDetectDuplicatesDedupe:
+    """Test that identical texts are embedded once."""
+
+    def test_identical_texts_embedded_once(self, make_item):
+        """Repeated texts share one embedding and still pair up as duplicates."""
+        store = Mock()
+        store.get_embeddings.side_effect = lambda texts: [[1.0, float(i)] for i in range(len(texts))]
+        detector = NoveltyDetector(vector_store=store, bloom_path=None)
+        items = [make_item(0), make_item(1), make_item(0)]
+
+        duplicates = detector.detect_duplicates(items, similarity_threshold=0.999)
+
+        embedded = store.get_embeddings.call_args.args[0]
+        assert len(embedded) == 2
+        assert [(a.id, b.id) for a, b, _ in duplicates] == [("item-0", "item-0")]
+        assert duplicates[0][1] is items[2]
+
+
+class TestSeenContentFilter:
+    """Test the Bloom filter short-circuit for already stored content."""
+
+    def test_remembered_item_skips_search(self, make_item, tmp_path):
+        """Content recorded by a previous run scores 0 without a vector search."""
+        path = tmp_path / "bloom.bin"
+        NoveltyDetector(vector_store=Mock(), bloom_path=path).remember([make_item(0)])
+
+        store = Mock()
+        store.search.return_value = {"distances": [[2.0]]}
+        detector = NoveltyDetector(vector_store=store, bloom_path=path)
+
+        scores = detector.compute_novelty_batch([make_item(0), make_item(1)])
+
+        assert scores == [0.0, 1.0]
+        assert store.search.call_args.kwargs["query"] == ["Title 1\nContent 1"]
+
+    def test_all_remembered_makes_no_search(self, make_item):
+        store = Mock()
+        detector = NoveltyDetector(vector_store=store, bloom_path=None)
+        detector.remember([make_item(0)])
+
+        assert detector.compute_novelty(make_item(0)) == 0.0
+        store.search.assert_not_called()
+
+    def test_normalizes_case_and_whitespace(self):
+        from src.processors.novelty_detector import _content_key
+
+        assert _content_key("Hello   World\n") == _content_key("hello world")
+
+
+class TestDetectDuplicatesTiling:
+    """Test that tiled scoring matches the full pairwise comparison."""
+
+    def test_tiles_match_brute_force(self, make_item):
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        base = rng.normal(size=(20, 8))
+        # 150 items drawn from 20 directions plus noise -> many near-duplicates
+        embeddings = (base[rng.integers(0, 20, 150)] + rng.normal(scale=0.05, size=(150, 8))).tolist()
+        items = [make_item(i) for i in range(150)]
+        store = Mock()
+        store.get_embeddings.return_value = embeddings
+        detector = NoveltyDetector(vector_store=store, bloom_path=None)
+
+        with patch("src.processors.novelty_detector.DUPLICATE_TILE_ROWS", 64):
+            duplicates = detector.detect_duplicates(items, similarity_threshold=0.95)
+
+        expected = [
+            (i, j)
+            for i in range(150)
+            for j in range(i + 1, 150)
+            if detector._cosine_similarity(embeddings[i], embeddings[j]) >= 0.95
+        ]
+        assert [(int(a.id[5:]), int(b.id[5:])) for a, b, _ in duplicates] == expected
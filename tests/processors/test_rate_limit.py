@@ -0,0 +1,58 @@
+"""Tests for the token-bucket rate limiter."""
+from unittest.mock import patch
+
+import pytest
+
+from src.processors._rate_limit import TokenBucket, get_bucket, reset_buckets
+
+
+class TestTokenBucket:
+    """Test token accounting."""
+
+    def test_burst_then_waits_for_refill(self):
+        """A full bucket serves `capacity` calls at once, then paces by rate."""
+        bucket = TokenBucket(rate_per_sec=2.0, capacity=2)
+
+        with patch("src.processors._rate_limit.time.sleep") as sleep, \
+                patch("src.processors._rate_limit.time.monotonic", return_value=100.0):
+            bucket._updated = 100.0
+            waits = [bucket.acquire() for _ in range(4)]
+
+        assert waits == pytest.approx([0.0, 0.0, 0.5, 1.0])
+        assert sleep.call_count == 2
+
+    def test_refills_over_time(self):
+        """Idle time restores tokens, capped at capacity."""
+        bucket = TokenBucket(rate_per_sec=1.0, capacity=1)
+        clock = [0.0]
+
+        with patch("src.processors._rate_limit.time.sleep"), \
+                patch("src.processors._rate_limit.time.monotonic", side_effect=lambda: clock[0]):
+            bucket._updated = 0.0
+            assert bucket.acquire() == 0.0
+            clock[0] = 10.0
+            assert bucket.acquire() == 0.0
+            assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_sec=0)
+
+
+class TestGetBucket:
+    """Test the shared bucket registry."""
+
+    def setup_method(self):
+        reset_buckets()
+
+    def teardown_method(self):
+        reset_buckets()
+
+    def test_shared_per_provider_and_model(self):
+        a = get_bucket("anthropic", "claude-sonnet-4-6", 60)
+        b = get_bucket("anthropic", "claude-sonnet-4-6", 120)
+        c = get_bucket("anthropic", "glm-5", 60)
+
+        assert a is b
+        assert a is not c
+        assert a.rate_per_sec == pytest.approx(1.0)
@@ -0,0 +1,202 @@
+"""Tests for signal ranker batching and caching."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.processors.claude_client import ClaudeModel, ClaudeResponse
+from src.processors.signal_ranker import RANKING_SYSTEM, SignalRanker
+
+
+def _client(score: int = 8) -> MagicMock:
+    """Mock client that ranks every item in the prompt with `score`."""
+    client = MagicMock()
+    client.model = ClaudeModel.SONNET
+
+    def complete(prompt, **kwargs):
+        count = prompt.count("**Title ")
+        data = [
+            {"index": i, "signal_score": score, "impact": "tooling", "maturity": "early"}
+            for i in range(count)
+        ]
+        return ClaudeResponse(content="", model="m", json_data=data)
+
+    client.complete.side_effect = complete
+    return client
+
+
+class TestRankBatch:
+    """Test the ranking request."""
+
+    def test_instructions_sent_as_system_prompt(self, make_item):
+        """The fixed rubric goes in the system prompt, items in the user turn."""
+        client = _client()
+        ranker = SignalRanker(client=client, requests_per_minute=0, cache_path=None)
+
+        ranker.rank_batch([make_item(0)])
+
+        prompt = client.complete.call_args.args[0]
+        kwargs = client.complete.call_args.kwargs
+        assert kwargs["system"] == RANKING_SYSTEM
+        # Too short to reach the minimum cacheable prefix
+        assert not kwargs.get("cache_system")
+        assert "**Title 0**" in prompt
+        assert "signal_score" not in prompt
+
+
+class TestRankCache:
+    """Test the persistent batch ranking cache."""
+
+    def test_repeat_batch_hits_cache(self, make_item, tmp_path):
+        """Ranking the same batch again should not call the client."""
+        client = _client()
+        items = [make_item(i) for i in range(3)]
+
+        first = SignalRanker(client=client, requests_per_minute=0, cache_path=tmp_path / "rank.db")
+        first.rank_batch(items)
+
+        second = SignalRanker(client=client, requests_per_minute=0, cache_path=tmp_path / "rank.db")
+        ranked = second.rank_batch(items)
+
+        assert client.complete.call_count == 1
+        assert second.cache_hits == 1
+        assert [r.signal_score for r in ranked] == [8, 8, 8]
+        assert ranked[0].impact == "tooling"
+
+    def test_reordered_batch_misses_cache(self, make_item, tmp_path):
+        """Rankings are positional, so a different order is a new key."""
+        client = _client()
+        items = [make_item(i) for i in range(3)]
+        ranker = SignalRanker(client=client, requests_per_minute=0, cache_path=tmp_path / "rank.db")
+
+        ranker.rank_batch(items)
+        ranker.rank_batch(list(reversed(items)))
+
+        assert client.complete.call_count == 2
+        assert ranker.cache_misses == 2
+
+    def test_fallback_is_not_cached(self, make_item, tmp_path):
+        """Failed calls should be retried on the next run."""
+        client = _client()
+        client.complete.side_effect = RuntimeError("boom")
+        ranker = SignalRanker(client=client, requests_per_minute=0, cache_path=tmp_path / "rank.db")
+
+        ranker.rank_batch([make_item(0)])
+        ranker.rank_batch([make_item(0)])
+
+        assert client.complete.call_count == 2
+        assert ranker.cache_hits == 0
+
+
+class TestRankAll:
+    """Test concurrent batch ranking."""
+
+    def test_results_keep_input_order(self, make_item):
+        """Batches finishing out of order still yield items in input order."""
+        import time
+
+        client = _client()
+        base = client.complete.side_effect
+
+        def complete(prompt, **kwargs):
+            # First batch finishes last
+            if "**Title 0**" in prompt:
+                time.sleep(0.05)
+            return base(prompt, **kwargs)
+
+        client.complete.side_effect = complete
+        items = [make_item(i) for i in range(6)]
+        ranker = SignalRanker(
+            client=client, batch_size=2, requests_per_minute=0, cache_path=None, parallelism=3,
+        )
+
+        ranked = ranker.rank_all(items)
+
+        assert [r.item.id for r in ranked] == [f"item-{i}" for i in range(6)]
+        assert client.complete.call_count == 3
+
+    def test_batches_overlap(self, make_item):
+        """N batches on K workers take about ceil(N/K) latencies, not N."""
+        import time
+
+        latency = 0.1
+        client = _client()
+        base = client.complete.side_effect
+
+        def complete(prompt, **kwargs):
+            time.sleep(latency)
+            return base(prompt, **kwargs)
+
+        client.complete.side_effect = complete
+        items = [make_item(i) for i in range(8)]
+        ranker = SignalRanker(
+            client=client, batch_size=1, requests_per_minute=0, cache_path=None, parallelism=4,
+        )
+
+        start = time.monotonic()
+        ranked = ranker.rank_all(items)
+        elapsed = time.monotonic() - start
+
+        assert len(ranked) == 8
+        assert elapsed <= (8 / 4 + 1) * latency
+        assert elapsed < 8 * latency
+
+    def test_empty_input(self):
+        """No items means no calls."""
+        client = _client()
+        ranker = SignalRanker(client=client, requests_per_minute=0, cache_path=None)
+
+        assert ranker.rank_all([]) == []
+        client.complete.assert_not_called()
+
+
+class TestRankItems:
+    """Test the convenience wrapper."""
+
+    def test_reuses_default_ranker(self, make_item):
+        """Repeated calls should not rebuild the ranker."""
+        from unittest.mock import patch
+
+        from src.processors import signal_ranker
+
+        with patch.object(signal_ranker, "_default_ranker", None), \
+                patch.object(signal_ranker, "SignalRanker") as ranker_cls:
+            ranker_cls.return_value.rank_all.return_value = []
+            ranker_cls.return_value.apply_scores.return_value = []
+
+            signal_ranker.rank_items([make_item(0)])
+            signal_ranker.rank_items([make_item(1)])
+
+        assert ranker_cls.call_count == 1
+
+
+def test_render_ranking_prompt_matches_format():
+    """Pre-split rendering must equal str.format on the template."""
+    from src.processors.signal_ranker import BATCH_RANKING_PROMPT, _render_ranking_prompt
+
+    fields = {"count": 2, "items": "[0] {braces} stay literal"}
+    assert _render_ranking_prompt(**fields) == BATCH_RANKING_PROMPT.format(**fields)
+
+
+class TestArrowOutput:
+    """Test the optional columnar output."""
+
+    def test_rank_all_returns_filtered_table(self, make_item):
+        pa = pytest.importorskip("pyarrow")
+
+        client = _client(score=8)
+        ranker = SignalRanker(client=client, requests_per_minute=0, cache_path=None, signal_threshold=9)
+        assert ranker.rank_all([make_item(0)], return_arrow=True).num_rows == 0
+
+        ranker.signal_threshold = 4
+        table = ranker.rank_all([make_item(0), make_item(1)], return_arrow=True)
+
+        assert table.column("id").to_pylist() == ["item-0", "item-1"]
+        assert table.schema.field("signal_score").type == pa.int8()
+        assert pa.types.is_dictionary(table.schema.field("impact").type)
+
+    def test_to_table_requires_pyarrow(self):
+        from unittest.mock import patch
+
+        with patch.dict("sys.modules", {"pyarrow": None}):
+            with pytest.raises(ImportError):
+                SignalRanker.to_table([])
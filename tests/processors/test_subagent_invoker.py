@@ -15,6 +15,18 @@ from src.processors.subagent_invoker import (
 )
 
 
+@pytest.fixture(scope="module")
+def generic_invoker():
+    """Invoker shared by the stateless input/output tests."""
+    return SubagentInvoker("test-agent")
+
+
+@pytest.fixture(scope="class")
+def ranker_invoker():
+    """Ranker invoker shared within a test class."""
+    return SubagentInvoker("agent-ranker")
+
+
 class TestSubagentError:
     """Test SubagentError exception class."""
 
@@ -57,36 +69,46 @@ class TestSubagentInvokerInit:
 class TestSubagentInvokerPrepareInput:
     """Test _prepare_input method."""
 
-    def test_prepare_input_for_list(self):
+    def test_prepare_input_for_list(self, generic_invoker):
         """Should serialize list to JSON string."""
-        invoker = SubagentInvoker("test-agent")
         data = [{"title": "Item 1"}, {"title": "Item 2"}]
-        result = invoker._prepare_input(data)
+        result = generic_invoker._prepare_input(data)
         assert json.loads(result) == data
 
-    def test_prepare_input_for_list_adds_index(self):
+    def test_prepare_input_for_list_adds_index(self, ranker_invoker):
         """Should add index field to list items for ranker."""
-        invoker = SubagentInvoker("agent-ranker")
         data = [{"title": "Item 1"}, {"title": "Item 2"}]
-        result = invoker._prepare_input(data)
+        result = ranker_invoker._prepare_input(data)
         parsed = json.loads(result)
         assert parsed[0].get("index") == 0
         assert parsed[1].get("index") == 1
 
-    def test_prepare_input_for_dict(self):
+    def test_prepare_input_for_dict(self, generic_invoker):
         """Should serialize dict to JSON string."""
-        invoker = SubagentInvoker("test-agent")
         data = {"key": "value", "number": 42}
-        result = invoker._prepare_input(data)
+        result = generic_invoker._prepare_input(data)
         assert json.loads(result) == data
 
-    def test_prepare_input_preserves_original_list(self):
+    def test_prepare_input_keeps_non_ascii(self, generic_invoker):
+        """Should emit UTF-8 text rather than \\u escapes."""
+        result = generic_invoker._prepare_input({"title": "Añadido ✓"})
+        assert "Añadido ✓" in result
+        assert json.loads(result) == {"title": "Añadido ✓"}
+
+    def test_prepare_input_is_compact_by_default(self, generic_invoker):
+        """Should emit compact JSON unless pretty output is requested."""
+        data = {"key": "value", "items": [1, 2]}
+        assert generic_invoker._prepare_input(data) == '{"key":"value","items":[1,2]}'
+        pretty = generic_invoker._prepare_input(data, pretty=True)
+        assert "\n  " in pretty
+        assert json.loads(pretty) == data
+
+    def test_prepare_input_preserves_original_list(self, ranker_invoker):
         """Should not modify original list when adding index."""
-        invoker = SubagentInvoker("agent-ranker")
         data = [{"title": "Item 1"}]
         original_len = len(data)
         original_has_index = "index" in data[0]
-        _ = invoker._prepare_input(data)
+        _ = ranker_invoker._prepare_input(data)
         # Original should be unchanged
         assert len(data) == original_len
         assert ("index" in data[0]) == original_has_index
@@ -95,133 +117,101 @@ class TestSubagentInvokerPrepareInput:
 class TestSubagentInvokerParseOutput:
     """Test _parse_output method."""
 
-    def test_parse_output_plain_json(self):
-        """Should parse plain JSON string."""
-        invoker = SubagentInvoker("test-agent")
-        output = '{"key": "value", "number": 42}'
-        result = invoker._parse_output(output)
-        assert result == {"key": "value", "number": 42}
+    @pytest.mark.parametrize("output,expected", [
+        pytest.param('{"key": "value", "number": 42}', {"key": "value", "number": 42}, id="plain_json"),
+        pytest.param('[{"id": 1}, {"id": 2}]', [{"id": 1}, {"id": 2}], id="json_array"),
+        pytest.param('```json\n{"key": "value"}\n```', {"key": "value"}, id="markdown_code_block_json"),
+        pytest.param('```\n{"key": "value"}\n```', {"key": "value"}, id="markdown_code_block_no_language"),
+        pytest.param('Here is the result: {"key": "value"} and that is it.', {"key": "value"}, id="embedded_json"),
+        pytest.param('Results:\n[{"score": 5}, {"score": 7}]\nEnd.', [{"score": 5}, {"score": 7}],
+                     id="embedded_json_array"),
+        # Moves past bracketed prose to the first decodable value
+        pytest.param('Note [see below]: {"text": "has } and { inside", "n": 1} done',
+                     {"text": "has } and { inside", "n": 1}, id="skips_non_json_brackets"),
+        # Decodes a leading JSON value followed by commentary
+        pytest.param('[{"score": 5}]\n\nLet me know if you need more detail.', [{"score": 5}],
+                     id="leading_json_with_trailing_text"),
+    ])
+    def test_parse_output(self, generic_invoker, output, expected):
+        """Should extract and parse the JSON value from agent output."""
+        assert generic_invoker._parse_output(output) == expected
+
+    def test_parse_output_repeated_output_returns_fresh_objects(self, generic_invoker):
+        """Repeated outputs hit the cache but never share parsed objects."""
+        output = 'Here you go: {"items": [1, 2]}'
+        first = generic_invoker._parse_output(output)
+        first["items"].append(3)
+        assert generic_invoker._parse_output(output) == {"items": [1, 2]}
+
+    def test_parse_output_error_names_agent(self):
+        """Errors from the shared parser carry the invoking agent's name."""
+        invoker = SubagentInvoker("agent-analyzer")
+        with pytest.raises(SubagentError) as exc_info:
+            invoker._parse_output("still not JSON")
+        assert exc_info.value.agent_name == "agent-analyzer"
 
-    def test_parse_output_json_array(self):
-        """Should parse JSON array."""
-        invoker = SubagentInvoker("test-agent")
-        output = '[{"id": 1}, {"id": 2}]'
-        result = invoker._parse_output(output)
-        assert result == [{"id": 1}, {"id": 2}]
+    @pytest.mark.parametrize("output", ["This is not JSON at all", "Unclosed {\"key\": "])
+    def test_parse_output_invalid_raises_error(self, generic_invoker, output):
+        """Should raise SubagentError on invalid output."""
+        with pytest.raises(SubagentError):
+            generic_invoker._parse_output(output)
 
-    def test_parse_output_markdown_code_block_json(self):
-        """Should extract JSON from markdown code blocks."""
-        invoker = SubagentInvoker("test-agent")
-        output = '''```json
-{"key": "value"}
-```'''
-        result = invoker._parse_output(output)
-        assert result == {"key": "value"}
-
-    def test_parse_output_markdown_code_block_no_language(self):
-        """Should extract JSON from markdown code blocks without language."""
-        invoker = SubagentInvoker("test-agent")
-        output = '''```
-{"key": "value"}
-```'''
-        result = invoker._parse_output(output)
-        assert result == {"key": "value"}
-
-    def test_parse_output_embedded_json(self):
-        """Should extract JSON embedded in text."""
-        invoker = SubagentInvoker("test-agent")
-        output = 'Here is the result: {"key": "value"} and that is it.'
-        result = invoker._parse_output(output)
-        assert result == {"key": "value"}
 
-    def test_parse_output_embedded_json_array(self):
-        """Should extract JSON array embedded in text."""
-        invoker = SubagentInvoker("test-agent")
-        output = 'Results:\n[{"score": 5}, {"score": 7}]\nEnd.'
-        result = invoker._parse_output(output)
-        assert result == [{"score": 5}, {"score": 7}]
+# agent, input data, keys every mock result must have, and fixed mock values
+MOCK_CASES = [
+    ("agent-ranker", [{"title": "Test item"}], {"signal_score", "impact", "maturity"},
+     {"signal_score": 5, "impact": "ecosystem", "maturity": "growing"}),
+    ("agent-analyzer", {"title": "Test item", "content": "Test content"},
+     {"summary", "key_insights", "actionability", "confidence"},
+     {"actionability": "medium", "confidence": 0.7}),
+    ("agent-synthesizer", {"mode": "daily", "items": []},
+     {"relevance_score", "highlights", "patterns", "recommendations"},
+     {"relevance_score": 5}),
+    ("agent-competitive", {"week": "2026-W07", "items": []},
+     {"week", "tools", "feature_gaps", "adoption_trends", "strategic_insights"},
+     {}),
+]
 
-    def test_parse_output_invalid_raises_error(self):
-        """Should raise SubagentError on invalid output."""
-        invoker = SubagentInvoker("test-agent")
-        output = "This is not JSON at all"
-        with pytest.raises(SubagentError):
-            invoker._parse_output(output)
+
+def _first(result):
+    """The single mock record (rankers return a list of one)."""
+    return result[0] if isinstance(result, list) else result
 
 
 class TestSubagentInvokerMockInvoke:
     """Test _mock_invoke method for testing without real agent."""
 
-    def test_mock_invoke_ranker(self):
-        """Should return mock ranking response."""
-        invoker = SubagentInvoker("agent-ranker")
-        data = [{"title": "Test item"}]
-        result = invoker._mock_invoke(data)
+    @pytest.mark.parametrize("agent,data,required_keys,values", MOCK_CASES,
+                             ids=[case[0] for case in MOCK_CASES])
+    def test_mock_invoke(self, agent, data, required_keys, values):
+        """Should return the agent's mock response shape."""
+        result = SubagentInvoker(agent)._mock_invoke(data)
 
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert result[0]["signal_score"] == 5
-        assert result[0]["impact"] == "ecosystem"
-        assert result[0]["maturity"] == "growing"
-
-    def test_mock_invoke_analyzer(self):
-        """Should return mock analysis response."""
-        invoker = SubagentInvoker("agent-analyzer")
-        data = {"title": "Test item", "content": "Test content"}
-        result = invoker._mock_invoke(data)
-
-        assert isinstance(result, dict)
-        assert "summary" in result
-        assert "key_insights" in result
-        assert result["actionability"] == "medium"
-        assert result["confidence"] == 0.7
-
-    def test_mock_invoke_synthesizer(self):
-        """Should return mock synthesis response."""
-        invoker = SubagentInvoker("agent-synthesizer")
-        data = {"mode": "daily", "items": []}
-        result = invoker._mock_invoke(data)
-
-        assert isinstance(result, dict)
-        assert "relevance_score" in result
-        assert "highlights" in result
-        assert "patterns" in result
-        assert "recommendations" in result
-        assert result["relevance_score"] == 5
-
-    def test_mock_invoke_competitive(self):
-        """Should return mock competitive analysis response."""
-        invoker = SubagentInvoker("agent-competitive")
-        data = {"week": "2026-W07", "items": []}
-        result = invoker._mock_invoke(data)
-
-        assert isinstance(result, dict)
-        assert "week" in result
-        assert "tools" in result
-        assert "feature_gaps" in result
-        assert "adoption_trends" in result
-        assert "strategic_insights" in result
+        assert isinstance(result, list if isinstance(data, list) else dict)
+        if isinstance(data, list):
+            assert len(result) == len(data)
+        record = _first(result)
+        assert required_keys <= record.keys()
+        assert values.items() <= record.items()
 
 
 class TestSubagentInvokerInvoke:
     """Test invoke method."""
 
-    def test_invoke_uses_mock_by_default(self):
+    def test_invoke_uses_mock_by_default(self, ranker_invoker):
         """Should use mock invoke in test mode."""
-        invoker = SubagentInvoker("agent-ranker")
         data = [{"title": "Test"}]
-        result = invoker.invoke(data)
+        result = ranker_invoker.invoke(data)
 
         # Should return mock response
         assert isinstance(result, list)
         assert result[0]["signal_score"] == 5
 
-    def test_invoke_with_timeout(self):
+    def test_invoke_with_timeout(self, ranker_invoker):
         """Should accept timeout parameter."""
-        invoker = SubagentInvoker("agent-ranker")
         data = [{"title": "Test"}]
         # Should not raise
-        result = invoker.invoke(data, timeout=60)
+        result = ranker_invoker.invoke(data, timeout=60)
         assert result is not None
 
     def test_invoke_propagates_mock_response(self):
@@ -237,63 +227,31 @@ class TestSubagentInvokerInvoke:
 class TestConvenienceFunctions:
     """Test convenience functions."""
 
-    def test_invoke_ranker_exists(self):
-        """invoke_ranker should be callable."""
-        assert callable(invoke_ranker)
-
-    def test_invoke_ranker_returns_list(self):
-        """invoke_ranker should return list of ranked items."""
-        items = [{"title": "Item 1"}]
-        result = invoke_ranker(items)
-
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert "signal_score" in result[0]
-        assert "impact" in result[0]
-        assert "maturity" in result[0]
-
-    def test_invoke_analyzer_exists(self):
-        """invoke_analyzer should be callable."""
-        assert callable(invoke_analyzer)
-
-    def test_invoke_analyzer_returns_dict(self):
-        """invoke_analyzer should return analysis dict."""
-        item = {"title": "Test", "content": "Content"}
-        result = invoke_analyzer(item)
-
-        assert isinstance(result, dict)
-        assert "summary" in result
-        assert "key_insights" in result
-        assert "actionability" in result
-        assert "confidence" in result
-
-    def test_invoke_synthesizer_exists(self):
-        """invoke_synthesizer should be callable."""
-        assert callable(invoke_synthesizer)
-
-    def test_invoke_synthesizer_returns_dict(self):
-        """invoke_synthesizer should return synthesis dict."""
-        data = {"mode": "daily", "items": []}
-        result = invoke_synthesizer(data)
-
-        assert isinstance(result, dict)
-        assert "relevance_score" in result
-        assert "highlights" in result
-        assert "patterns" in result
-        assert "recommendations" in result
-
-    def test_invoke_competitive_exists(self):
-        """invoke_competitive should be callable."""
-        assert callable(invoke_competitive)
-
-    def test_invoke_competitive_returns_dict(self):
-        """invoke_competitive should return competitive analysis dict."""
-        data = {"week": "2026-W07", "items": []}
-        result = invoke_competitive(data)
-
-        assert isinstance(result, dict)
-        assert "week" in result
-        assert "tools" in result
-        assert "feature_gaps" in result
-        assert "adoption_trends" in result
-        assert "strategic_insights" in result
+    @pytest.mark.parametrize("fn", [invoke_ranker, invoke_analyzer, invoke_synthesizer, invoke_competitive],
+                             ids=lambda fn: fn.__name__)
+    def test_convenience_callable(self, fn):
+        """invoke_* helpers should be callable."""
+        assert callable(fn)
+
+    @pytest.mark.parametrize("fn,data,required_keys", [
+        (fn, data, required_keys)
+        for fn, (_, data, required_keys, _) in zip(
+            (invoke_ranker, invoke_analyzer, invoke_synthesizer, invoke_competitive), MOCK_CASES
+        )
+    ], ids=["ranker", "analyzer", "synthesizer", "competitive"])
+    def test_invoke_returns_mock_shape(self, fn, data, required_keys):
+        """invoke_* should return the agent's parsed mock response."""
+        result = fn(data)
+
+        assert isinstance(result, list if isinstance(data, list) else dict)
+        assert required_keys <= _first(result).keys()
+
+    def test_convenience_functions_reuse_invoker(self):
+        """Repeated calls for the same agent should share one invoker."""
+        from src.processors.subagent_invoker import _get_invoker
+
+        invoke_ranker([{"title": "A"}])
+        invoke_ranker([{"title": "B"}])
+
+        assert _get_invoker("agent-ranker") is _get_invoker("agent-ranker")
+        assert _get_invoker("agent-ranker") is not _get_invoker("agent-analyzer")
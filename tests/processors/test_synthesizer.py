@@ -0,0 +1,143 @@
+"""Tests for the synthesizer."""
+from unittest.mock import MagicMock
+
+from src.processors.analyzer import AnalysisResult
+from src.processors.synthesizer import Synthesizer
+
+
+def _analysis(i: int, summary: str | None = None) -> AnalysisResult:
+    return AnalysisResult(
+        item_id=f"item-{i}",
+        summary=summary or f"Summary {i}",
+        key_insights=[],
+        technical_details=None,
+        relevance_to_claude="",
+        actionability="low",
+        related_topics=[],
+        confidence=0.5,
+    )
+
+
+class TestFormatItems:
+    """Test prompt formatting of analyzed items."""
+
+    def test_formats_with_and_without_analysis(self, make_item):
+        synthesizer = Synthesizer(client=MagicMock(), store_results=False)
+        items = [(make_item(0), _analysis(0, "x" * 300)), (make_item(1), None)]
+
+        text = synthesizer._format_items_for_prompt(items)
+
+        assert text == (
+            f"- [blogs] Title 0\n  Summary: {'x' * 200}"
+            "\n\n"
+            "- [blogs] Title 1"
+        )
+
+    def test_respects_max_items(self, make_item):
+        synthesizer = Synthesizer(client=MagicMock(), store_results=False)
+        items = [(make_item(i), None) for i in range(5)]
+
+        assert synthesizer._format_items_for_prompt(items, max_items=2).count("- [") == 2
+
+
+def test_pre_split_prompts_match_format():
+    """Segment rendering must equal str.format for every synthesis prompt."""
+    from src.processors import synthesizer as mod
+
+    fields = {"date": "2026-10-15", "week": "2026-W41", "month": "2026-10",
+              "items_content": "- [blogs] {not a field}", "item_count": 3}
+    for template, segments in [
+        (mod.DAILY_SYNTHESIS_PROMPT, mod._DAILY_SEGMENTS),
+        (mod.WEEKLY_SYNTHESIS_PROMPT, mod._WEEKLY_SEGMENTS),
+        (mod.MONTHLY_SYNTHESIS_PROMPT, mod._MONTHLY_SEGMENTS),
+    ]:
+        assert mod._render(segments, **fields) == template.format(**fields)
+
+
+class TestFallbacks:
+    """Test fallback syntheses when the client fails."""
+
+    def _failing(self) -> Synthesizer:
+        client = MagicMock()
+        client.complete.side_effect = RuntimeError("down")
+        return Synthesizer(client=client, store_results=False)
+
+    def test_daily_fallback_counts_all_items(self, make_item):
+        items = [(make_item(i), None) for i in range(60)]
+
+        result = self._failing().synthesize_daily(items, date="2026-10-15")
+
+        assert result.highlights == ["Title 0", "Title 1", "Title 2"]
+        assert "Processed 60 items" in result.summary
+
+    def test_monthly_prompt_is_bounded(self, make_item):
+        client = MagicMock()
+        client.complete.return_value = MagicMock(json_data={"summary": "ok"})
+        synthesizer = Synthesizer(client=client, store_results=False)
+        items = [(make_item(i), None) for i in range(150)]
+
+        result = synthesizer.synthesize_monthly(items, month="2026-10")
+
+        prompt = client.complete.call_args.kwargs["prompt"]
+        assert prompt.count("- [blogs]") == 100
+        assert "**Items this month:** 150" in prompt
+        assert result.summary == "ok"
+
+
+class TestParseSynthesis:
+    """Test tolerant parsing of synthesis JSON."""
+
+    def test_malformed_fields_do_not_discard_synthesis(self):
+        synthesizer = Synthesizer(client=MagicMock(), store_results=False)
+        data = {"relevance_score": "8/10", "highlights": "one string", "patterns": ["p"], "summary": "s"}
+
+        result = synthesizer._parse_daily_synthesis("2026-10-15", data)
+
+        assert result.relevance_score == 5
+        assert result.highlights == []
+        assert result.patterns == ["p"]
+        assert result.summary == "s"
+
+    def test_score_is_clamped(self):
+        synthesizer = Synthesizer(client=MagicMock(), store_results=False)
+
+        assert synthesizer._parse_weekly_synthesis("w", {"relevance_score": 42}).relevance_score == 10
+        assert synthesizer._parse_monthly_synthesis("m", {"relevance_score": "0"}).relevance_score == 1
+
+
+class TestStoreSynthesis:
+    """Test background storage of syntheses."""
+
+    def test_store_runs_in_background_and_flushes(self, make_item):
+        import threading
+
+        release = threading.Event()
+        store = MagicMock()
+        store.add.side_effect = lambda **kwargs: release.wait(5)
+        client = MagicMock()
+        client.complete.return_value = MagicMock(json_data={"summary": "ok"})
+        synthesizer = Synthesizer(client=client, store_results=True)
+        synthesizer._vector_store = store
+
+        result = synthesizer.synthesize_daily([(make_item(0), None)], date="2026-10-15")
+
+        # Returned while the write is still blocked
+        assert result.summary == "ok"
+        assert synthesizer._pending_stores and not synthesizer._pending_stores[0].done()
+
+        release.set()
+        synthesizer.flush(timeout=5)
+
+        assert synthesizer._pending_stores == []
+        assert store.add.call_args.kwargs["ids"] == ["synthesis_daily_2026-10-15"]
+
+    def test_store_failure_is_logged_not_raised(self):
+        store = MagicMock()
+        store.add.side_effect = RuntimeError("chroma down")
+        synthesizer = Synthesizer(client=MagicMock(), store_results=True)
+        synthesizer._vector_store = store
+
+        synthesizer._store_synthesis("daily", "2026-10-15", "text")
+        synthesizer.flush(timeout=5)
+
+        store.add.assert_called_once()
@@ -0,0 +1,209 @@
+"""Tests for the markdown generator."""
+from src.collectors.base import SourceType
+from src.processors.analyzer import AnalysisResult
+from src.processors.synthesizer import DailySynthesis, MonthlySynthesis, WeeklySynthesis
+from src.storage.markdown_gen import MarkdownGenerator
+
+
+def _analysis(i: int) -> AnalysisResult:
+    return AnalysisResult(
+        item_id=f"item-{i}",
+        summary=f"Summary {i}",
+        key_insights=["a", "b", "c", "d"],
+        technical_details=None,
+        relevance_to_claude="",
+        actionability="low",
+        related_topics=[],
+        confidence=0.5,
+    )
+
+
+def test_daily_digest(make_item, tmp_path):
+    synthesis = DailySynthesis(
+        date="2026-10-15",
+        relevance_score=8,
+        highlights=["h1", "h2"],
+        patterns=[],
+        recommendations=["r1"],
+        key_changes=[],
+        summary="Summary text",
+    )
+    items = [
+        (make_item(1, SourceType.GITHUB_REPOS, signal_score=7, novelty_score=0.5), None),
+        (make_item(2, signal_score=7, novelty_score=0.5), _analysis(2)),
+    ]
+
+    path = MarkdownGenerator(tmp_path).generate_daily(synthesis, items)
+
+    assert path == tmp_path / "daily" / "2026-10-15.md"
+    assert path.read_text(encoding="utf-8").rstrip("\n") == "\n".join([
+        "# AI Architect Daily Digest",
+        "",
+        "**Date:** 2026-10-15",
+        "**Relevance Score:** 8/10",
+        "",
+        "---",
+        "",
+        "## Summary",
+        "",
+        "Summary text",
+        "",
+        "## Highlights",
+        "",
+        "- h1",
+        "- h2",
+        "",
+        "## Patterns Detected",
+        "",
+        "",
+        "## Recommendations",
+        "",
+        "- r1",
+        "",
+        "---",
+        "",
+        "## Items Analyzed",
+        "",
+        "### Blogs",
+        "",
+        "#### [Title 2](https://example.com/2)",
+        "",
+        "Summary 2",
+        "",
+        "**Key Insights:**",
+        "- a",
+        "- b",
+        "- c",
+        "",
+        "*Signal: 7/10 | Novelty: 0.50*",
+        "",
+        "---",
+        "",
+        "### Github Repos",
+        "",
+        "#### [Title 1](https://example.com/1)",
+        "",
+        "*Signal: 7/10 | Novelty: 0.50*",
+        "",
+        "---",
+    ])
+
+
+def test_weekly_report(tmp_path):
+    synthesis = WeeklySynthesis(
+        week="2026-W41",
+        relevance_score=6,
+        top_stories=[{"title": "Story", "significance": "Big"}, {}],
+        trends=["t1"],
+        competitive_moves=[],
+        emerging_technologies=[],
+        recommendations=["r1", "r2"],
+        summary="Week summary",
+    )
+
+    path = MarkdownGenerator(tmp_path).generate_weekly(synthesis)
+
+    assert path.read_text(encoding="utf-8").rstrip("\n") == "\n".join([
+        "# AI Architect Weekly Report",
+        "",
+        "**Week:** 2026-W41",
+        "**Relevance Score:** 6/10",
+        "",
+        "---",
+        "",
+        "## Summary",
+        "",
+        "Week summary",
+        "",
+        "## Top Stories",
+        "",
+        "### Story",
+        "",
+        "Big",
+        "",
+        "### Untitled",
+        "",
+        "## Trends",
+        "",
+        "- t1",
+        "",
+        "## Recommendations",
+        "",
+        "- r1",
+        "- r2",
+    ])
+
+
+def test_monthly_report(tmp_path):
+    synthesis = MonthlySynthesis(
+        month="2026-10",
+        relevance_score=5,
+        major_developments=[{"title": "Dev", "impact": "High"}],
+        trend_analysis="Trending",
+        ecosystem_changes=[],
+        competitive_landscape="Crowded",
+        predictions=["p1"],
+        recommendations=[],
+        summary="Month summary",
+    )
+
+    path = MarkdownGenerator(tmp_path).generate_monthly(synthesis)
+
+    assert path.read_text(encoding="utf-8").rstrip("\n") == "\n".join([
+        "# AI Architect Monthly Report",
+        "",
+        "**Month:** 2026-10",
+        "**Relevance Score:** 5/10",
+        "",
+        "---",
+        "",
+        "## Executive Summary",
+        "",
+        "Month summary",
+        "",
+        "## Major Developments",
+        "",
+        "### Dev",
+        "**Impact:** High",
+        "",
+        "## Trend Analysis",
+        "",
+        "Trending",
+        "",
+        "## Competitive Landscape",
+        "",
+        "Crowded",
+        "",
+        "## Predictions",
+        "",
+        "- p1",
+        "",
+        "## Recommendations",
+    ])
+
+
+def test_update_index_lists_most_recent_first(tmp_path):
+    gen = MarkdownGenerator(tmp_path)
+    for day in range(1, 13):
+        (tmp_path / "daily" / f"2026-10-{day:02d}.md").write_text("x")
+    (tmp_path / "daily" / "notes.txt").write_text("x")
+    (tmp_path / "monthly" / "2026-09.md").write_text("x")
+
+    text = gen.update_index().read_text(encoding="utf-8")
+
+    daily = [line for line in text.splitlines() if line.startswith("- [2026-10-")]
+    assert daily[0] == "- [2026-10-12](daily/2026-10-12.md)"
+    assert len(daily) == 10
+    assert "notes" not in text
+    assert "- [2026-09](monthly/2026-09.md)" in text
+
+
+def test_new_generator_recreates_removed_output_dirs(tmp_path):
+    import shutil
+
+    MarkdownGenerator(tmp_path / "out")
+    shutil.rmtree(tmp_path / "out")
+
+    MarkdownGenerator(tmp_path / "out")
+
+    assert (tmp_path / "out" / "daily").is_dir()
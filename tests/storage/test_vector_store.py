@@ -0,0 +1,71 @@
+"""Tests for the ChromaDB vector store wrapper."""
+from src.storage.vector_store import VectorStore
+
+
+class TestCollections:
+    """Test collection handle resolution."""
+
+    def test_configured_collections_resolved_with_client(self, tmp_path):
+        store = VectorStore(persist_directory=tmp_path, collections=["items", "analysis"])
+
+        items = store.get_collection("items")
+
+        assert set(store._collections) == {"items", "analysis"}
+        assert store.get_collection("items") is items
+
+    def test_unconfigured_collection_created_on_demand(self, tmp_path):
+        store = VectorStore(persist_directory=tmp_path, collections=["items"])
+
+        assert store.get_collection("extra").name == "extra"
+        assert set(store._collections) == {"items", "extra"}
+
+
+class TestGetEmbeddings:
+    """Test batched, cached embedding lookups."""
+
+    def _store(self, tmp_path, calls):
+        from unittest.mock import MagicMock
+
+        def embed(texts):
+            calls.append(list(texts))
+            return [[float(len(t))] for t in texts]
+
+        store = VectorStore(persist_directory=tmp_path, collections=["items"])
+        store._collections["items"] = MagicMock(_embedding_function=embed)
+        return store
+
+    def test_duplicates_embedded_once_in_batches(self, tmp_path):
+        calls = []
+        store = self._store(tmp_path, calls)
+
+        result = store.get_embeddings(["a", "bb", "a", "ccc"], batch_size=2)
+
+        assert result == [[1.0], [2.0], [1.0], [3.0]]
+        assert calls == [["a", "bb"], ["ccc"]]
+
+    def test_cached_texts_skip_embedding(self, tmp_path):
+        calls = []
+        store = self._store(tmp_path, calls)
+        store.get_embeddings(["a", "bb"])
+
+        assert store.get_embeddings(["bb", "a"]) == [[2.0], [1.0]]
+        assert len(calls) == 1
+
+    def test_cache_evicts_least_recently_used(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.storage.vector_store.EMBEDDING_CACHE_SIZE", 2)
+        calls = []
+        store = self._store(tmp_path, calls)
+        store.get_embeddings(["a", "bb"])
+        store.get_embeddings(["a"])  # "a" is now the most recent
+        store.get_embeddings(["ccc"])  # evicts "bb"
+
+        store.get_embeddings(["a", "bb"])
+
+        assert calls[-1] == ["bb"]
+
+
+def test_get_stats_counts_configured_collections(tmp_path):
+    store = VectorStore(persist_directory=tmp_path, collections=["items", "analysis"])
+    store.get_collection("extra")
+
+    assert store.get_stats() == {"items": 0, "analysis": 0}
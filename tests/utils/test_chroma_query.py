@@ -4,6 +4,7 @@ import pytest
 from src.utils.chroma_query import (
     ChromaQueryError,
     QueryResult,
+    clear_query_cache,
     query_chromadb,
 )
 
@@ -24,26 +25,52 @@ class TestQueryResult:
         assert result.score == 0.85
 
 
+@pytest.fixture(scope="module")
+def populated_store(tmp_path_factory) -> str:
+    """Chroma directory seeded once with the documents the query tests search."""
+    from datetime import datetime, timedelta
+    from src.storage.vector_store import VectorStore
+
+    persist_directory = str(tmp_path_factory.mktemp("chroma"))
+    now = datetime.now()
+    vs = VectorStore(persist_directory=persist_directory)
+    vs.add(
+        collection="items",
+        documents=[
+            "Claude Code is an AI assistant for coding",
+            "Item document",
+            "Old content",
+            "Recent content",
+        ],
+        ids=["test-1", "item-1", "old-1", "recent-1"],
+        metadatas=[
+            {"title": "Test Doc", "source_type": "docs"},
+            {"title": "Item"},
+            {"title": "Old", "date": (now - timedelta(days=10)).isoformat()},
+            {"title": "Recent", "date": now.isoformat()},
+        ],
+    )
+    vs.add(
+        collection="analysis",
+        documents=["Analysis document"],
+        ids=["analysis-1"],
+        metadatas=[{"title": "Analysis"}],
+    )
+    return persist_directory
+
+
 class TestQueryChromaDB:
     """Test query_chromadb function."""
 
-    def test_query_returns_list_of_results(self, tmp_path):
-        """Should return list of QueryResult objects."""
-        from src.storage.vector_store import VectorStore
-
-        # Setup test store
-        vs = VectorStore(persist_directory=str(tmp_path / "chroma"))
-        vs.add(
-            collection="items",
-            documents=["Claude Code is an AI assistant for coding"],
-            ids=["test-1"],
-            metadatas=[{"title": "Test Doc", "source_type": "docs"}],
-        )
+    def setup_method(self):
+        clear_query_cache()
 
+    def test_query_returns_list_of_results(self, populated_store):
+        """Should return list of QueryResult objects."""
         results = query_chromadb(
             query="coding assistant",
             collections=["items"],
-            persist_directory=str(tmp_path / "chroma"),
+            persist_directory=populated_store,
             n_results=5,
         )
 
@@ -51,70 +78,87 @@ class TestQueryChromaDB:
         assert len(results) >= 1
         assert all(isinstance(r, QueryResult) for r in results)
 
-    def test_query_with_days_filter(self, tmp_path):
+    def test_query_with_days_filter(self, populated_store):
         """Should filter results by days."""
-        from datetime import datetime, timedelta
-        from src.storage.vector_store import VectorStore
-
-        vs = VectorStore(persist_directory=str(tmp_path / "chroma"))
-
-        # Old item
-        old_date = (datetime.now() - timedelta(days=10)).isoformat()
-        vs.add(
-            collection="items",
-            documents=["Old content"],
-            ids=["old-1"],
-            metadatas=[{"title": "Old", "date": old_date}],
-        )
-
-        # Recent item
-        recent_date = datetime.now().isoformat()
-        vs.add(
-            collection="items",
-            documents=["Recent content"],
-            ids=["recent-1"],
-            metadatas=[{"title": "Recent", "date": recent_date}],
-        )
-
         results = query_chromadb(
             query="content",
             collections=["items"],
-            persist_directory=str(tmp_path / "chroma"),
+            persist_directory=populated_store,
             n_results=5,
             days=7,
         )
 
-        # Should only return recent item
-        assert len(results) == 1
-        assert results[0].title == "Recent"
+        # n_results covers the whole collection: undated items pass the
+        # filter, so exactly the old item is dropped
+        assert sorted(r.title for r in results) == ["Item", "Recent", "Test Doc"]
 
-    def test_query_multiple_collections(self, tmp_path):
+    def test_query_multiple_collections(self, populated_store):
         """Should search across multiple collections."""
-        from src.storage.vector_store import VectorStore
-
-        vs = VectorStore(persist_directory=str(tmp_path / "chroma"))
-        vs.add(
-            collection="items",
-            documents=["Item document"],
-            ids=["item-1"],
-            metadatas=[{"title": "Item"}],
-        )
-        vs.add(
-            collection="analysis",
-            documents=["Analysis document"],
-            ids=["analysis-1"],
-            metadatas=[{"title": "Analysis"}],
-        )
-
         results = query_chromadb(
             query="document",
             collections=["items", "analysis"],
-            persist_directory=str(tmp_path / "chroma"),
+            persist_directory=populated_store,
             n_results=5,
         )
 
         assert len(results) >= 2
 
+    def test_query_embeds_once_for_all_collections(self):
+        """Should embed the query once and search each collection by vector."""
+        from unittest.mock import patch
+
+        with patch("src.utils.chroma_query.VectorStore") as store_cls:
+            vs = store_cls.return_value
+            vs.get_embeddings.return_value = [[0.1, 0.2]]
+            vs.search_by_embedding.side_effect = lambda emb, collection, n_results: {
+                "ids": [[f"{collection}-1"]],
+                "documents": [["doc"]],
+                "metadatas": [[{"title": collection}]],
+                "distances": [[0.5 if collection == "items" else 0.2]],
+            }
+
+            results = query_chromadb(query="q", collections=["items", "analysis"])
+
+        vs.get_embeddings.assert_called_once_with(["q"])
+        assert vs.search_by_embedding.call_count == 2
+        assert [r.title for r in results] == ["analysis", "items"]
+
+    def test_repeated_query_is_served_from_cache(self):
+        """Should reuse results for an identical query within the TTL."""
+        from unittest.mock import patch
+
+        with patch("src.utils.chroma_query.VectorStore") as store_cls:
+            vs = store_cls.return_value
+            vs.get_embeddings.return_value = [[0.1]]
+            vs.search_by_embedding.return_value = {
+                "ids": [["a"]], "documents": [["doc"]],
+                "metadatas": [[{"title": "A"}]], "distances": [[0.0]],
+            }
+
+            first = query_chromadb(query="same", collections=["items"])
+            second = query_chromadb(query="same", collections=["items"])
+            other = query_chromadb(query="same", collections=["items"], n_results=3)
+
+        assert first == second
+        assert first is not second
+        assert other == first
+        assert vs.get_embeddings.call_count == 2
+
+    def test_date_filter_compares_iso_strings(self):
+        """Should drop rows dated before the cutoff and keep undated rows."""
+        from src.utils.chroma_query import _parse_results
+
+        raw = {
+            "ids": [["old", "recent", "undated"]],
+            "documents": [["a", "b", "c"]],
+            "metadatas": [[{"date": "2026-10-01"}, {"date": "2026-10-14T10:00:00"}, None]],
+            "distances": [[0.1, 0.2, 0.3]],
+        }
+
+        results = _parse_results(raw, "items", "2026-10-08T12:00:00")
+
+        assert [r.title for r in results] == ["recent", "undated"]
+
 
 class TestFormatResults:
     """Test result formatting."""
@@ -147,6 +191,31 @@ class TestFormatResults:
         assert "Test Title" in output
         assert "0.92" in output
 
+    def test_format_layout(self):
+        """Should number results and group titles by source."""
+        from src.utils.chroma_query import format_results_markdown
+
+        results = [
+            QueryResult("T1", "x" * 250, "items", 0.9, {"date": "2026-10-14T10:00"}),
+            QueryResult("T2", "short", "analysis", 0.8, {}),
+            QueryResult("T3", "c", "items", 0.7, {"date": "2026-10-01"}),
+            QueryResult("T4", "d", "analysis", 0.6, {}),
+        ]
+
+        output = format_results_markdown(results, "q")
+
+        assert output == (
+            '## Resumen\n\nEncontrados 4 resultados para "q" en: items, analysis\n\n'
+            "## Fuentes (4 resultados)\n\n"
+            f"1. **T1** - 2026-10-14 - score: 0.9\n   > {'x' * 200}...\n\n"
+            "2. **T2** - unknown - score: 0.8\n   > short\n\n"
+            "3. **T3** - 2026-10-01 - score: 0.7\n   > c\n\n"
+            "4. **T4** - unknown - score: 0.6\n   > d\n\n"
+            "## Detalles\n\n"
+            "### Items (2 resultados)\n\nTemas principales:\n- T1\n- T3\n\n"
+            "### Analysis (2 resultados)\n\nTemas principales:\n- T2\n- T4\n"
+        )
+
 
 class TestChromaQueryError:
     """Test ChromaQueryError exception."""
@@ -159,3 +228,19 @@ class TestChromaQueryError:
         """Should accept message argument."""
         error = ChromaQueryError("Test error")
         assert str(error) == "Test error"
+
+
+class TestMain:
+    """Test the CLI entry point."""
+
+    def test_collection_choice_maps_to_collections(self, capsys):
+        from unittest.mock import patch
+
+        from src.utils.chroma_query import main
+
+        with patch("src.utils.chroma_query.query_chromadb", return_value=[]) as query:
+            main(["hooks", "--collection", "both", "--days", "3"])
+
+        assert query.call_args.kwargs["collections"] == ["items", "analysis"]
+        assert query.call_args.kwargs["days"] == 3
+        assert "No se encontraron resultados" in capsys.readouterr().out
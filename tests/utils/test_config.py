@@ -0,0 +1,162 @@
+"""Tests for configuration loading."""
+from pathlib import Path
+
+import pytest
+import yaml
+from pydantic import ValidationError
+
+from src.utils import config as config_mod
+from src.utils.config import Config, load_config
+
+PROJECT_CONFIG = Path(__file__).resolve().parents[2] / "config.yaml"
+
+
+class TestLoadConfig:
+    """Test YAML config loading."""
+
+    def test_missing_file_gives_defaults(self, tmp_path):
+        assert load_config(tmp_path / "missing.yaml") == Config()
+
+    def test_loads_yaml_values(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("thresholds:\n  batch_size: 7\nlogging:\n  level: DEBUG\n", encoding="utf-8")
+
+        config = load_config(path)
+
+        assert config.thresholds.batch_size == 7
+        assert config.logging.level == "DEBUG"
+
+    def test_empty_file_gives_defaults(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("", encoding="utf-8")
+
+        assert load_config(path) == Config()
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        path.write_text("mode: weekly\n", encoding="utf-8")
+        calls = []
+        real_load = yaml.load
+        monkeypatch.setattr(yaml, "load", lambda *a, **k: calls.append(1) or real_load(*a, **k))
+
+        first = load_config(path)
+        second = load_config(path)
+
+        assert second is first
+        assert len(calls) == 1
+
+    def test_loaded_config_is_frozen(self, tmp_path):
+        path = tmp_path / "config.yaml"
+        path.write_text("mode: weekly\n", encoding="utf-8")
+        config = load_config(path)
+
+        with pytest.raises(ValidationError):
+            config.mode = "changed"
+        with pytest.raises(ValidationError):
+            config.logging.level = "DEBUG"
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        import os
+
+        path = tmp_path / "config.yaml"
+        path.write_text("mode: weekly\n", encoding="utf-8")
+        load_config(path)
+
+        path.write_text("mode: monthly\n", encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+
+        assert load_config(path).mode == "monthly"
+
+
+class TestJsonCache:
+    """Test the on-disk parsed-config cache."""
+
+    def test_cache_round_trip_matches_validated_config(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.yaml"
+        path.write_bytes(PROJECT_CONFIG.read_bytes())
+        expected = Config(**yaml.safe_load(PROJECT_CONFIG.read_text(encoding="utf-8")))
+
+        load_config(path)
+        assert (tmp_path / ".config.cache.json").exists()
+
+        # A fresh process: nothing in memory, and YAML must not be parsed
+        monkeypatch.setattr(config_mod, "_LOAD_CACHE", type(config_mod._LOAD_CACHE)())
+        monkeypatch.setattr(yaml, "load", lambda *a, **k: (_ for _ in ()).throw(AssertionError))
+
+        cached = load_config(path)
+
+        assert cached == expected
+        assert cached.collectors.blogs.feeds == expected.collectors.blogs.feeds
+
+    def test_stale_cache_is_ignored(self, tmp_path, monkeypatch):
+        import os
+
+        path = tmp_path / "config.yaml"
+        path.write_text("mode: weekly\n", encoding="utf-8")
+        load_config(path)
+        monkeypatch.setattr(config_mod, "_LOAD_CACHE", type(config_mod._LOAD_CACHE)())
+
+        path.write_text("mode: monthly\n", encoding="utf-8")
+        os.utime(path, ns=(1, 1))
+
+        assert load_config(path).mode == "monthly"
+
+
+class TestTrustedConstruct:
+    """Test building configs without validation."""
+
+    def test_matches_validated_config(self):
+        data = yaml.safe_load(PROJECT_CONFIG.read_text(encoding="utf-8"))
+        validated = Config(**data)
+
+        trusted = Config.trusted_construct(validated.model_dump())
+
+        assert trusted == validated
+        assert type(trusted.notifications.ntfy) is type(validated.notifications.ntfy)
+
+    def test_unsafe_reload_skips_validation(self, tmp_path):
+        from src.utils.config import reload_config
+
+        path = tmp_path / "config.yaml"
+        path.write_text("thresholds:\n  batch_size: 500\n", encoding="utf-8")
+
+        try:
+            assert reload_config(path, unsafe=True).thresholds.batch_size == 500
+        finally:
+            reload_config(PROJECT_CONFIG)
+
+
+class TestSettingsCached:
+    """Test Settings built from the cached .env parse."""
+
+    def test_reads_env_file_once_until_modified(self, tmp_path, monkeypatch):
+        import os
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+        monkeypatch.delenv("NTFY_TOPIC", raising=False)
+        env = tmp_path / ".env"
+        env.write_text("GITHUB_TOKEN=abc\nNTFY_TOPIC=alerts\nUNRELATED=1\n", encoding="utf-8")
+        calls = []
+        real = config_mod.dotenv_values
+        monkeypatch.setattr(config_mod, "dotenv_values", lambda *a, **k: calls.append(1) or real(*a, **k))
+
+        first = config_mod.Settings.cached()
+        second = config_mod.Settings.cached()
+
+        assert (first.github_token, first.ntfy_topic) == ("abc", "alerts")
+        assert second == first
+        assert len(calls) == 1
+
+        env.write_text("GITHUB_TOKEN=xyz\n", encoding="utf-8")
+        os.utime(env, ns=(env.stat().st_atime_ns, env.stat().st_mtime_ns + 1_000_000))
+
+        assert config_mod.Settings.cached().github_token == "xyz"
+        assert len(calls) == 2
+
+    def test_environment_overrides_env_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".env").write_text("GITHUB_TOKEN=from-file\n", encoding="utf-8")
+        monkeypatch.setenv("GITHUB_TOKEN", "from-env")
+
+        assert config_mod.Settings.cached().github_token == "from-env"
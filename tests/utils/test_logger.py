@@ -0,0 +1,83 @@
+"""Tests for structured logging setup."""
+import logging
+
+import structlog
+
+from src.utils import logger as logger_mod
+from src.utils.logger import configure_logging
+
+
+class TestConfigureLogging:
+    """Test logging configuration."""
+
+    def setup_method(self):
+        self._handlers = logging.getLogger().handlers[:]
+
+    def teardown_method(self):
+        logging.getLogger().handlers = self._handlers
+        logger_mod._configured = None
+        structlog.reset_defaults()
+        structlog.contextvars.clear_contextvars()
+
+    def test_repeated_calls_keep_handler(self):
+        configure_logging(force=True)
+        handler = logging.getLogger().handlers[0]
+
+        configure_logging()
+
+        assert logging.getLogger().handlers[0] is handler
+
+    def test_force_rebuilds_handler(self):
+        configure_logging(force=True)
+        handler = logging.getLogger().handlers[0]
+
+        configure_logging(force=True)
+
+        assert logging.getLogger().handlers[0] is not handler
+
+    def test_component_defaults_to_unknown(self, capsys):
+        import json
+
+        configure_logging(force=True)
+        logger_mod.get_logger("analyzer").warning("bound_event")
+        logging.getLogger("third.party").warning("foreign event")
+
+        bound, foreign = (json.loads(line) for line in capsys.readouterr().out.splitlines())
+        assert bound["component"] == "analyzer"
+        assert foreign["component"] == "unknown"
+
+
+class TestLoggerFor:
+    """Test module-name loggers."""
+
+    def test_component_from_module_path(self):
+        log = logger_mod.logger_for("src.collectors.github_repos")
+
+        assert log._context["component"] == "collector.github_repos"
+        assert logger_mod.logger_for("src.utils")._context["component"] == "util.utils"
+        assert logger_mod.logger_for("main")._context["component"] == "main"
+
+    def test_cached_per_module(self):
+        assert logger_mod.logger_for("src.storage.vector_store") is logger_mod.logger_for(
+            "src.storage.vector_store"
+        )
+
+
+class TestStandardFields:
+    """Test the combined enrichment processor."""
+
+    def teardown_method(self):
+        structlog.contextvars.clear_contextvars()
+
+    def test_adds_level_logger_timestamp_and_context(self):
+        structlog.contextvars.bind_contextvars(component="unknown", run_id="r1")
+
+        event = logger_mod.add_standard_fields(
+            logging.getLogger("pipeline"), "warn", {"event": "e", "component": "analyzer"}
+        )
+
+        assert event["level"] == "warning"
+        assert event["logger"] == "pipeline"
+        assert event["component"] == "analyzer"
+        assert event["run_id"] == "r1"
+        assert event["timestamp"].endswith("Z")
@@ -0,0 +1,118 @@
+"""Tests for the ntfy.sh notifier."""
+import httpx
+
+from src.utils.notifier import Notifier, Priority
+
+
+def _notifier(requests: list[httpx.Request], status: int = 200) -> Notifier:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status)
+
+    notifier = Notifier(topic="test-topic", enabled=True)
+    notifier.base_url = "https://ntfy.example"
+    notifier._client = httpx.Client(
+        base_url=notifier.base_url,
+        transport=httpx.MockTransport(handler),
+    )
+    return notifier
+
+
+class TestSend:
+    """Test notification delivery."""
+
+    def test_posts_message_with_headers(self):
+        requests = []
+        notifier = _notifier(requests)
+
+        sent = notifier.send("hello", title="Title", priority=Priority.HIGH,
+                             tags=["robot", "fire"], click_url="https://x")
+
+        assert sent is True
+        request = requests[0]
+        assert str(request.url) == "https://ntfy.example/test-topic"
+        assert request.content == b"hello"
+        assert request.headers["Priority"] == "high"
+        assert request.headers["Title"] == "Title"
+        assert request.headers["Tags"] == "robot,fire"
+        assert request.headers["Click"] == "https://x"
+
+    def test_reuses_one_client(self):
+        requests = []
+        notifier = _notifier(requests)
+        client = notifier.client
+
+        notifier.send("one")
+        notifier.send("two")
+
+        assert notifier.client is client
+        assert len(requests) == 2
+
+    def test_http_error_returns_false(self):
+        notifier = _notifier([], status=500)
+
+        assert notifier.send("hello") is False
+
+    def test_disabled_does_not_send(self):
+        requests = []
+        notifier = _notifier(requests)
+        notifier.enabled = False
+
+        assert notifier.send("hello") is False
+        assert requests == []
+
+    def test_close_drops_client(self):
+        with _notifier([]) as notifier:
+            assert notifier._client is not None
+        assert notifier._client is None
+
+
+class TestBackground:
+    """Test fire-and-forget delivery."""
+
+    def test_send_async_resolves_to_result(self):
+        requests = []
+        notifier = _notifier(requests)
+
+        assert notifier.send_async("hello", priority=Priority.LOW).result(timeout=5) is True
+        assert requests[0].headers["Priority"] == "low"
+
+    def test_background_notify_is_queued_then_flushed(self):
+        requests = []
+        notifier = _notifier(requests)
+        notifier.background = True
+
+        queued = notifier.notify_monthly_complete(month="2026-10", relevance_score=7)
+        notifier.flush(timeout=5)
+
+        assert queued is True
+        assert notifier._pending == []
+        assert requests[0].headers["Title"] == "AI Architect Monthly - 2026-10"
+
+
+class TestMessages:
+    """Test notify_* message rendering."""
+
+    def test_daily_complete(self):
+        requests = []
+        notifier = _notifier(requests)
+
+        notifier.notify_daily_complete("2026-10-15", 12, 3, 8, highlight="Big news")
+
+        assert requests[0].content.decode() == (
+            "✅ Daily cycle complete\n"
+            "Items: 12 analyzed, 3 discarded\n"
+            "Relevance: 8/10\n"
+            "Highlight: Big news"
+        )
+        assert requests[0].headers["Tags"] == "white_check_mark,robot"
+
+    def test_weekly_complete(self):
+        requests = []
+        notifier = _notifier(requests)
+
+        notifier.notify_weekly_complete("2026-W42", 6, ["one", "two"])
+
+        assert requests[0].content.decode() == (
+            "📊 Weekly synthesis\nRelevance: 6/10\n\nPatterns:\n- one\n- two"
+        )